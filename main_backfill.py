@@ -0,0 +1,23 @@
+import os
+import sys
+
+# ✅ Get the current directory (weekly_reports folder)
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# ✅ Ensure the scripts folder is in the import path
+sys.path.append(os.path.join(BASE_DIR, "scripts"))
+
+from pipeline.backfill import run_backfill, parse_args
+
+# ✅ Regenerate the slide data for a range of report weeks, e.g.
+#    python main_backfill.py 2025-07-06 2025-09-28 --slides 2 3 4
+#    Each week is written to data/backfill/<YYMMDD>/data/{raw,final}
+#    (guarded so spawned pool workers do not re-run it)
+if __name__ == "__main__":
+    args = parse_args()
+    results = run_backfill(args.first, args.last, args.slides or None, args.workers)
+
+    if all(status == "ok" for statuses in results.values() for status in statuses.values()):
+        print("\n🎉 **Backfill Completed Successfully!** 🚀")
+    else:
+        print("\n⚠️ **Backfill finished with errors (see backfill.log in the week folders).**")
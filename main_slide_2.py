@@ -18,17 +18,18 @@ SCRIPTS_TO_RUN = [
     "scripts/final/finalized_ytd_metrics.py",  # ✅ Finalizes YTD metrics
     "scripts/final/finalized_ytd_growth.py",  # ✅ Finalizes YTD growth metrics
     "scripts/excel/top_table_excel.py",  # ✅ Updates Excel top table
-    "scripts/macros/top_table_macro.py",  # ✅ Runs PowerPoint macro
+    "scripts/visualization/pptx_renderer.py 2",  # ✅ Renders slide 2 into the PowerPoint deck
 ]
 
 # ✅ Function to run a script and handle errors
 def run_script(script_path):
     """Runs a Python script and handles errors gracefully."""
+    script_path, *script_args = script_path.split()
     full_path = os.path.join(BASE_DIR, script_path)
     if os.path.exists(full_path):
         print(f"\n🚀 **Running {script_path}...**")
         try:
-            subprocess.run(["python3", full_path], check=True)
+            subprocess.run(["python3", full_path, *script_args], check=True)
             print(f"✅ **{script_path} completed successfully!**")
         except subprocess.CalledProcessError as e:
             print(f"❌ **Error in {script_path}: {e}**")
@@ -1,20 +1,27 @@
 import os
+import sys
 
 # ✅ Get the current directory (weekly_reports folder)
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
-# ✅ Define the slide script names (excluding main_slide_1.py which doesn't exist)
-SLIDE_SCRIPTS = [f"main_slide_{i}.py" for i in range(2, 19)]
+# ✅ Ensure the scripts folder is in the import path
+sys.path.append(os.path.join(BASE_DIR, "scripts"))
 
-# ✅ Iterate and execute each slide script
-for slide_script in SLIDE_SCRIPTS:
-    script_path = os.path.join(BASE_DIR, slide_script)  # Full path in weekly_reports folder
-    
-    print(f"\n🚀 **Executing {slide_script}...**")
+from pipeline.runner import run_from_args, parse_args
+from calculator.tracing import print_summary
 
-    if os.path.exists(script_path):
-        os.system(f"python3 {script_path}")
-    else:
-        print(f"❌ {slide_script} not found. Skipping.")
+# ✅ Build every slide (2–18) in-process as one dependency graph:
+#    shared steps (format, finals) run once, independent slides run concurrently,
+#    and steps whose inputs are unchanged since the last build are skipped.
+#    The __main__ guard keeps `--mode forkserver` children from re-running this file.
+if __name__ == "__main__":
+    args = parse_args()
+    results = run_from_args(args)
 
-print("\n🎉 **All Slide Processes Completed Successfully!** 🚀")
\ No newline at end of file
+    if not args.dry_run:
+        print_summary(top=15)
+
+        if all(result["status"] in ("ok", "cached") for result in results.values()):
+            print("\n🎉 **All Slide Processes Completed Successfully!** 🚀")
+        else:
+            print("\n⚠️ **Slide processing finished with errors (see above).**")
@@ -0,0 +1,102 @@
+"""
+Customer × period activity matrix for churn and retention analyses.
+
+Customers get integer keys (pd.factorize) and every period is a bitset over
+them: `bits[period]` is a packed uint8 row with bit `customer` set when the
+customer bought in that period. Periods are contiguous between the first and
+last purchase, at month, quarter, calendar-year or fiscal-year (April–March,
+named after the year it ends) grain. Churn, retention, reactivation and
+cohort curves are bitwise AND/OR + popcount over whole rows, so the cost is
+periods × customers / 8 bytes, independent of the number of order lines.
+"""
+
+import numpy as np
+import pandas as pd
+
+# ✅ Period grain → (ordinal from year & month, label from ordinal)
+GRAINS = {
+    "month": (lambda y, m: y * 12 + m - 1, lambda o: f"{o // 12}-{o % 12 + 1:02d}"),
+    "quarter": (lambda y, m: y * 4 + (m - 1) // 3, lambda o: f"{o // 4}Q{o % 4 + 1}"),
+    "year": (lambda y, m: y, lambda o: o),
+    "fiscal_year": (lambda y, m: y + (m >= 4), lambda o: o),
+}
+
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+def _count(bits):
+    """Number of set bits per row."""
+    return POPCOUNT[bits].sum(axis=-1, dtype=np.int64)
+
+def _seen_before(bits):
+    """Per period, everyone active in any earlier period."""
+    seen = np.zeros_like(bits)
+    seen[1:] = np.bitwise_or.accumulate(bits, axis=0)[:-1]
+    return seen
+
+def _pack(period_codes, customer_codes, n_periods, n_customers):
+    """Bitset rows (n_periods × customer bytes) with the given (period, customer) bits set."""
+    bits = np.zeros((n_periods, (n_customers + 7) // 8), dtype=np.uint8)
+    np.bitwise_or.at(bits, (period_codes, customer_codes >> 3), (0x80 >> (customer_codes & 7)).astype(np.uint8))
+    return bits
+
+def activity_matrix(df, grain="year", customer_column="Customer E-mail", date_column="Date"):
+    """
+    Builds the activity bitsets from order lines. Returns a dict with
+    `bits`, `customers` (key → e-mail) and `periods` (row → period label).
+    Rows without a customer or date are ignored.
+    """
+    ordinal, label = GRAINS[grain]
+    dates = pd.to_datetime(df[date_column], errors="coerce")
+    customer_codes, customers = pd.factorize(df[customer_column])
+
+    valid = (customer_codes >= 0) & dates.notna().to_numpy()
+    dates = dates[valid]
+    period_ordinals = ordinal(dates.dt.year.to_numpy(), dates.dt.month.to_numpy()).astype(np.int64)
+    first = period_ordinals.min()
+    period_codes = period_ordinals - first
+
+    n_periods = int(period_codes.max()) + 1
+    bits = _pack(period_codes, customer_codes[valid].astype(np.int64), n_periods, len(customers))
+    periods = [label(first + offset) for offset in range(n_periods)]
+    return {"bits": bits, "customers": customers, "periods": periods}
+
+def period_flow(matrix):
+    """
+    Customer flow between consecutive periods: active, retained, churned,
+    new and reactivated customers. Churn rate is churned customers over
+    everyone active in either period; retention rate is its complement.
+    """
+    bits = matrix["bits"]
+    current, following = bits[:-1], bits[1:]
+    seen_before = _seen_before(bits)[1:]
+
+    union = _count(current | following)
+    churned = _count(current & ~following)
+    flow = pd.DataFrame({
+        "Active": _count(current),
+        "Retained": _count(current & following),
+        "Churned": churned,
+        "New": _count(following & ~seen_before),
+        "Reactivated": _count(following & ~current & seen_before),
+    }, index=[f"{a}-{b}" for a, b in zip(matrix["periods"][:-1], matrix["periods"][1:])])
+
+    flow["Churn Rate"] = np.divide(churned, union, out=np.zeros(len(union)), where=union > 0)
+    flow["Retention Rate"] = 1 - flow["Churn Rate"]
+    return flow
+
+def cohort_retention(matrix):
+    """
+    Cohort (first active period) × period table of active customers, and the
+    same as a share of the cohort size. Cohorts without customers are left out.
+    """
+    bits = matrix["bits"]
+
+    # ✅ Cohort bitset: active in the period and never before
+    cohorts = bits & ~_seen_before(bits)
+    counts = np.array([_count(cohort & bits) for cohort in cohorts])
+    counts = pd.DataFrame(counts, index=matrix["periods"], columns=matrix["periods"])
+    counts.index.name, counts.columns.name = "Cohort", "Period"
+
+    sizes = pd.Series(np.diag(counts.to_numpy()), index=counts.index)
+    counts = counts[sizes > 0]
+    return counts, counts.divide(sizes[sizes > 0], axis=0)
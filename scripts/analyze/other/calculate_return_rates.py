@@ -1,32 +1,17 @@
 import sys
 import os
-import pandas as pd
 from tabulate import tabulate
 
-# ✅ Load data
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from calculator.metrics_calculator import load_data
+# ✅ Load the monthly cube (month × channel group × customer type × category)
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from monthly_cube import load_monthly_cube, query_cube
 
-data = load_data()
+cube = load_monthly_cube()
 
-# ✅ Check required columns
-required_columns = {
-    "Date", "Gross Revenue (ex. VAT)", "Returns Received",
-    "Channel Group", "New/Returning Customer"
-}
-missing = required_columns - set(data.columns)
-if missing:
-    raise KeyError(f"❌ Missing columns: {missing}")
-
-# ✅ Prepare date + filter to Online only
-data["Date"] = pd.to_datetime(data["Date"])
-data["Month"] = data["Date"].dt.to_period("M").astype(str)
-data = data[
-    (data["Channel Group"] == "Online") &
-    data["Gross Revenue (ex. VAT)"].notna() &
-    data["Returns Received"].notna() &
-    data["New/Returning Customer"].isin(["New", "Returning"])
-]
+# ✅ Online only, New & Returning customers
+ONLINE = {"Channel_Group": "Online", "New_Returning_Customer": ["New", "Returning"]}
+# ✅ Revenue and returns of the lines where both are known, which the rates are based on
+CUBE_COLUMNS = {"Rated Gross Revenue (ex. VAT)": "Gross_Revenue", "Rated Returns Received": "Returns"}
 
 # ✅ Create export directory
 output_dir = "/Users/axelsamuelson/Documents/budget_filer"
@@ -35,12 +20,8 @@ os.makedirs(output_dir, exist_ok=True)
 # ─────────────────────────────────────────────────────────
 # ✅ PART 1: Overall Online Return Rate (no customer split)
 # ─────────────────────────────────────────────────────────
-monthly_total = data.groupby("Month").agg(
-    Gross_Revenue=("Gross Revenue (ex. VAT)", "sum"),
-    Returns=("Returns Received", "sum")
-).reset_index()
-
-monthly_total["Return Rate (%)"] = (monthly_total["Returns"] / monthly_total["Gross_Revenue"] * 100).round(2)
+monthly_total = query_cube(cube, ["Month"], **ONLINE).rename(columns=CUBE_COLUMNS)
+monthly_total = monthly_total[["Month", "Gross_Revenue", "Returns", "Return Rate (%)"]]
 
 # ✅ Export part 1
 monthly_total_path = os.path.join(output_dir, "monthly_return_rates_online.csv")
@@ -58,12 +39,8 @@ print(tabulate(display_df, headers="keys", tablefmt="fancy_grid", showindex=Fals
 # ──────────────────────────────────────────────────────────────
 # ✅ PART 2: Split by New vs Returning Customer (Online only)
 # ──────────────────────────────────────────────────────────────
-monthly_split = data.groupby(["Month", "New/Returning Customer"]).agg(
-    Gross_Revenue=("Gross Revenue (ex. VAT)", "sum"),
-    Returns=("Returns Received", "sum")
-).reset_index()
-
-monthly_split["Return Rate (%)"] = (monthly_split["Returns"] / monthly_split["Gross_Revenue"] * 100).round(2)
+monthly_split = query_cube(cube, ["Month", "New/Returning Customer"], **ONLINE).rename(columns=CUBE_COLUMNS)
+monthly_split = monthly_split[["Month", "New/Returning Customer", "Gross_Revenue", "Returns", "Return Rate (%)"]]
 
 # ✅ Export part 2
 monthly_split_path = os.path.join(output_dir, "monthly_return_rates_online_by_customer_type.csv")
@@ -0,0 +1,26 @@
+import sys
+import os
+
+# ✅ Load the monthly cube (month × channel group × customer type × category)
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from monthly_cube import CUBE_PATH, load_monthly_cube, query_cube
+
+cube = load_monthly_cube()
+output_dir = os.path.dirname(CUBE_PATH)
+
+# ✅ Gross sales per month and channel group (columns = channel groups)
+by_channel = query_cube(cube, ["Month", "Channel Group"])
+by_channel_wide = by_channel.pivot(index="Month", columns="Channel Group", values="Gross Revenue (ex. VAT)").fillna(0).round(0)
+
+# ✅ Online gross sales and units per month and category
+by_category = query_cube(cube, ["Month", "Category"], Channel_Group="Online")
+
+by_channel_path = os.path.join(output_dir, "gross_sales_monthly_by_channel.csv")
+by_category_path = os.path.join(output_dir, "gross_sales_monthly_online_by_category.csv")
+by_channel_wide.to_csv(by_channel_path)
+by_category.to_csv(by_category_path, index=False)
+
+print("\n📦 Monthly Gross Sales (ex. VAT) – by Channel Group")
+print(by_channel_wide.tail(12).to_string())
+print(f"\n✅ CSV saved (by channel group): {by_channel_path}")
+print(f"✅ CSV saved (Online by category): {by_category_path}")
@@ -4,7 +4,12 @@ import pandas as pd
 
 # === Setup import paths ===
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 from calculator.metrics_calculator import load_data
+from cohort import run_cohort
+
+# === Underwear cohort (classification, LTV, long & wide summaries) ===
+run_cohort("UNDERWEAR")
 
 # === Load and prepare data ===
 df = load_data()
@@ -0,0 +1,108 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# === Setup import paths ===
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from calculator.metrics_calculator import load_data
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+ANALYSE_DIR = os.path.join(BASE_DIR, "data", "analyse")
+
+EMAIL = "Customer E-mail"
+REVENUE = "Gross Revenue (ex. VAT)"
+
+# === Category → labels used in the output columns and file names ===
+COHORT_CATEGORIES = {
+    "SWIMWEAR": {"name": "Swimwear", "short": "Swim", "file": "swimwear"},
+    "UNDERWEAR": {"name": "Underwear", "short": "UW", "file": "underwear"},
+}
+
+def load_orders():
+    """All order lines with a valid date and a normalised customer e-mail."""
+    df = load_data().copy()
+    df.columns = df.columns.str.strip()
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df[EMAIL] = df[EMAIL].str.lower().str.strip()
+    return df[df["Date"].notna()]
+
+def build_cohort(df, category):
+    """
+    Online order lines of `category` per customer, with first category order,
+    first-ever order, customer type, cumulative category revenue and the
+    category LTV on the customer's last category order date.
+    """
+    labels = COHORT_CATEGORIES[category]
+    name, short = labels["name"], labels["short"]
+    first_col, first_year_col = f"First {name} Order Date", f"First {short} Year"
+    type_col, ltv_col = f"Customer {short} Type", f"{name} LTV (ex. VAT)"
+
+    orders = df[
+        (df["Channel Group"] == "Online") &
+        (df["Category"].fillna("").str.upper() == category) &
+        (df[EMAIL] != "-")
+    ].copy()
+    orders["Year"] = orders["Date"].dt.year
+
+    # === First purchase dates (category and overall) as group transforms ===
+    customers = orders.groupby(EMAIL)
+    orders[first_col] = customers["Date"].transform("min")
+    orders[first_year_col] = orders[first_col].dt.year
+    first_ever = df.groupby(EMAIL)["Date"].min()
+    orders["First Ever Order Date"] = orders[EMAIL].map(first_ever)
+
+    # === Classification ===
+    first_year = orders["Year"] == orders[first_year_col]
+    orders[type_col] = np.select(
+        [first_year & (orders["New/Returning Customer"] == "New"),
+         first_year & (orders["New/Returning Customer"] == "Returning")],
+        [f"New Customer / New {short}", f"Returning Customer / New {short}"],
+        default=f"Returning Customer / Returning {short}",
+    )
+
+    # === Cumulative revenue and LTV on the last order date ===
+    by_date = orders.sort_values("Date", kind="stable")
+    orders[f"Cumulative {name} Revenue (ex. VAT)"] = by_date.groupby(EMAIL)[REVENUE].cumsum()
+    last_order = orders["Date"] == customers["Date"].transform("max")
+    orders[ltv_col] = customers[REVENUE].transform("sum").where(last_order)
+
+    return orders.reset_index(drop=True)
+
+def cohort_summary(orders, category):
+    """Unique customers per year and customer type, as a long table and a year × type pivot."""
+    type_col = f"Customer {COHORT_CATEGORIES[category]['short']} Type"
+    long = orders.groupby(["Year", type_col])[EMAIL].nunique().reset_index(name="Customers")
+    wide = long.pivot(index="Year", columns=type_col, values="Customers").fillna(0).astype(int).reset_index()
+    return long, wide
+
+def run_cohort(category, df=None):
+    """Builds the cohort for `category` and writes the order lines, long and wide summaries to data/analyse."""
+    df = load_orders() if df is None else df
+    orders = build_cohort(df, category)
+    long, wide = cohort_summary(orders, category)
+
+    name, file_name = COHORT_CATEGORIES[category]["name"], COHORT_CATEGORIES[category]["file"]
+    os.makedirs(ANALYSE_DIR, exist_ok=True)
+    outputs = {
+        "orders": os.path.join(ANALYSE_DIR, f"{file_name}_orders_cleaned.csv"),
+        "long": os.path.join(ANALYSE_DIR, f"{file_name}_cohort_long.csv"),
+        "wide": os.path.join(ANALYSE_DIR, f"{file_name}_cohort_wide.csv"),
+    }
+    orders.to_csv(outputs["orders"], index=False)
+    long.to_csv(outputs["long"], index=False)
+    wide.to_csv(outputs["wide"], index=False)
+
+    print(f"✅ {name} Orders Extracted")
+    print("🔢 Total rows:", len(orders))
+    print("👥 Unique customers:", orders[EMAIL].nunique())
+    print(f"\n📊 Summary – {name} Customer Types per Year:")
+    print(wide)
+    print(f"\n📦 Saved {name} cohort to: {ANALYSE_DIR}")
+    return orders, long, wide
+
+if __name__ == "__main__":
+    all_orders = load_orders()
+    for cohort_category in COHORT_CATEGORIES:
+        run_cohort(cohort_category, all_orders)
@@ -0,0 +1,82 @@
+import sys
+import os
+import pandas as pd
+
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.artifacts import read_table
+from calculator.control_totals import AUDIT_DIR, DATA_DIR, load_control_totals, reconcile, weeks_in
+
+RAW_DIR = os.path.join(DATA_DIR, "raw")
+CUBE_PATH = os.path.join(DATA_DIR, "analyse", "monthly_cube.csv")
+AUDIT_OUTPUT_PATH = os.path.join(AUDIT_DIR, "reconciliation.csv")
+
+def check_gender_slide(sales):
+    """Slide 6: Online gross revenue per week and gender (UNISEX, "-" and blanks count as MEN)."""
+    table = read_table(os.path.join(RAW_DIR, "gender_revenue_raw.csv"))
+    table["Gender"] = table["Metric"].str.replace("Gross Revenue - ", "", regex=False)
+
+    online = weeks_in(sales[sales["Channel Group"] == "Online"], table)
+    online["Gender"] = online["Gender"].fillna("MEN").replace(["UNISEX", "-"], "MEN")
+    return reconcile(
+        online, table, ["Calendar Year", "ISO Week", "Gender"],
+        {"Gross Revenue (ex. VAT)": "Value"}, "gender_revenue_raw",
+    )
+
+def check_monthly_cube(sales):
+    """Monthly analysis cube: all-time totals per channel group and category."""
+    cube = read_table(CUBE_PATH)
+    measures = {m: m for m in ["Gross Revenue (ex. VAT)", "Returns Received", "Sales Qty"] if m in cube.columns}
+    return reconcile(sales, cube, ["Channel Group", "Category"], measures, "monthly_cube")
+
+def check_media_spend_slide(spend):
+    """Slide 18: total online media spend per week."""
+    table = read_table(os.path.join(RAW_DIR, "online_media_spend_raw.csv"))
+    table = table[table["Market"] == "Total"]
+    return reconcile(
+        weeks_in(spend, table), table, ["Calendar Year", "ISO Week"],
+        {"Total Spend": "Value"}, "online_media_spend_raw",
+    )
+
+# ✅ Check → (function, control totals it needs, derived table it reads)
+CHECKS = {
+    "gender_revenue_raw": (check_gender_slide, "sales", os.path.join(RAW_DIR, "gender_revenue_raw.csv")),
+    "monthly_cube": (check_monthly_cube, "sales", CUBE_PATH),
+    "online_media_spend_raw": (check_media_spend_slide, "spend", os.path.join(RAW_DIR, "online_media_spend_raw.csv")),
+}
+
+def run_reconciliation():
+    """Reconciles every available derived table against the ingest control totals and saves the mismatches."""
+    totals = {}
+    results = []
+    for name, (check, kind, source) in CHECKS.items():
+        if not os.path.exists(source):
+            print(f"⚠️ Skipping {name}: {source} not found.")
+            continue
+        try:
+            if kind not in totals:
+                totals[kind] = load_control_totals(kind)
+        except FileNotFoundError:
+            print(f"⚠️ Skipping {name}: no {kind} control totals (run the format step first).")
+            continue
+
+        mismatches = check(totals[kind])
+        status = "✅" if mismatches.empty else "❌"
+        print(f"{status} {name}: {len(mismatches)} mismatching cells")
+        results.append(mismatches)
+
+    report = pd.concat(results, ignore_index=True) if results else pd.DataFrame(
+        columns=["Check", "Measure", "Key", "Expected", "Actual", "Difference"]
+    )
+    os.makedirs(AUDIT_DIR, exist_ok=True)
+    report.to_csv(AUDIT_OUTPUT_PATH, index=False)
+
+    if not report.empty:
+        print("\n📊 **Reconciliation Mismatches:**")
+        print(report.to_string(index=False))
+    print(f"\n✅ Reconciliation report saved to: {AUDIT_OUTPUT_PATH}")
+    return report
+
+if __name__ == "__main__":
+    run_reconciliation()
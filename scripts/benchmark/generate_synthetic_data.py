@@ -0,0 +1,253 @@
+"""
+Generates a synthetic data root shaped like the production exports:
+
+    <out>/formatted/weekly_data_formatted.csv     order lines (Weekly_Data layout)
+    <out>/formatted/marketing_spend_formatted.csv  merged spend (Market, Date, Total Spend)
+    <out>/Marketing Spend/unformatted/*.csv        weekly spend exports (Market, Date, Total Spend, Ad Spend, FB Spend)
+    <out>/session_data.csv                         Day, Session country, Sessions
+    <out>/gm2.csv                                  weekly gross margin export (";"-separated)
+
+Countries, customers and products are Zipf-skewed so a few markets, repeat
+customers and hero products dominate, as in the real data. Order lines are
+written in chunks, so 50M rows need no more memory than one chunk.
+
+Point the loaders at the result with `REPORT_DATA_DIR=<out>`.
+"""
+
+import os
+import argparse
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+DEFAULT_OUTPUT_ROOT = os.path.join(BASE_DIR, "data", "synthetic")
+CHUNK_ROWS = 1_000_000
+
+# ✅ Market name (as in Weekly_Data) → country code (as in the spend exports)
+COUNTRIES = {
+    "United States": "US", "Sweden": "SE", "United Kingdom": "GB", "Germany": "DE", "Australia": "AU",
+    "Canada": "CA", "France": "FR", "Netherlands": "NL", "Denmark": "DK", "Norway": "NO",
+    "Switzerland": "CH", "Finland": "FI", "Italy": "IT", "Spain": "ES", "Belgium": "BE",
+    "Austria": "AT", "Japan": "JP", "Hong Kong": "HK", "South Korea": "KR", "Singapore": "SG",
+    "Ireland": "IE", "Poland": "PL", "New Zealand": "NZ", "Portugal": "PT", "Greece": "GR",
+    "Israel": "IL", "United Arab Emirates": "AE", "India": "IN", "Brazil": "BR", "Mexico": "MX",
+}
+
+CATEGORIES = {
+    "MEN": ["UNDERWEAR", "SWIMWEAR", "TOPS", "BOTTOMS", "SOCKS", "LOUNGEWEAR", "POOLWEAR"],
+    "WOMEN": ["UNDERWEAR", "SWIMWEAR", "TOPS", "BOTTOMS", "LOUNGEWEAR"],
+    "UNISEX": ["ACCESSORIES", "SOCKS"],
+}
+COLORS = ["BLACK", "WHITE", "NAVY", "GREY MELANGE", "STEEL BLUE", "JUNIPER", "SAND", "BURGUNDY", "WHITE+BLACK"]
+
+# ✅ Sales Channel → (Channel Group, share of order lines)
+CHANNELS = {
+    "Online": ("Online", 0.80),
+    "Retail": ("Retail", 0.09),
+    "Retail Pop-up": ("Retail", 0.03),
+    "Wholesale": ("Wholesale", 0.08),
+}
+
+def zipf_weights(n, exponent=1.1):
+    """Normalized Zipf weights for n ranked items."""
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+def latest_sunday():
+    today = date.today()
+    return today - timedelta(days=today.weekday() + 1)
+
+def build_catalogue(rng, n_styles=120):
+    """Product catalogue: one row per style × color with a list price (SEK ex. VAT)."""
+    rows = []
+    for style in range(n_styles):
+        gender = rng.choice(list(CATEGORIES), p=[0.6, 0.3, 0.1])
+        category = rng.choice(CATEGORIES[gender])
+        pack = rng.choice(["", "2 X ", "3 X ", "6 X "], p=[0.6, 0.15, 0.2, 0.05])
+        product = f"{pack}{category.rstrip('S')} STYLE {style:03d}"
+        price = float(np.round(rng.lognormal(mean=6.3, sigma=0.5), 2))
+        for color in rng.choice(COLORS, size=rng.integers(1, 5), replace=False):
+            rows.append((gender, category, product, color, price))
+    catalogue = pd.DataFrame(rows, columns=["Gender", "Category", "Product", "Color", "Price"])
+    # ✅ Shuffled, so the Zipf popularity head (the first rows) is a random mix of styles, not the lowest style numbers
+    return catalogue.sample(frac=1, random_state=int(rng.integers(1 << 31))).reset_index(drop=True)
+
+def generate_orders(out_dir, rows, start, end, rng, n_customers=None, chunk_rows=CHUNK_ROWS):
+    """Writes `rows` order lines between `start` and `end` to weekly_data_formatted.csv in date order."""
+    output_file = os.path.join(out_dir, "formatted", "weekly_data_formatted.csv")
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+    catalogue = build_catalogue(rng)
+    product_p = zipf_weights(len(catalogue), 1.05)
+    country_names = np.array(list(COUNTRIES))
+    country_p = zipf_weights(len(country_names), 1.3)
+    channel_names = np.array(list(CHANNELS))
+    channel_groups = np.array([CHANNELS[c][0] for c in channel_names])
+    channel_p = np.array([CHANNELS[c][1] for c in channel_names])
+
+    n_customers = n_customers or max(rows // 4, 1_000)
+    customer_p = zipf_weights(n_customers, 0.9)
+    customer_seen = np.zeros(n_customers, dtype=bool)
+
+    n_days = (end - start).days + 1
+    # ✅ Mild growth over time: later days get more order lines
+    day_p = np.linspace(0.7, 1.3, n_days)
+    day_p /= day_p.sum()
+    lines_per_day = rng.multinomial(rows, day_p)
+    day_boundaries = np.concatenate([[0], np.cumsum(lines_per_day)])
+
+    order_no = 100_000
+    written = 0
+    header = True
+    while written < rows:
+        n = min(chunk_rows, rows - written)
+        day_index = np.searchsorted(day_boundaries, np.arange(written, written + n), side="right") - 1
+        dates = pd.to_datetime(start) + pd.to_timedelta(day_index, unit="D")
+
+        customers = rng.choice(n_customers, size=n, p=customer_p)
+        products = rng.choice(len(catalogue), size=n, p=product_p)
+        channel_idx = rng.choice(len(channel_names), size=n, p=channel_p)
+        qty = rng.choice([1, 1, 1, 1, 2, 2, 3, 5], size=n)
+
+        # ✅ ~1.6 lines per order: a new order starts with probability 1/1.6
+        new_order = rng.random(n) < 0.625
+        new_order[0] = True
+        order_numbers = order_no + np.cumsum(new_order)
+        order_no = int(order_numbers[-1])
+
+        # ✅ New = first time this customer is seen (data is generated in date order)
+        _, first_index = np.unique(customers, return_index=True)
+        first_in_chunk = np.zeros(n, dtype=bool)
+        first_in_chunk[first_index] = True
+        is_new = first_in_chunk & ~customer_seen[customers]
+        customer_seen[customers] = True
+
+        product_rows = catalogue.iloc[products]
+        gross = np.round(product_rows["Price"].to_numpy() * qty * rng.uniform(0.7, 1.0, size=n), 4)
+        is_online = channel_names[channel_idx] == "Online"
+        returns = np.where(is_online & (rng.random(n) < 0.15), gross, 0.0)
+
+        chunk = pd.DataFrame({
+            "Date": dates.date,
+            "Order No": order_numbers,
+            "Order Id": order_numbers,
+            "Customer E-mail": np.char.add(np.char.add("customer", customers.astype(str)), "@example.com"),
+            "New/Returning Customer": np.where(is_new, "New", "Returning"),
+            "Sales Channel": channel_names[channel_idx],
+            "Channel Group": channel_groups[channel_idx],
+            "Country": rng.choice(country_names, size=n, p=country_p),
+            "Gender": product_rows["Gender"].to_numpy(),
+            "Category": product_rows["Category"].to_numpy(),
+            "Product Category": product_rows["Category"].to_numpy(),
+            "Product": product_rows["Product"].to_numpy(),
+            "Color": product_rows["Color"].to_numpy(),
+            "Sales Qty": qty,
+            "Gross Revenue": gross,
+            "Gross Revenue (ex. VAT)": gross,
+            "Gross Revenue (inc. VAT)": np.round(gross * 1.25, 4),
+            "Returns": returns,
+            "Returns Received": returns,
+        })
+
+        # ✅ ~2% non-product lines (shipping, gift cards) carry "-" in the product keys
+        dash = rng.random(n) < 0.02
+        chunk.loc[dash, ["Gender", "Category", "Product Category", "Product", "Color"]] = "-"
+
+        chunk.to_csv(output_file, mode="w" if header else "a", header=header, index=False)
+        header = False
+        written += n
+        print(f"📝 Order lines written: {written:,}/{rows:,}")
+
+    return output_file
+
+def generate_spend(out_dir, start, end, rng, overlap_exports=True):
+    """Weekly spend exports per market/day plus the merged formatted spend file."""
+    export_dir = os.path.join(out_dir, "Marketing Spend", "unformatted")
+    os.makedirs(export_dir, exist_ok=True)
+
+    codes = np.array(list(COUNTRIES.values()))
+    market_scale = zipf_weights(len(codes), 1.2) * 60_000
+    days = pd.date_range(start, end, freq="D")
+
+    spend = pd.DataFrame({
+        "Market": np.tile(codes, len(days)),
+        "Date": np.repeat(days.date, len(codes)),
+    })
+    total = np.round(np.tile(market_scale, len(days)) * rng.uniform(0.6, 1.4, size=len(spend)) / 7, 2)
+    spend["Total Spend"] = total
+    spend["Ad Spend"] = np.round(total * 0.3, 2)
+    spend["FB Spend"] = np.round(total - spend["Ad Spend"], 2)
+
+    # ✅ One export per ISO week, named by the Sunday (YYMMDD.csv)
+    week_end = pd.to_datetime(spend["Date"]) + pd.to_timedelta(6 - pd.to_datetime(spend["Date"]).dt.weekday, unit="D")
+    for sunday, week_df in spend.groupby(week_end.dt.strftime("%y%m%d")):
+        week_df.to_csv(os.path.join(export_dir, f"{sunday}.csv"), index=False)
+
+    # ✅ Overlapping re-export of the last 8 weeks, as happens when an export is corrected
+    if overlap_exports:
+        recent = spend[pd.to_datetime(spend["Date"]) > pd.to_datetime(end) - pd.Timedelta(weeks=8)].copy()
+        recent["Total Spend"] = np.round(recent["Total Spend"] * 1.01, 2)
+        recent.to_csv(os.path.join(export_dir, f"{start:%y%m%d}-{end:%y%m%d}_reexport.csv"), index=False)
+
+    formatted_dir = os.path.join(out_dir, "formatted")
+    os.makedirs(formatted_dir, exist_ok=True)
+    spend[["Market", "Date", "Total Spend"]].to_csv(os.path.join(formatted_dir, "marketing_spend_formatted.csv"), index=False)
+    spend[["Market", "Date", "Total Spend"]].to_csv(os.path.join(formatted_dir, "marketing_spend_final.csv"), index=False)
+
+def generate_sessions(out_dir, start, end, rng):
+    """Daily sessions per session country (session_data.csv layout)."""
+    names = np.array(list(COUNTRIES))
+    days = pd.date_range(start, end, freq="D")
+    sessions = pd.DataFrame({
+        "Day": np.repeat(days.strftime("%Y-%m-%d"), len(names)),
+        "Session country": np.tile(names, len(days)),
+    })
+    base = np.tile(zipf_weights(len(names), 1.3) * 12_000, len(days))
+    sessions["Sessions"] = rng.poisson(base).astype(int)
+    sessions.to_csv(os.path.join(out_dir, "session_data.csv"), index=False)
+
+def generate_gm2(out_dir, start, end, rng):
+    """Weekly gross margin export in the ";"-separated, quoted gm2.csv layout."""
+    sundays = pd.date_range(start, end, freq="W-SUN")
+    iso = sundays.isocalendar()
+    columns = [
+        "Gross margin 1 - Dema MTA", "Gross margin 2 - Dema MTA",
+        "Net gross margin 1 - Dema MTA", "Net gross margin 2 - Dema MTA",
+    ]
+    gm2 = pd.DataFrame({
+        "Years": iso["year"].astype(str).to_numpy(),
+        "Weeks": [f"Week {w}, {y}" for y, w in zip(iso["year"], iso["week"])],
+    })
+    for column in columns:
+        gm2[column] = rng.uniform(0.45, 0.85, size=len(gm2))
+        gm2[f"Compare range: {column}"] = 0
+    gm2.to_csv(os.path.join(out_dir, "gm2.csv"), sep=";", index=False, quoting=1, encoding="utf-8-sig")
+
+def generate_dataset(rows, out_dir=None, start=None, end=None, seed=42):
+    """Generates a complete synthetic data root and returns its path."""
+    end = end or latest_sunday()
+    start = start or date(end.year - 3, 1, 1)
+    out_dir = out_dir or os.path.join(DEFAULT_OUTPUT_ROOT, f"{rows}")
+    rng = np.random.default_rng(seed)
+
+    print(f"\n🧪 **Generating {rows:,} order lines ({start} → {end}) in:** {out_dir}")
+    generate_orders(out_dir, rows, start, end, rng)
+    generate_spend(out_dir, start, end, rng)
+    generate_sessions(out_dir, start, end, rng)
+    generate_gm2(out_dir, start, end, rng)
+    print(f"✅ **Synthetic dataset ready:** {out_dir}")
+    return out_dir
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic weekly report dataset.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Order lines (100k – 50M)")
+    parser.add_argument("--out", help="Output data root (default: data/synthetic/<rows>)")
+    parser.add_argument("--start", type=date.fromisoformat, help="First order date (default: Jan 1st three years back)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last order date (default: latest Sunday)")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    generate_dataset(args.rows, args.out, args.start, args.end, args.seed)
@@ -0,0 +1,239 @@
+"""
+Benchmarks the ingest → calculate → workbook stages on a synthetic dataset.
+
+    python scripts/benchmark/run_benchmarks.py --rows 1000000
+    python scripts/benchmark/run_benchmarks.py --rows 10000000 --only load_sales rank_top_products
+
+Each run is appended to data/benchmarks/results.jsonl (git commit, rows,
+seconds, peak RSS of the benchmark process so far) and compared against the previous run of the same
+benchmark at the same size, so a regression shows up as a slower ratio.
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+
+# Ensure correct import paths
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from benchmark.generate_synthetic_data import DEFAULT_OUTPUT_ROOT, generate_dataset
+
+RESULTS_DIR = os.path.join(BASE_DIR, "data", "benchmarks")
+RESULTS_FILE = os.path.join(RESULTS_DIR, "results.jsonl")
+
+def git_commit():
+    """Short hash of HEAD (None outside a git checkout)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# ✅ Benchmarks: each receives the shared context and returns the number of rows it processed
+
+def bench_load_sales(ctx):
+    from calculator import metrics_calculator
+    metrics_calculator.clear_data_cache()
+    ctx["data"] = metrics_calculator.load_data()
+    return len(ctx["data"])
+
+def bench_load_spend(ctx):
+    from calculator import metrics_calculator
+    metrics_calculator.clear_data_cache()
+    ctx["spend"] = metrics_calculator.load_spend_data()
+    return len(ctx["spend"])
+
+def bench_load_sessions(ctx):
+    from calculator import metrics_calculator
+    metrics_calculator.clear_data_cache()
+    return len(metrics_calculator.load_session_data())
+
+def bench_format_spend(ctx):
+    from format import format_spend_data
+    format_spend_data.UNFORMATTED_DIR = os.path.join(ctx["data_dir"], "Marketing Spend", "unformatted")
+    format_spend_data.FORMATTED_CSV_FILE = os.path.join(ctx["work_dir"], "marketing_spend_formatted.csv")
+    format_spend_data.MANIFEST_FILE = os.path.join(ctx["work_dir"], "marketing_spend_manifest.json")
+    if os.path.exists(format_spend_data.MANIFEST_FILE):
+        os.remove(format_spend_data.MANIFEST_FILE)  # ✅ Measure a full ingest, not the up-to-date check
+    format_spend_data.load_and_clean_spend_data()
+    with open(format_spend_data.FORMATTED_CSV_FILE, "rb") as file:
+        return sum(1 for _ in file) - 1
+
+def bench_revenue_metrics(ctx):
+    from calculator.metrics_calculator import calculate_revenue_metrics
+    for start, end in ctx["weeks"].values():
+        calculate_revenue_metrics(ctx["data"], start, end)
+    return len(ctx["data"]) * len(ctx["weeks"])
+
+def bench_deduplicate_orders(ctx):
+    from calculator.orders import deduplicate_orders
+    for start, end in ctx["weeks"].values():
+        deduplicate_orders(ctx["data"], start, end)
+    return len(ctx["data"]) * len(ctx["weeks"])
+
+def bench_rank_top_products(ctx):
+    from calculator.products import rank_top_products
+    start, end = ctx["weeks"]["current_week"]
+    rank_top_products(ctx["data"], start, end)
+    return len(ctx["data"])
+
+def bench_finalize_products(ctx):
+    from final import finalized_products
+    finalized_products.FINAL_DIR = ctx["work_dir"]
+    finalized_products.finalize_products(data=ctx["data"])
+    return len(ctx["data"])
+
+def _benchmark_workbook(ctx, sheets, rows, columns):
+    """A generated .xlsm with `sheets` data sheets the size of the report's (built once per run)."""
+    path = os.path.join(ctx["work_dir"], "benchmark.xlsm")
+    if not os.path.exists(path):
+        import openpyxl
+        workbook = openpyxl.Workbook()
+        for index in range(sheets):
+            sheet = workbook.create_sheet(f"sheet_{index}")
+            for row in range(1, rows + 2):
+                sheet.append([row * col for col in range(1, columns + 1)])
+        workbook.save(path)
+    return path
+
+def _benchmark_frame(ctx, rows, columns):
+    """A block of new values on every call, so the writers cannot skip unchanged cells."""
+    import pandas as pd
+    ctx["workbook_round"] = ctx.get("workbook_round", 0) + 1
+    return pd.DataFrame(
+        [[row * col + ctx["workbook_round"] for col in range(1, columns + 1)] for row in range(1, rows + 1)],
+        columns=[f"{week}" for week in range(1, columns + 1)],
+    )
+
+def bench_write_frame(ctx, sheets=12, rows=60, columns=12):
+    """Session path: load the xlsm once, write_frame every sheet, save once."""
+    from excel.sheet_writer import write_frame
+    from excel.workbook_session import atomic_save, open_workbook
+    path = _benchmark_workbook(ctx, sheets, rows, columns)
+    df = _benchmark_frame(ctx, rows, columns)
+    workbook = open_workbook(path)
+    for index in range(sheets):
+        write_frame(workbook[f"sheet_{index}"], df, top=1, left=1, formats={c: "#,##0" for c in df.columns})
+    atomic_save(workbook, path)
+    workbook.close()
+    return sheets * rows * columns
+
+def bench_patch_workbook(ctx, sheets=12, rows=60, columns=12):
+    """No-session path: patch every sheet's XML in the xlsm in one pass."""
+    from excel.xlsm_patcher import frame_cells, patch_workbook
+    path = _benchmark_workbook(ctx, sheets, rows, columns)
+    cells = frame_cells(_benchmark_frame(ctx, rows, columns), top=1, left=1)
+    return sum(patch_workbook(path, {f"sheet_{index}": cells for index in range(sheets)}))
+
+BENCHMARKS = {
+    "load_sales": bench_load_sales,
+    "load_spend": bench_load_spend,
+    "load_sessions": bench_load_sessions,
+    "format_spend": bench_format_spend,
+    "revenue_metrics": bench_revenue_metrics,
+    "deduplicate_orders": bench_deduplicate_orders,
+    "rank_top_products": bench_rank_top_products,
+    "finalize_products": bench_finalize_products,
+    "write_frame": bench_write_frame,
+    "patch_workbook": bench_patch_workbook,
+}
+
+# ✅ Benchmarks that need the loaded sales frame in the context
+NEEDS_SALES = {"revenue_metrics", "deduplicate_orders", "rank_top_products", "finalize_products"}
+
+def load_previous_results():
+    """Latest recorded result per (benchmark, rows)."""
+    previous = {}
+    if os.path.exists(RESULTS_FILE):
+        with open(RESULTS_FILE, "r", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                previous[(record["benchmark"], record["rows"])] = record
+    return previous
+
+def append_results(records):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(RESULTS_FILE, "a", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+
+def run_benchmarks(rows, names=None, repeat=3, data_dir=None, label=None, save=True):
+    """
+    Runs the selected benchmarks on the synthetic dataset with `rows` order
+    lines (generated on first use) and returns one record per benchmark with
+    the best of `repeat` timings.
+    """
+    names = list(names or BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"❌ Unknown benchmarks: {unknown}. Available: {sorted(BENCHMARKS)}")
+
+    data_dir = data_dir or os.path.join(DEFAULT_OUTPUT_ROOT, f"{rows}")
+    if not os.path.exists(os.path.join(data_dir, "formatted", "weekly_data_formatted.csv")):
+        generate_dataset(rows, data_dir)
+
+    # ✅ Must be set before `calculator.metrics_calculator` is imported
+    os.environ["REPORT_DATA_DIR"] = data_dir
+    from calculator import tracing
+    from calculator.date_utils import get_latest_full_week
+
+    ctx = {"data_dir": data_dir, "work_dir": tempfile.mkdtemp(prefix="benchmark_"), "weeks": get_latest_full_week()}
+    if NEEDS_SALES & set(names) and "load_sales" not in names:
+        bench_load_sales(ctx)
+
+    previous = load_previous_results()
+    commit = git_commit()
+    records = []
+    print(f"\n⏱️ **Benchmarks on {rows:,} order lines** ({data_dir})")
+    for name in names:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            processed = BENCHMARKS[name](ctx)
+            timings.append(time.perf_counter() - started)
+
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": commit,
+            "label": label,
+            "benchmark": name,
+            "rows": rows,
+            "processed": processed,
+            "seconds": round(min(timings), 4),
+            "process_peak_rss_mb": tracing.peak_rss_mb(),
+        }
+        records.append(record)
+
+        baseline = previous.get((name, rows))
+        comparison = ""
+        if baseline and baseline["seconds"]:
+            comparison = f" | {record['seconds'] / baseline['seconds']:.2f}x vs {baseline.get('commit') or 'previous'}"
+        print(f"   {name:<20} {record['seconds']:>9.3f}s | {processed / max(record['seconds'], 1e-9):>14,.0f} rows/s | process peak RSS {record['process_peak_rss_mb']} MB{comparison}")
+
+    if save:
+        append_results(records)
+        print(f"\n📂 **Results appended to:** {RESULTS_FILE}")
+    return records
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the weekly report stages on synthetic data.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Order lines in the synthetic dataset")
+    parser.add_argument("--only", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best is recorded")
+    parser.add_argument("--data-dir", help="Existing data root to benchmark instead of data/synthetic/<rows>")
+    parser.add_argument("--label", help="Free-text label stored with the results")
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the results file")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_benchmarks(args.rows, args.only, args.repeat, args.data_dir, args.label, not args.no_save)
@@ -0,0 +1,74 @@
+"""
+Typed table handoff between the prepare, final and Excel stages.
+
+Steps keep declaring their artifacts as `<name>.csv`. `write_table` stores
+the frame as a typed binary table next to it (`<name>.parquet`, via pyarrow)
+and also writes a plain CSV view (comma separated, "." decimals) for people
+and the slide renderers. `read_table` returns the typed table when it is at
+least as new as the CSV, so numbers arrive as numbers and missing values as
+NaN without any text parsing. Without pyarrow, or for a CSV written by
+anything else, it falls back to parsing the CSV, including the older
+";"/"," exports. Placeholder texts ("-", "n/m", "N/A") are read as missing
+either way.
+
+Tables are handed off without an index; a label column stays a column.
+
+Formatting for display (thousands, "%", parentheses) is left to the
+renderers; see calculator.formatting.
+"""
+
+import os
+import pandas as pd
+
+TYPED_SUFFIX = ".parquet"
+MISSING_TEXT = ["-", "n/m", "N/A", ""]
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:  # ✅ Optional: CSV-only handoff
+    HAS_PYARROW = False
+
+def typed_path(path):
+    return os.path.splitext(path)[0] + TYPED_SUFFIX
+
+def _numeric_columns(df):
+    """Object columns holding only numbers and placeholders become numeric (placeholders → NaN)."""
+    df = df.copy()
+    for column in df.columns[df.dtypes == object]:
+        values = df[column].replace(MISSING_TEXT, float("nan"))
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().any() and numeric.notna().sum() == values.notna().sum():
+            df[column] = numeric
+    return df
+
+def write_table(df, path):
+    """Writes the CSV view and, with pyarrow, the typed copy (written last, so it is the newer one)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_csv(path, index=False)
+
+    typed_file = typed_path(path)
+    if not HAS_PYARROW:
+        if os.path.exists(typed_file):
+            os.remove(typed_file)  # ✅ Never leave a typed copy older than its CSV behind
+        return path
+
+    typed = _numeric_columns(df).rename(columns=str)
+    temp_file = os.path.join(os.path.dirname(typed_file), f".{os.path.basename(typed_file)}.tmp")
+    typed.to_parquet(temp_file, index=False)
+    os.replace(temp_file, typed_file)
+    return path
+
+def read_table(path):
+    """Typed copy when it is current, else the CSV (separator and decimal mark detected) with numeric columns parsed."""
+    typed_file = typed_path(path)
+    if HAS_PYARROW and os.path.exists(typed_file) and (
+        not os.path.exists(path) or os.path.getmtime(typed_file) >= os.path.getmtime(path)
+    ):
+        return pd.read_parquet(typed_file)
+
+    with open(path, "r", encoding="utf-8") as file:
+        first_line = file.readline()
+    sep, decimal = (";", ",") if ";" in first_line else (",", ".")
+    df = pd.read_csv(path, sep=sep, decimal=decimal, na_values=MISSING_TEXT, keep_default_na=True)
+    return _numeric_columns(df)
@@ -0,0 +1,93 @@
+"""
+Control totals recorded during ingest, and the reconciliation audit.
+
+The format steps already hold the complete order lines and spend rows in
+memory, so they record additive control totals as a by-product:
+
+    sales   per week × channel group × gender × category × country
+    spend   per week × market
+
+(`Week Start` is the Monday of the week; a week is keyed like the slides,
+as week-start calendar year + ISO week.) `reconcile` rolls the totals up to
+the grain of a derived table and reports the cells that differ by more than
+a tolerance, so auditing a derived table costs a group-by over the control
+totals and that table, not another pass over the order lines.
+"""
+
+import os
+import pandas as pd
+
+from calculator.artifacts import read_table, write_table
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+# ✅ Same data root as the loaders (REPORT_DATA_DIR, else data/), for the totals and the tables they audit
+DATA_DIR = os.environ.get("REPORT_DATA_DIR") or os.path.join(BASE_DIR, "data")
+AUDIT_DIR = os.path.join(DATA_DIR, "audit")
+
+# ✅ Kind → (dimensions, additive measures, stored file)
+CONTROL_TOTALS = {
+    "sales": (
+        ["Channel Group", "Gender", "Category", "Country"],
+        ["Gross Revenue", "Gross Revenue (ex. VAT)", "Returns", "Returns Received", "Sales Qty"],
+        os.path.join(AUDIT_DIR, "control_totals_sales.csv"),
+    ),
+    "spend": (
+        ["Market"],
+        ["Total Spend"],
+        os.path.join(AUDIT_DIR, "control_totals_spend.csv"),
+    ),
+}
+
+TOLERANCE = 1.0  # ✅ Slide tables round to whole currency units
+
+def record_control_totals(df, kind):
+    """Sums the measures per week and dimension at ingest and stores them. Returns the totals."""
+    dimensions, measures, path = CONTROL_TOTALS[kind]
+    dates = pd.to_datetime(df["Date"], errors="coerce")
+
+    totals = df[[c for c in dimensions if c in df.columns]].copy()
+    totals["Week Start"] = (dates - pd.to_timedelta(dates.dt.weekday, unit="D")).dt.date
+    present = [c for c in measures if c in df.columns]
+    for column in present:
+        totals[column] = pd.to_numeric(df[column], errors="coerce")
+
+    keys = ["Week Start"] + [c for c in dimensions if c in df.columns]
+    totals = totals[dates.notna()].groupby(keys, dropna=False)[present].sum().reset_index()
+    write_table(totals, path)
+    print(f"🧾 Control totals ({kind}): {len(totals):,} cells → {path}")
+    return totals
+
+def load_control_totals(kind):
+    """Stored control totals with `Calendar Year` and `ISO Week` keys added (slide week convention)."""
+    totals = read_table(CONTROL_TOTALS[kind][2])
+    week_start = pd.to_datetime(totals["Week Start"])
+    totals["Calendar Year"] = week_start.dt.year
+    totals["ISO Week"] = week_start.dt.isocalendar().week.astype(int)
+    return totals
+
+def reconcile(expected, actual, keys, measures, check, tolerance=TOLERANCE):
+    """
+    Rolls `expected` and `actual` up to `keys` and compares each measure
+    (`measures`: expected column → actual column). Returns the cells that
+    differ by more than `tolerance`, or are missing on one side.
+    """
+    left = expected.groupby(keys, dropna=False)[list(measures)].sum()
+    right = actual.groupby(keys, dropna=False)[list(measures.values())].sum()
+    right.columns = list(measures)
+    merged = left.join(right, how="outer", lsuffix=" (expected)", rsuffix=" (actual)")
+
+    mismatches = []
+    for measure in measures:
+        cells = merged[[f"{measure} (expected)", f"{measure} (actual)"]]
+        cells.columns = ["Expected", "Actual"]
+        difference = cells["Actual"].fillna(0) - cells["Expected"].fillna(0)
+        bad = (difference.abs() > tolerance) | cells.isna().any(axis=1)
+        found = cells[bad].assign(Difference=difference[bad], Measure=measure, Check=check).reset_index()
+        found["Key"] = found[keys].astype(str).agg(" | ".join, axis=1)
+        mismatches.append(found[["Check", "Measure", "Key", "Expected", "Actual", "Difference"]])
+    return pd.concat(mismatches, ignore_index=True)
+
+def weeks_in(totals, table):
+    """Control totals restricted to the (Calendar Year, ISO Week) pairs present in `table`."""
+    weeks = table[["Calendar Year", "ISO Week"]].drop_duplicates()
+    return totals.merge(weeks, on=["Calendar Year", "ISO Week"])
@@ -185,6 +185,18 @@ def get_last_8_weeks_last_year():
 
     return last_8_weeks_last_year, full_8_week_period_last_year
 
+def week_sort_key(df, week_order, year_column="Calendar Year", week_column="ISO Week"):
+    """
+    Position of each row's (year, ISO week) in `week_order` as a Series, for
+    sorting long week tables in one pass. Weeks outside the order get `inf`
+    (sorted last). The lookup is a dict `map` on a year * 100 + week key.
+    """
+    import pandas as pd
+
+    ordinals = {float(year * 100 + week): position for position, (year, week) in enumerate(week_order)}
+    keys = pd.to_numeric(df[year_column], errors="coerce") * 100 + pd.to_numeric(df[week_column], errors="coerce")
+    return keys.map(ordinals).fillna(float("inf"))
+
 if __name__ == "__main__":
     last_8_weeks, full_8_week_period = get_last_8_weeks()
     last_8_weeks_last_year, full_8_week_period_last_year = get_last_8_weeks_last_year()
@@ -3,12 +3,13 @@ import os
 import pandas as pd
 import logging
 
-# Configure Logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-
 # Add scripts folder to import path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Configure Logging (level from REPORT_LOG_LEVEL / REPORT_QUIET)
+from calculator.report_logging import log_level
+logging.basicConfig(level=log_level(), format="%(asctime)s - %(levelname)s - %(message)s")
+
 from calculator.metrics_calculator import load_data, calculate_revenue_metrics
 from calculator.date_utils import get_last_8_weeks
 
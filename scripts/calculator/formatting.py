@@ -0,0 +1,119 @@
+"""
+Vectorised number formatting for the finalized tables.
+
+A format spec is a plain dict; every key is optional:
+
+    scale      divide by this first (1000 → "in thousands")          default 1
+    decimals   digits after the decimal point                          default 0
+    thousands  "," as thousands separator                              default False
+    suffix     appended text, e.g. "%" or " %"                         default ""
+    parens     negatives as "(12)" instead of "-12"                    default False
+    missing    text for NaN / non-numeric cells; None keeps the cell   default None
+
+`format_frame` turns a frame into display strings in one pass per spec
+(per column, per row, or one spec for the whole frame), using NumPy and
+pandas string operations instead of a Python call per value.
+`round_by_label` is the numeric counterpart for tables that are handed on
+as numbers (the Excel writers apply their own number formats): it scales
+and rounds a value column by rules matched on a label column.
+"""
+
+import numpy as np
+import pandas as pd
+
+# ✅ Specs shared by several tables
+THOUSANDS = {"scale": 1000, "thousands": True}
+WHOLE = {"thousands": True}
+PERCENT_1 = {"decimals": 1, "suffix": "%"}
+GROWTH_PARENS = {"parens": True}
+
+def to_numeric(values):
+    """Cells as floats: report text like "1,234" is parsed, anything else non-numeric becomes NaN."""
+    values = pd.Series(values)
+    if values.dtype == object:
+        values = values.astype(str).str.replace(",", "", regex=False)
+    return pd.to_numeric(values, errors="coerce")
+
+def _digits(magnitude, decimals, thousands):
+    """Non-negative floats → fixed-decimal text, optionally with thousands separators."""
+    text = pd.Series(np.char.mod(f"%.{decimals}f", magnitude), dtype=object)
+    if not thousands:
+        return text
+    parts = text.str.partition(".")
+    integer = parts[0].str.replace(r"(?<=\d)(?=(\d{3})+$)", ",", regex=True)
+    return integer + parts[1] + parts[2]
+
+def format_values(values, spec):
+    """Formats a 1-D array of cells with one spec. Returns an object array of strings."""
+    original = np.asarray(values, dtype=object)
+    numbers = to_numeric(original).to_numpy(dtype=float) / spec.get("scale", 1)
+    decimals = spec.get("decimals", 0)
+    rounded = np.round(numbers, decimals)
+    valid = np.isfinite(rounded)
+
+    text = _digits(np.abs(np.where(valid, rounded, 0)), decimals, spec.get("thousands", False)) + spec.get("suffix", "")
+    negative = valid & (rounded < 0)
+    signed = np.where(negative, ("(" + text + ")") if spec.get("parens") else ("-" + text), text)
+
+    missing = spec.get("missing")
+    fallback = original if missing is None else np.full(len(original), missing, dtype=object)
+    return np.where(valid, signed, fallback)
+
+def format_frame(df, spec=None, columns=None, rows=None):
+    """
+    Display strings for `df`. `columns` ({column: spec}) or `rows` ({index
+    label: spec}) choose the spec per column or per row; cells they do not
+    cover use `spec`, or are left as they are when `spec` is None.
+    """
+    formatted = df.copy().astype(object)
+
+    if columns is not None:
+        for column in formatted.columns:
+            column_spec = columns.get(column, spec)
+            if column_spec is not None:
+                formatted[column] = format_values(df[column].to_numpy(), column_spec)
+        return formatted
+
+    # ✅ Rows sharing a spec are formatted together as one flattened block
+    groups = {}
+    for position, label in enumerate(df.index):
+        row_spec = (rows or {}).get(label, spec)
+        if row_spec is not None:
+            groups.setdefault(id(row_spec), (row_spec, []))[1].append(position)
+    for row_spec, positions in groups.values():
+        block = df.iloc[positions].to_numpy(dtype=object)
+        formatted.iloc[positions] = format_values(block.ravel(), row_spec).reshape(block.shape)
+    return formatted
+
+def match_rule(label, rules, default=None):
+    """Spec of the first (substring, spec) rule whose substring occurs in `label`."""
+    return next((spec for needle, spec in rules if needle in str(label)), default)
+
+def round_by_label(values, labels, rules, default=None):
+    """
+    Scales and rounds `values` (numeric) with the spec matched on each row's
+    label; rows without a matching rule and no `default` are left unchanged.
+    """
+    values = pd.to_numeric(pd.Series(values), errors="coerce")
+    labels = pd.Series(labels, index=values.index)
+    result = values.copy()
+    for label in labels.unique():
+        spec = match_rule(label, rules, default)
+        if spec is None:
+            continue
+        mask = labels == label
+        result[mask] = (values[mask] / spec.get("scale", 1)).round(spec.get("decimals", 0))
+    return result
+
+def as_whole_numbers(df, columns, rows=None):
+    """
+    Casts `columns` to Python ints (for CSV output without ".0"), only in
+    the rows where the boolean `rows` mask is set (all rows by default);
+    NaN cells stay NaN.
+    """
+    block = df[columns]
+    rows = np.ones(len(df), dtype=bool) if rows is None else np.asarray(rows, dtype=bool)
+    as_int = block.notna().to_numpy() & rows[:, None]
+    integers = block.fillna(0).astype("int64").astype(object)
+    df[columns] = block.astype(object).mask(as_int, integers)
+    return df
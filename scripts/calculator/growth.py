@@ -0,0 +1,74 @@
+"""
+Vectorised growth / share / index kernel for the finalized tables.
+
+Every function works on whole CY/LY matrices (NumPy arrays or the numeric
+columns of aligned DataFrames) instead of row-wise applies:
+
+    growth_pct(cy, ly)      ((cy / ly) - 1) * 100
+    share_pct(values, total) values / total * 100 (total broadcast per column)
+    index_ratio(cy, ly)     cy / ly * 100
+
+Zero or missing denominators (and missing numerators) never raise or yield
+inf: those cells get the `fill` value instead (NaN by default, so callers
+decide how to present them — "n/m", "-", 0, ...). `align_frames` lines up
+a CY and an LY frame on their label columns, so markets or categories that
+only exist in one year get 0 in the other.
+"""
+
+import numpy as np
+import pandas as pd
+
+def _matrix(values):
+    return np.asarray(values, dtype=float)
+
+def _safe_ratio(numerator, denominator, fill):
+    """numerator / denominator where both are finite and the denominator is non-zero, else `fill`."""
+    numerator, denominator = np.broadcast_arrays(_matrix(numerator), _matrix(denominator))
+    valid = np.isfinite(numerator) & np.isfinite(denominator) & (denominator != 0)
+    ratio = np.full(numerator.shape, fill, dtype=float)
+    np.divide(numerator, denominator, out=ratio, where=valid)
+    return ratio
+
+def growth_pct(cy, ly, fill=np.nan):
+    """Year-over-year growth in percent, element-wise."""
+    ratio = _safe_ratio(cy, ly, np.nan)
+    return np.where(np.isnan(ratio), fill, (ratio - 1) * 100)
+
+def share_pct(values, total, fill=np.nan):
+    """Share of `total` in percent; a 1-D `total` is broadcast over the rows of `values`."""
+    ratio = _safe_ratio(values, total, np.nan)
+    return np.where(np.isnan(ratio), fill, ratio * 100)
+
+def index_ratio(cy, ly, fill=np.nan):
+    """CY indexed on LY (LY = 100), element-wise."""
+    ratio = _safe_ratio(cy, ly, np.nan)
+    return np.where(np.isnan(ratio), fill, ratio * 100)
+
+def align_frames(current, last_year, keys, columns, how="left"):
+    """
+    Aligns two frames on their label columns `keys`.
+
+    how="left"   rows of `current` only (LY rows without a CY match are dropped)
+    how="outer"  every label seen in either year, CY order first
+
+    Returns (labels frame, CY matrix, LY matrix) with `columns` as numeric
+    matrices; labels missing from one year are filled with 0.
+    """
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    labels = current[keys]
+    if how == "outer":
+        labels = pd.concat([labels, last_year[keys]]).drop_duplicates()
+    labels = labels.reset_index(drop=True)
+
+    def matrix(frame):
+        numeric = frame[keys + columns].drop_duplicates(subset=keys)
+        aligned = labels.merge(numeric, on=keys, how="left")
+        return aligned[columns].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy(dtype=float)
+
+    return labels, matrix(current), matrix(last_year)
+
+def growth_frame(current, last_year, keys, columns, how="left", fill=np.nan):
+    """Growth per label and column as a DataFrame: the label columns followed by `columns`."""
+    labels, cy, ly = align_frames(current, last_year, keys, columns, how=how)
+    growth = pd.DataFrame(growth_pct(cy, ly, fill=fill), columns=columns)
+    return pd.concat([labels, growth], axis=1)
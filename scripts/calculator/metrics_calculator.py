@@ -1,5 +1,7 @@
 import sys
 import os
+import copy
+import threading
 import pandas as pd
 
 # Ensure correct import paths
@@ -7,49 +9,100 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.date_utils import get_latest_full_week
 from calculator.orders import deduplicate_orders  # ✅ Importing correct order calculation
+from calculator.tracing import traced
 
 # ✅ Get absolute path dynamically
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-DATA_PATH = os.path.join(BASE_DIR, "data", "formatted", "weekly_data_formatted.csv")
-SPEND_DATA_PATH = os.path.join(BASE_DIR, "data", "formatted", "marketing_spend_formatted.csv")
+# ✅ REPORT_DATA_DIR points the loaders at another data root (e.g. a synthetic benchmark dataset)
+DATA_DIR = os.environ.get("REPORT_DATA_DIR") or os.path.join(BASE_DIR, "data")
+DATA_PATH = os.path.join(DATA_DIR, "formatted", "weekly_data_formatted.csv")
+SPEND_DATA_PATH = os.path.join(DATA_DIR, "formatted", "marketing_spend_formatted.csv")
+SESSION_DATA_PATH = os.path.join(DATA_DIR, "session_data.csv")
+
+# ✅ Process-wide dataset cache: every script run in the same interpreter shares one loaded copy
+_CACHE_LOCK = threading.Lock()
+_FRAME_CACHE = {}
+_AGGREGATE_CACHE = {}
+
+def _cached_frame(path, reader):
+    """
+    Loads `path` with `reader` once per process and returns a copy of the cached frame.
+    The file is re-read when its modification time changes (e.g. after a format step).
+    """
+    stamp = os.path.getmtime(path)
+    with _CACHE_LOCK:
+        cached = _FRAME_CACHE.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, reader(path))
+            _FRAME_CACHE[path] = cached
+    return cached[1].copy()
+
+def cached_aggregate(path, key, build):
+    """
+    Returns a copy of `build()` cached per (`path`, `key`), e.g. the product
+    cube for one week. The value is rebuilt when `path` changes on disk.
+    """
+    stamp = os.path.getmtime(path)
+    with _CACHE_LOCK:
+        cached = _AGGREGATE_CACHE.get((path, key))
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, build())
+        with _CACHE_LOCK:
+            _AGGREGATE_CACHE[(path, key)] = cached
+    return copy.deepcopy(cached[1])
+
+def clear_data_cache():
+    """Drops all cached datasets and aggregates so the next load re-reads the files."""
+    with _CACHE_LOCK:
+        _FRAME_CACHE.clear()
+        _AGGREGATE_CACHE.clear()
+
+def _read_dated_csv(path):
+    """Reads a formatted CSV and converts `Date` to date-only values."""
+    df = pd.read_csv(path, low_memory=False)
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.date
+    return df
 
+@traced("load")
 def load_data():
     """Loads revenue and marketing spend data."""
-    df = pd.read_csv(DATA_PATH, low_memory=False)
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.date
-    return df
+    return _cached_frame(DATA_PATH, _read_dated_csv)
 
+@traced("load")
 def load_spend_data():
     """Loads formatted marketing spend data."""
     if os.path.exists(SPEND_DATA_PATH):
-        spend_df = pd.read_csv(SPEND_DATA_PATH, low_memory=False)
-        spend_df["Date"] = pd.to_datetime(spend_df["Date"], errors="coerce").dt.date
-        return spend_df
+        return _cached_frame(SPEND_DATA_PATH, _read_dated_csv)
     else:
         print("⚠️ Marketing Spend file not found. Using zero values.")
         return None
 
+def _read_session_csv(path):
+    """Reads session_data.csv into the `Date`/`Sessions` layout."""
+    # Read CSV with comma separator (new format)
+    df = pd.read_csv(path)
+
+    # Rename columns to match expected format
+    df = df.rename(columns={
+        'Day': 'Date',
+        'Sessions': 'Sessions'
+    })
+
+    # Convert Date column to datetime
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+@traced("load")
 def load_session_data():
     """Load session data from session_data.csv file."""
-    BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
-    session_file = os.path.join(BASE_DIR, "data", "session_data.csv")
+    session_file = SESSION_DATA_PATH
     
     if not os.path.exists(session_file):
         print(f"⚠️ Warning: Session data file not found: {session_file}")
         return pd.DataFrame()
     
     try:
-        # Read CSV with comma separator (new format)
-        df = pd.read_csv(session_file)
-        
-        # Rename columns to match expected format
-        df = df.rename(columns={
-            'Day': 'Date',
-            'Sessions': 'Sessions'
-        })
-        
-        # Convert Date column to datetime
-        df['Date'] = pd.to_datetime(df['Date'])
+        df = _cached_frame(session_file, _read_session_csv)
         
         # No need to aggregate since data is already aggregated by date
         return df
@@ -57,6 +110,7 @@ def load_session_data():
         print(f"⚠️ Warning: Could not read session data: {e}")
         return pd.DataFrame()
 
+@traced()
 def calculate_revenue_metrics(df, start_date, end_date):
     """Calculates revenue metrics, ensuring correct channel breakdown."""
     
@@ -137,6 +191,7 @@ def calculate_revenue_metrics(df, start_date, end_date):
         "Wholesale Net Revenue": wholesale_revenue,
     }
 
+@traced()
 def calculate_marketing_spend(spend_df, start_date, end_date, online_revenue, new_customers):
     """Calculates Online Marketing Spend, Cost of Sale (COS%), and nCAC."""
 
@@ -175,22 +230,22 @@ def calculate_growth(current_revenue, last_year_revenue):
         print(f"❌ Error calculating growth: {e}")
         return 0
 
-### ✅ **Get latest full week and print metrics**
-latest_week_values = get_latest_full_week()
+### ✅ **Get latest full week and print metrics** (only when run directly, so importing stays cheap)
+if __name__ == "__main__":
+    latest_week_values = get_latest_full_week()
 
-# Ensure correct unpacking of values
-if isinstance(latest_week_values, dict) and "current_week" in latest_week_values:
-    latest_week_start, latest_week_end = latest_week_values["current_week"]
-else:
-    raise ValueError("❌ Unexpected output format from `get_latest_full_week()`")
-
-# ✅ Load data
-data = load_data()
-spend_data = load_spend_data()
+    # Ensure correct unpacking of values
+    if isinstance(latest_week_values, dict) and "current_week" in latest_week_values:
+        latest_week_start, latest_week_end = latest_week_values["current_week"]
+    else:
+        raise ValueError("❌ Unexpected output format from `get_latest_full_week()`")
 
-# ✅ Calculate Revenue Metrics (Including Retail & Wholesale)
-revenue_metrics = calculate_revenue_metrics(data, latest_week_start, latest_week_end)
+    # ✅ Load data
+    data = load_data()
+    spend_data = load_spend_data()
 
-# ✅ Get Unique Order Count
-total_orders = deduplicate_orders(data, latest_week_start, latest_week_end)
+    # ✅ Calculate Revenue Metrics (Including Retail & Wholesale)
+    revenue_metrics = calculate_revenue_metrics(data, latest_week_start, latest_week_end)
 
+    # ✅ Get Unique Order Count
+    total_orders = deduplicate_orders(data, latest_week_start, latest_week_end)
@@ -0,0 +1,108 @@
+import sys
+import os
+import pandas as pd
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.tracing import traced
+
+# ✅ Segment definitions for the top-product slides (column → required value)
+PRODUCT_SEGMENTS = {
+    "new": {"Sales Channel": "Online", "New/Returning Customer": "New"},
+    "returning": {"Channel Group": "Online", "New/Returning Customer": "Returning"},
+    "men": {"Channel Group": "Online", "Gender": "MEN"},
+    "women": {"Channel Group": "Online", "Gender": "WOMEN"},
+}
+
+PRODUCT_KEYS = ["Gender", "Category", "Product", "Color"]
+VALUE_COLUMNS = ["Gross Revenue", "Sales Qty"]
+FINAL_COLUMNS = ["Rank"] + PRODUCT_KEYS + VALUE_COLUMNS + ["SOB%"]
+
+def _normalize_columns(df):
+    """Maps the column name variants seen in Weekly_Data exports onto the product keys."""
+    renames = {}
+    if "Category" not in df.columns and "Product Category" in df.columns:
+        renames["Product Category"] = "Category"
+    if "Gross Revenue" not in df.columns and "Gross Revenue (ex. VAT)" in df.columns:
+        renames["Gross Revenue (ex. VAT)"] = "Gross Revenue"
+    return df.rename(columns=renames) if renames else df
+
+@traced()
+def build_product_cube(df, start_date, end_date, segments=PRODUCT_SEGMENTS):
+    """
+    Scans the dataset once for the given date range and aggregates Gross Revenue
+    and Sales Qty per product and per value of every segment-defining column.
+    Rows with "-" in any product key are dropped, as in the old finalized scripts.
+    """
+    df = _normalize_columns(df)
+    # ✅ Segment columns that are product keys already (e.g. Gender) are grouped on once
+    dimension_columns = sorted({col for rules in segments.values() for col in rules} - set(PRODUCT_KEYS))
+    missing = set(PRODUCT_KEYS + VALUE_COLUMNS + dimension_columns) - set(df.columns)
+    if missing:
+        raise KeyError(f"❌ Missing required columns in dataset: {missing}")
+
+    week_df = df.loc[(df["Date"] >= start_date) & (df["Date"] <= end_date), PRODUCT_KEYS + dimension_columns + VALUE_COLUMNS]
+    week_df = week_df[~(week_df[PRODUCT_KEYS] == "-").any(axis=1)]
+
+    week_df = week_df.assign(**{col: pd.to_numeric(week_df[col], errors="coerce") for col in VALUE_COLUMNS})
+    # ✅ dropna=False keeps rows with a missing segment column (e.g. blank Sales Channel) for the other segments
+    return week_df.groupby(PRODUCT_KEYS + dimension_columns, as_index=False, sort=False, dropna=False)[VALUE_COLUMNS].sum()
+
+@traced()
+def rank_top_products(df, start_date, end_date, segments=PRODUCT_SEGMENTS, top_n=20):
+    """
+    Ranks the top products for every segment in a single pass over the date range.
+
+    Returns a dict of segment → DataFrame with `Rank`, the product keys,
+    Gross Revenue, Sales Qty and SOB% (numeric), followed by the
+    "Top 20 Total" and "Grand Total" rows.
+    """
+    cube = build_product_cube(df, start_date, end_date, segments)
+
+    # ✅ Stack the (small) cube once per segment and group by (Segment, product)
+    pieces = []
+    for segment, rules in segments.items():
+        mask = pd.Series(True, index=cube.index)
+        for column, value in rules.items():
+            mask &= cube[column] == value
+        pieces.append(cube.loc[mask, PRODUCT_KEYS + VALUE_COLUMNS].assign(Segment=segment))
+
+    stacked = pd.concat(pieces, ignore_index=True)
+    grouped = stacked.groupby(["Segment"] + PRODUCT_KEYS, as_index=False)[VALUE_COLUMNS].sum()
+
+    # ✅ Grand totals per segment (denominator for SOB%)
+    grand_totals = grouped.groupby("Segment")[VALUE_COLUMNS].sum()
+    grand_revenue = grouped["Segment"].map(grand_totals["Gross Revenue"])
+    grouped["SOB%"] = (grouped["Gross Revenue"] / grand_revenue.where(grand_revenue != 0)) * 100
+
+    # ✅ Top N per segment, ranked by Gross Revenue
+    top = (
+        grouped.sort_values(["Segment", "Gross Revenue"], ascending=[True, False], kind="stable")
+        .groupby("Segment", sort=False)
+        .head(top_n)
+    )
+    top.insert(0, "Rank", top.groupby("Segment").cumcount() + 1)
+    top_totals = top.groupby("Segment")[VALUE_COLUMNS + ["SOB%"]].sum(min_count=1)
+
+    results = {}
+    for segment in segments:
+        segment_top = top[top["Segment"] == segment].drop(columns="Segment")
+        grand = grand_totals.loc[segment] if segment in grand_totals.index else pd.Series(0, index=VALUE_COLUMNS)
+        top_total = top_totals.loc[segment] if segment in top_totals.index else pd.Series(0, index=VALUE_COLUMNS + ["SOB%"])
+
+        total_rows = pd.DataFrame([
+            {
+                "Rank": f"Top {top_n} Total", "Gender": "", "Category": "", "Product": "", "Color": "",
+                "Gross Revenue": top_total["Gross Revenue"], "Sales Qty": top_total["Sales Qty"],
+                "SOB%": top_total["SOB%"] if grand["Gross Revenue"] else None,
+            },
+            {
+                "Rank": "Grand Total", "Gender": "", "Category": "", "Product": "", "Color": "",
+                "Gross Revenue": grand["Gross Revenue"], "Sales Qty": grand["Sales Qty"],
+                "SOB%": 100.0,
+            },
+        ])
+        results[segment] = pd.concat([segment_top, total_rows], ignore_index=True)[FINAL_COLUMNS]
+
+    return results
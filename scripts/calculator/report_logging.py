@@ -0,0 +1,82 @@
+"""
+Shared, leveled logging for the report scripts.
+
+    from calculator.report_logging import get_logger, log_frame
+    logger = get_logger(__name__)
+    logger.info("📆 Processing %s: Week %s", label, week)   # formatted only if INFO is on
+    log_frame(logger, "Revenue breakdown", df)             # rendered only if frame dumps are on
+
+Environment:
+    REPORT_LOG_LEVEL   DEBUG / INFO (default) / WARNING / ERROR
+    REPORT_QUIET=1     production mode: warnings and errors only
+    REPORT_DEBUG_FRAMES  comma-separated module names (or "all") whose
+                         DataFrame dumps are printed at INFO, e.g. "prepare_gender_category"
+"""
+
+import os
+import sys
+import logging
+
+LOGGER_ROOT = "report"
+_configured = False
+
+def log_level():
+    """Level from REPORT_QUIET / REPORT_LOG_LEVEL (INFO by default)."""
+    if os.environ.get("REPORT_QUIET", "").lower() in ("1", "true", "yes"):
+        return logging.WARNING
+    level = os.environ.get("REPORT_LOG_LEVEL", "INFO").upper()
+    return getattr(logging, level, logging.INFO)
+
+def _frame_modules():
+    return {m.strip() for m in os.environ.get("REPORT_DEBUG_FRAMES", "").split(",") if m.strip()}
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to the current `sys.stdout`, which runners may redirect per step or per week."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure(level=None):
+    """Sets up the shared "report" logger once (plain messages on stdout, like the old prints)."""
+    global _configured
+    root = logging.getLogger(LOGGER_ROOT)
+    if not _configured:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        root.addHandler(handler)
+        root.propagate = False
+        _configured = True
+    root.setLevel(level if level is not None else log_level())
+    return root
+
+def get_logger(name):
+    """Logger for a script or module; `__main__` scripts should pass their file name."""
+    if not _configured:
+        configure()
+    short_name = os.path.splitext(os.path.basename(name))[0] if name.endswith(".py") else name.split(".")[-1]
+    return logging.getLogger(f"{LOGGER_ROOT}.{short_name}")
+
+def frames_enabled(logger):
+    """True if DataFrame dumps were requested for this logger's module."""
+    modules = _frame_modules()
+    return bool(modules) and ("all" in modules or logger.name.split(".")[-1] in modules)
+
+class _LazyFrame:
+    """Renders a DataFrame only when the log record is actually emitted."""
+
+    def __init__(self, df, rows, index):
+        self.df, self.rows, self.index = df, rows, index
+
+    def __str__(self):
+        df = self.df.head(self.rows) if self.rows else self.df
+        return df.to_string(index=self.index) if hasattr(df, "to_string") else str(df)
+
+def log_frame(logger, title, df, rows=None, index=False):
+    """Debug dump of a DataFrame, printed only when REPORT_DEBUG_FRAMES includes the module."""
+    if frames_enabled(logger):
+        logger.info("\n📊 **%s:**\n%s", title, _LazyFrame(df, rows, index))
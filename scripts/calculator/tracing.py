@@ -0,0 +1,215 @@
+"""
+Lightweight tracing for pipeline steps and key calculator calls.
+
+Spans record wall time, CPU time of the running thread and rows in/out.
+Memory is per process, not per span: `rss_delta_mb` is the change in the
+process's current RSS over the span (Linux only; in thread mode it includes
+whatever other threads allocated meanwhile) and `process_peak_rss_mb` is the
+process's peak so far. Only a step run in its own forkserver child gets a
+peak of its own (`step_peak_rss_mb`, set by the runner). Tracing is off until
+`enable()` is called, so the decorated calculator functions cost one flag
+check when nobody is tracing.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+TRACE_DIR = os.path.join(BASE_DIR, "data", ".build")
+TRACE_FILE = os.path.join(TRACE_DIR, "trace.json")
+CHROME_TRACE_FILE = os.path.join(TRACE_DIR, "trace_chrome.json")
+
+_enabled = False
+_origin = time.perf_counter()
+_events = []
+_events_lock = threading.Lock()
+_local = threading.local()
+
+def enable():
+    """Starts a fresh trace."""
+    global _enabled, _origin
+    with _events_lock:
+        _events.clear()
+    _origin = time.perf_counter()
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far in MB (None where `resource` is unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ✅ ru_maxrss is bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+def current_rss_mb():
+    """Current resident set size of this process in MB (Linux only, else None)."""
+    try:
+        with open("/proc/self/statm", "r") as file:
+            pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+def count_rows(obj):
+    """Row count of a DataFrame/Series-like result, else None."""
+    try:
+        return len(obj) if hasattr(obj, "shape") else None
+    except TypeError:
+        return None
+
+@contextmanager
+def trace_span(name, category="step", rows_in=None):
+    """
+    Records one span. The yielded dict may be updated with `rows_out` (or
+    `rows_in`); rows loaded by nested "load" spans are added to the parent's
+    rows_in when it has none of its own.
+    """
+    if not _enabled:
+        yield {}
+        return
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+
+    span = {"name": name, "cat": category, "rows_in": rows_in, "rows_out": None, "loaded_rows": 0}
+    stack.append(span)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    rss_start = current_rss_mb()
+    try:
+        yield span
+    finally:
+        stack.pop()
+        span["start_s"] = round(wall_start - _origin, 6)
+        span["wall_s"] = round(time.perf_counter() - wall_start, 6)
+        span["cpu_s"] = round(time.thread_time() - cpu_start, 6)
+        rss_end = current_rss_mb()
+        span["rss_delta_mb"] = round(rss_end - rss_start, 1) if rss_start is not None and rss_end is not None else None
+        span["process_peak_rss_mb"] = peak_rss_mb()
+        span["thread"] = threading.current_thread().name
+        span["pid"] = os.getpid()
+        if span["rows_in"] is None and span["loaded_rows"]:
+            span["rows_in"] = span["loaded_rows"]
+        if stack and category == "load" and span["rows_out"]:
+            stack[-1]["loaded_rows"] += span["rows_out"]
+        del span["loaded_rows"]
+        with _events_lock:
+            _events.append(span)
+
+def traced(category="calculator"):
+    """
+    Decorator for calculator functions: rows_in is the length of the first
+    DataFrame argument, rows_out the length of a DataFrame result.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            rows_in = next((count_rows(arg) for arg in args if count_rows(arg) is not None), None)
+            with trace_span(func.__qualname__, category, rows_in) as span:
+                result = func(*args, **kwargs)
+                span["rows_out"] = count_rows(result)
+                return result
+        return wrapper
+    return decorator
+
+def get_events():
+    with _events_lock:
+        return list(_events)
+
+def elapsed(perf_counter_value):
+    """Seconds between the start of the trace and a `time.perf_counter()` value."""
+    return perf_counter_value - _origin
+
+def add_events(events, offset_s=0.0):
+    """
+    Merges spans recorded elsewhere (e.g. in worker processes). `offset_s`
+    shifts their start times onto this trace's clock.
+    """
+    if offset_s:
+        events = [dict(event, start_s=round(event["start_s"] + offset_s, 6)) for event in events]
+    with _events_lock:
+        _events.extend(events)
+
+def write_trace(trace_file=TRACE_FILE, chrome_file=CHROME_TRACE_FILE):
+    """Writes the spans as JSON and as a Chrome trace (open in chrome://tracing or ui.perfetto.dev)."""
+    events = sorted(get_events(), key=lambda e: e["start_s"])
+    os.makedirs(os.path.dirname(trace_file), exist_ok=True)
+    with open(trace_file, "w", encoding="utf-8") as file:
+        json.dump(events, file, indent=1)
+
+    thread_ids = {}
+    chrome_events = []
+    for event in events:
+        tid = thread_ids.setdefault((event["pid"], event["thread"]), len(thread_ids) + 1)
+        chrome_events.append({
+            "name": event["name"],
+            "cat": event["cat"],
+            "ph": "X",
+            "ts": int(event["start_s"] * 1e6),
+            "dur": int(event["wall_s"] * 1e6),
+            "pid": event["pid"],
+            "tid": tid,
+            "args": {k: event.get(k) for k in ("cpu_s", "rss_delta_mb", "step_peak_rss_mb", "process_peak_rss_mb", "rows_in", "rows_out")},
+        })
+    for (pid, thread), tid in thread_ids.items():
+        chrome_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+    with open(chrome_file, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": chrome_events, "displayTimeUnit": "ms"}, file)
+
+    print(f"\n🧭 **Trace saved to:** {trace_file}")
+    print(f"🧭 **Chrome/Perfetto trace saved to:** {chrome_file}")
+
+def summarize(top=10, events=None):
+    """
+    Returns the top offenders as rows of
+    (name, category, calls, wall_s, cpu_s, rss_delta_mb, step_peak_rss_mb, rows_in, rows_out).
+    Steps are listed individually; calculator calls are aggregated per function.
+    The largest RSS delta is kept; the step peak is only known for forkserver children.
+    """
+    totals = {}
+    for event in events if events is not None else get_events():
+        row = totals.setdefault((event["name"], event["cat"]), [0, 0.0, 0.0, None, None, 0, 0])
+        row[0] += 1
+        row[1] += event["wall_s"]
+        row[2] += event["cpu_s"]
+        if event.get("rss_delta_mb") is not None:
+            row[3] = max(row[3] if row[3] is not None else event["rss_delta_mb"], event["rss_delta_mb"])
+        if event.get("step_peak_rss_mb") is not None:
+            row[4] = max(row[4] or 0, event["step_peak_rss_mb"])
+        row[5] += event["rows_in"] or 0
+        row[6] += event["rows_out"] or 0
+    ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    return [(name, cat, *values) for (name, cat), values in ranked]
+
+def print_summary(top=10):
+    """Prints the `top` spans by total wall time."""
+    rows = summarize(top)
+    if not rows:
+        return
+    print(f"\n🐢 **Top {len(rows)} offenders by wall time**")
+    print(f"{'Name':<40} {'Kind':<10} {'Calls':>6} {'Wall s':>9} {'CPU s':>9} {'RSS Δ MB':>9} {'Peak MB':>9} {'Rows in':>11} {'Rows out':>11}")
+    for name, cat, calls, wall, cpu, delta, peak, rows_in, rows_out in rows:
+        delta_text = f"{delta:+.0f}" if delta is not None else "-"
+        peak_text = f"{peak:.0f}" if peak is not None else "-"
+        print(f"{name[:40]:<40} {cat:<10} {calls:>6} {wall:>9.2f} {cpu:>9.2f} {delta_text:>9} {peak_text:>9} {rows_in:>11,} {rows_out:>11,}")
+    print("   RSS Δ: process RSS change over the span (Linux); Peak: per step, forkserver mode only")
@@ -1,41 +1,19 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
-
-def close_excel():
-    """Attempts to close any open instances of Excel before updating the file."""
-    if platform.system() == "Windows":
-        os.system("taskkill /IM excel.exe /F")
-    elif platform.system() == "Darwin":  # macOS
-        os.system("pkill -f 'Microsoft Excel'")
-    elif platform.system() == "Linux":
-        os.system("pkill -f 'libreoffice'")
-    
-    time.sleep(2)  # Wait to ensure Excel has fully closed
 
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-def open_excel(file_path):
-    """Opens the Excel file after updating to ensure the user sees the latest version."""
-    print("\n📂 **Opening Excel file...**")
-    
-    if platform.system() == "Darwin":  # macOS
-        os.system(f"open '{file_path}'")
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
+from calculator.artifacts import read_table
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
 
+logger = get_logger(__file__)
 
 def update_contribution_excel():
     """Updates the Excel sheet 'contribution' with finalized Contribution data, formatting numbers in thousands."""
 
-    # ✅ Close Excel before updating
-    print("\n🛑 Closing Excel to ensure file is not locked...")
-    close_excel()
-
     # ✅ Define file paths
     BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
     EXCEL_FILE = os.path.join(BASE_DIR, "data", "weekly_report.xlsm")
@@ -45,13 +23,8 @@ def update_contribution_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    # ✅ Detect separator used in CSV ("," or ";")
-    with open(CSV_FILE, "r", encoding="utf-8") as file:
-        first_line = file.readline()
-    sep = ";" if ";" in first_line else ","
-
-    # ✅ Load the data from CSV
-    df_raw = pd.read_csv(CSV_FILE, sep=sep, decimal=",", dtype=str)
+    # ✅ Load the typed final table (numbers arrive as numbers, missing values as NaN)
+    df_raw = read_table(CSV_FILE)
 
     # ✅ Debug: Print loaded column names
     print("\n🔍 **Loaded Column Names:**")
@@ -70,12 +43,9 @@ def update_contribution_excel():
     # ✅ Extract ISO Week column names (All numeric columns)
     iso_week_cols = [col for col in df_raw.columns if col.isdigit()]
     
-    # ✅ Convert all numeric values back to float/int and format in thousands
+    # ✅ Revenue values in thousands (the typed table is numeric already)
     df_parsed = df_raw.copy()
-    for col in iso_week_cols:
-        df_parsed[col] = df_parsed[col].str.replace(",", ".")  # Ensure correct float parsing
-        df_parsed[col] = pd.to_numeric(df_parsed[col], errors="coerce")  # Convert to number
-        df_parsed[col] = df_parsed[col] / 1000  # ✅ Convert revenue values to thousands
+    df_parsed[iso_week_cols] = df_parsed[iso_week_cols] / 1000
 
     # ✅ Ensure "Last Year" appears first
     df_parsed["Year"] = pd.Categorical(df_parsed["Year"], categories=["Last Year", "Current Year"], ordered=True)
@@ -89,11 +59,10 @@ def update_contribution_excel():
         print("✅ All required category data is included.")
 
     # ✅ Debug: Print the DataFrame before writing to Excel
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_parsed.to_string(index=False))
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_parsed)
 
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     
     ws_name = "contribution"
     if ws_name not in wb.sheetnames:
@@ -142,13 +111,13 @@ def update_contribution_excel():
 
 
     # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, ws_name)
+    close_workbook(wb)
 
     print("\n✅ Excel successfully updated with Contribution data (formatted in thousands)!")
 
-    # ✅ Open Excel after updating
-    open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
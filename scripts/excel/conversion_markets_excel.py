@@ -1,8 +1,15 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.artifacts import read_table
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def update_conversion_markets_excel():
     """Updates the Excel sheet 'conversion_markets' with finalized conversion rate data and opens it."""
@@ -19,12 +26,8 @@ def update_conversion_markets_excel():
     if not os.path.exists(CSV_FILE):
         raise FileNotFoundError(f"❌ CSV file not found: {CSV_FILE}")
 
-    # ✅ Load CSV with proper separator detection
-    with open(CSV_FILE, "r", encoding="utf-8") as file:
-        first_line = file.readline()
-    sep = ";" if ";" in first_line else ","
-
-    df_raw = pd.read_csv(CSV_FILE, sep=";", decimal=",", dtype=str)
+    # ✅ Load the typed final table (numbers arrive as numbers, missing values as NaN)
+    df_raw = read_table(CSV_FILE)
 
     print("\n🔍 **Loaded Column Names:**")
     print(df_raw.columns.tolist())
@@ -43,17 +46,12 @@ def update_conversion_markets_excel():
 
     print(f"\n📊 **ISO Week Columns Found:** {iso_week_cols}")
 
-    # ✅ Parse numeric columns (convert % strings to numeric values)
-    for col in iso_week_cols:
-        df_raw[col] = df_raw[col].apply(lambda x: float(x.replace('%', '')) if isinstance(x, str) and '%' in x else x)
-
     df_parsed = df_raw[["Market", "Year"] + iso_week_cols].copy()
 
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_parsed.to_string(index=False))
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_parsed)
 
     # ✅ Load Excel workbook
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     ws = wb["conversion_markets"]
 
     # ✅ Clear existing data but preserve headers/formatting
@@ -104,41 +102,15 @@ def update_conversion_markets_excel():
                 print(f" → Kept as text: '{cell.value}'")
 
     # ✅ Save Excel file
-    wb.save(EXCEL_FILE)
+    save_workbook(wb, EXCEL_FILE, "conversion_markets")
     
     # ✅ Close workbook to release file locks
-    wb.close()
+    close_workbook(wb)
     
     print("\n✅ Excel file saved and updated with **ALL** conversion markets data!")
 
-    # ✅ Close any existing Excel windows and reopen file for fresh view
-    print("\n📂 **Closing existing Excel windows and opening updated file...**")
-    
-    try:
-        if platform.system() == "Darwin":  # macOS
-            os.system("pkill -f 'Microsoft Excel' 2>/dev/null || true")
-            os.system("sleep 2")  # Wait a moment for process to terminate
-            os.system(f"open '{EXCEL_FILE}'")
-        elif platform.system() == "Windows":  # Windows
-            os.system("system(\"taskkill /F /IM EXCEL.EXE 2>nul || echo Excel not running\")")
-            subprocess.run(["start", "/wait", "excel", EXCEL_FILE], shell=True)
-        elif platform.system() == "Linux":  # Linux
-            os.system("pkill -f excel 2>/dev/null || true")
-            os.system(f"xdg-open '{EXCEL_FILE}'")
-        else:
-            print("⚠️ Unknown platform, cannot auto-open Excel")
-    except Exception as e:
-        print(f"⚠️ Warning: Could not close existing Excel: {e}")
-        # Fallback: try to open anyway
-        try:
-            if platform.system() == "Darwin":
-                os.system(f"open '{EXCEL_FILE}'")
-            elif platform.system() == "resource://org.mozilla.uriloader/":
-                subprocess.run(["start", "excel", EXCEL_FILE], shell=True)
-            elif platform.system() == "Linux":
-                os.system(f"xdg-open '{EXCEL_FILE}'")
-        except:
-            print(f"⚠️ Could not open Excel automatically. Please manually open: {EXCEL_FILE}")
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 if __name__ == "__main__":
     update_conversion_markets_excel()
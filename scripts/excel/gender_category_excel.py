@@ -1,40 +1,14 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
-
-def close_excel():
-    """Closes Excel to ensure the latest version of the file can be updated."""
-    print("\n🛑 **Closing Excel to ensure latest version is used...**")
-    
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM excel.exe")
-    elif platform.system() == "Darwin":  # macOS
-        while True:
-            # Check if Excel is running
-            running = os.system("pgrep -f 'Microsoft Excel' > /dev/null") == 0
-            if not running:
-                break  # Exit loop if Excel is fully closed
-            os.system("pkill -f 'Microsoft Excel'")  # Kill Excel
-            time.sleep(1)  # Wait before checking again
-
-    time.sleep(2)  # ✅ Ensures all processes are closed before reopening
-
-def open_excel(file_path):
-    """Opens the updated Excel file and ensures it launches successfully."""
-    print("\n📂 **Opening updated Excel file...**")
-    
-    if platform.system() == "Darwin":  # macOS
-        os.system(f"open '{file_path}'")
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
-    
-    time.sleep(2)  # ✅ Ensure Excel has time to fully open before the script exits
-    print("\n✅ **Excel file opened successfully!**")
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def update_gender_category_excel():
     """Inserts the finalized gender-category revenue data into the Excel sheet without modifying the order."""
@@ -48,8 +22,6 @@ def update_gender_category_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    # ✅ Close Excel before updating
-    close_excel()
 
     # ✅ Load the data from CSV **as it is**
     df_raw = pd.read_csv(CSV_FILE)
@@ -66,11 +38,10 @@ def update_gender_category_excel():
         df_raw[col] = df_raw[col] / 1000  # ✅ Convert revenue values to thousands
 
     # ✅ Debug: Print the DataFrame before writing to Excel
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_raw.to_string(index=False))
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_raw)
 
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     
     ws_name = "gender_category"
     if ws_name not in wb.sheetnames:
@@ -110,13 +81,13 @@ def update_gender_category_excel():
                 cell.value = val
 
     # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, ws_name)
+    close_workbook(wb)
 
     print("\n✅ Excel successfully updated with Gender & Category Revenue data!")
 
-    # ✅ Open Excel after update
-    open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
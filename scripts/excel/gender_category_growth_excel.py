@@ -1,29 +1,14 @@
-
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
-
-def close_excel():
-    """Closes Excel to ensure the latest version of the file can be updated."""
-    print("\n🛑 **Closing Excel to ensure latest version is used...**")
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM excel.exe")
-    elif platform.system() == "Darwin":  # macOS
-        os.system("pkill -f 'Microsoft Excel'")
-    time.sleep(2)  # ✅ Ensure Excel fully closes before proceeding
-
-def open_excel(file_path):
-    """Opens the updated Excel file."""
-    print("\n📂 **Opening updated Excel file...**")
-    if platform.system() == "Darwin":  # macOS
-        subprocess.Popen(["open", file_path])
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def update_gender_category_growth_excel():
     """Inserts the finalized gender-category growth data into the Excel sheet at column 13, row 5."""
@@ -37,8 +22,6 @@ def update_gender_category_growth_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    # ✅ Close Excel before updating
-    close_excel()
 
     # ✅ Load the data from CSV
     df_growth = pd.read_csv(CSV_FILE)
@@ -55,11 +38,10 @@ def update_gender_category_growth_excel():
         df_growth[col] = df_growth[col].round().astype("Int64")  # Keeps NaN as <NA> instead of converting to float
 
     # ✅ Debug: Print the DataFrame before writing to Excel
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_growth.to_string(index=False))
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_growth)
 
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     
     ws_name = "gender_category"
     if ws_name not in wb.sheetnames:
@@ -110,13 +92,13 @@ def update_gender_category_growth_excel():
                     cell.value = "-"  # ✅ Replace 0, NaN, or "<NA>" with "-"
 
     # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, ws_name)
+    close_workbook(wb)
 
     print("\n✅ Excel successfully updated with Gender & Category Growth data!")
 
-    # ✅ Open Excel after update
-    open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
@@ -1,41 +1,14 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
-
-
-def is_excel_open():
-    """Checks if Excel is currently running."""
-    if platform.system() == "Windows":
-        tasklist = os.popen('tasklist').read().lower()
-        return "excel.exe" in tasklist
-    elif platform.system() == "Darwin":  # macOS
-        process_list = os.popen("ps aux").read()
-        return "Microsoft Excel" in process_list
-    return False
-
-
-def close_excel():
-    """Closes Excel if it's running."""
-    print("\n🛑 **Closing Excel to ensure the latest version is used...**")
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM excel.exe")
-    elif platform.system() == "Darwin":  # macOS
-        os.system("pkill -f 'Microsoft Excel'")
-    time.sleep(2)  # Ensure Excel fully closes before proceeding
-
-
-def open_excel(file_path):
-    """Opens the updated Excel file."""
-    print("\n📂 **Opening updated Excel file...**")
-    if platform.system() == "Darwin":  # macOS
-        subprocess.Popen(["open", file_path])
-    elif platform.system() == "Windows":
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 
 def update_gender_category_sob_excel():
@@ -50,10 +23,6 @@ def update_gender_category_sob_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    # ✅ Check if Excel is open and close it before updating
-    excel_was_open = is_excel_open()
-    if excel_was_open:
-        close_excel()
 
     # ✅ Load the data from CSV
     df_share = pd.read_csv(CSV_FILE, dtype=str)  # Keep values as strings
@@ -72,11 +41,10 @@ def update_gender_category_sob_excel():
         df_share[col] = df_share[col].apply(lambda x: "-" if pd.isna(x) or x in ["0", "0%"] else f"{x}%" if "%" not in str(x) else x)
 
     # ✅ Debug: Print the first few rows before writing to Excel
-    print("\n📊 **Preview of Data Before Writing to Excel:**")
-    print(df_share.head(10).to_string(index=False))
+    log_frame(logger, "Preview of Data Before Writing to Excel", df_share, rows=10)
 
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
 
     ws_name = "gender_category"
     if ws_name not in wb.sheetnames:
@@ -156,14 +124,13 @@ def update_gender_category_sob_excel():
             ws.cell(row=grand_total_row, column=c_idx, value=val)
 
     # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, ws_name)
+    close_workbook(wb)
 
     print("\n✅ Excel successfully updated with Gender & Category Share data!")
 
-    # ✅ If Excel was open before, reopen it
-    if excel_was_open:
-        open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 
 # ✅ If running directly, execute function
@@ -1,29 +1,12 @@
+import sys
 import os
-import time
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-
-def close_excel():
-    """Stänger alla Excel-processer för att säkerställa att filen kan uppdateras."""
-    if platform.system() == "Windows":
-        os.system("taskkill /f /im excel.exe")  # Windows: Stäng Excel
-    elif platform.system() == "Darwin":
-        os.system("pkill -f 'Microsoft Excel'")  # macOS: Stäng Excel
-    elif platform.system() == "Linux":
-        os.system("pkill -f 'libreoffice'")  # Linux: Stäng LibreOffice
-    print("✅ Stängde alla Excel-fönster.")
-
-def open_excel(file_path):
-    """Öppnar Excel-filen efter att den uppdaterats."""
-    print("\n📂 **Öppnar Excel-fil...**")
-    if platform.system() == "Darwin":
-        os.system(f"open '{file_path}'")
-    elif platform.system() == "Windows":
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":
-        os.system(f"xdg-open '{file_path}'")
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.artifacts import read_table
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
 
 def update_gender_excel():
     """Uppdaterar Excel-filen och säkerställer att den öppnas korrekt efter uppdatering."""
@@ -33,20 +16,12 @@ def update_gender_excel():
     EXCEL_FILE = os.path.join(BASE_DIR, "data", "weekly_report.xlsm")
     CSV_FILE = os.path.join(BASE_DIR, "data", "final", "gender_revenue_final.csv")
 
-    # ✅ Stäng Excel innan vi börjar
-    close_excel()
-    time.sleep(3)  # Vänta några sekunder för att säkerställa att Excel-processen har avslutats
-
     # ✅ Kontrollera att filen finns
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ Filen hittades inte: {EXCEL_FILE}")
 
-    # ✅ Hämta CSV-data
-    with open(CSV_FILE, "r", encoding="utf-8") as file:
-        first_line = file.readline()
-    sep = ";" if ";" in first_line else ","
-
-    df_raw = pd.read_csv(CSV_FILE, sep=sep, decimal=",", dtype=str)
+    # ✅ Load the typed final table (numbers arrive as numbers, missing values as NaN)
+    df_raw = read_table(CSV_FILE)
 
     # ✅ Säkerställ att nödvändiga kolumner finns
     expected_cols = {"Metric", "Year Type"}
@@ -59,11 +34,7 @@ def update_gender_excel():
     # ✅ Extrahera veckokolumner
     iso_week_cols = [col for col in df_raw.columns if col.isdigit()]
     
-    # ✅ Konvertera numeriska värden
     df_parsed = df_raw.copy()
-    for col in iso_week_cols:
-        df_parsed[col] = df_parsed[col].str.replace(",", ".")
-        df_parsed[col] = pd.to_numeric(df_parsed[col], errors="coerce")
 
     # ✅ Sortera "Last Year" före "Current Year"
     df_parsed["Year"] = pd.Categorical(df_parsed["Year"], categories=["Last Year", "Current Year"], ordered=True)
@@ -79,7 +50,7 @@ def update_gender_excel():
         print("✅ Alla nödvändiga metrics finns med.")
 
     # ✅ Öppna och uppdatera Excel-filen
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     ws = wb["gender"]
 
     # ✅ Definiera positioner
@@ -110,13 +81,13 @@ def update_gender_excel():
                 cell.value = val  # ✅ Behåll text
 
     # ✅ Spara och stäng filen
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, "gender")
+    close_workbook(wb)
 
     print("\n✅ Excel uppdaterad med senaste gender revenue-data!")
 
-    # ✅ Öppna Excel igen
-    open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ Kör funktionen om filen körs direkt
 if __name__ == "__main__":
@@ -1,8 +1,24 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.report_logging import get_logger, log_frame
+from calculator.artifacts import read_table
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from excel.sheet_writer import write_frame
+
+logger = get_logger(__file__)
+
+# ✅ Number format and scaling per metric (first match wins), used for numeric cells
+METRIC_FORMATS = [
+    ("Conversion Rate", "0.0%", 100),  # ✅ 1 decimal percentage
+    ("COS%", "0%", 100),               # ✅ 0 decimal percentage
+    ("Sessions", "#,##0.0", 1),        # ✅ 1 decimal number
+]
+DEFAULT_FORMAT = ("#,##0", 1)
 
 def update_online_kpis_excel():
     """Updates the Excel sheet 'online_kpis' with finalized KPI data and opens it."""
@@ -16,17 +32,10 @@ def update_online_kpis_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    # ✅ Detect separator used in CSV ("," or ";")
-    with open(CSV_FILE, "r", encoding="utf-8") as file:
-        first_line = file.readline()
-    sep = ";" if ";" in first_line else ","
-
-    # ✅ Load the data from CSV
-    df_raw = pd.read_csv(CSV_FILE, sep=sep, decimal=",", dtype=str)
+    # ✅ Load the typed final table (numbers arrive as numbers, missing values as NaN)
+    df_raw = read_table(CSV_FILE)
 
-    # ✅ Debug: Print loaded column names
-    print("\n🔍 **Loaded Column Names:**")
-    print(df_raw.columns.tolist())
+    logger.debug("\n🔍 **Loaded Column Names:** %s", df_raw.columns.tolist())
 
     # ✅ Ensure required columns exist
     expected_cols = {"Metric", "Year Type"}
@@ -39,11 +48,7 @@ def update_online_kpis_excel():
     # ✅ Extract ISO Week column names (All numeric columns)
     iso_week_cols = [col for col in df_raw.columns if col.isdigit()]
     
-    # ✅ Convert all numeric values back to float/int
     df_parsed = df_raw.copy()
-    for col in iso_week_cols:
-        df_parsed[col] = df_parsed[col].str.replace(",", ".")  # Ensure correct float parsing
-        df_parsed[col] = pd.to_numeric(df_parsed[col], errors="coerce")  # Convert to number
 
     # ✅ Ensure "Last Year" appears first
     df_parsed["Year"] = pd.Categorical(df_parsed["Year"], categories=["Last Year", "Current Year"], ordered=True)
@@ -64,89 +69,45 @@ def update_online_kpis_excel():
 
     missing_metrics = [metric for metric in required_metrics if metric not in df_parsed["Metric"].unique()]
     if missing_metrics:
-        print(f"❌ Missing metrics in data: {missing_metrics}")
+        logger.warning("❌ Missing metrics in data: %s", missing_metrics)
     else:
-        print("✅ All required metrics are included.")
+        logger.info("✅ All required metrics are included.")
 
-    # ✅ Debug: Print the DataFrame before writing to Excel
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_parsed.to_string(index=False))
+    # ✅ Opt-in dump of the data before writing (REPORT_DEBUG_FRAMES=online_kpis_excel)
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_parsed)
 
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     ws = wb["online_kpis"]
 
-    # ✅ Define starting positions dynamically
-    header_row, start_row, start_col = 5, 6, 2
+    # ✅ Define starting positions (data starts in the row below the headers)
+    header_row, start_col = 5, 2
 
-    # ✅ Clear previous data (Dynamic range)
-    max_rows = start_row + len(df_parsed)
-    max_cols = start_col + len(iso_week_cols) + 2  # +2 for "Metric" and "Year"
-    
-    for row in range(start_row, max_rows):
-        for col in range(start_col, max_cols):
-            ws.cell(row=row, column=col, value=None)
-
-    # ✅ Write headers to row 5 (including ISO Week columns)
+    # ✅ Scale percentages (stored as 0–100 in the CSV) and pick each row's number format
     headers = ["Metric", "Year"] + iso_week_cols
-    print("\n📝 **Writing Headers to Excel:**", headers)
-    for col_idx, header in enumerate(headers, start=start_col):
-        ws.cell(row=header_row, column=col_idx, value=header)
-
-    # ✅ Ensure we write all rows correctly
-    for row_idx, row_vals in enumerate(df_parsed.itertuples(index=False), start=start_row):
-        metric_name = row_vals[0]  # First column in each row is the Metric name
-        year_name = row_vals[1]  # Second column in each row is the Year
-
-        print(f"\n📝 Writing row {row_idx} → Metric: '{metric_name}' | Year: '{year_name}'")
-
-        for col_idx, val in enumerate(row_vals, start=start_col):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            col_name = headers[col_idx - start_col]  # Get column name (Metric, Year, ISO week)
-
-            print(f"   🔹 Column: {col_name} | Raw Value: {val}", end="")
-
-            if isinstance(val, (int, float)):
-                if "Conversion Rate" in metric_name:  
-                    cell.value = val / 100  # ✅ Fix percentage scaling
-                    cell.number_format = "0.0%"  # ✅ 1 decimal for Conversion Rate
-                    print(f" → Formatted as Percentage (1 decimal): {cell.value}")
-
-                elif "COS%" in metric_name:  
-                    cell.value = val / 100  # ✅ Fix percentage scaling
-                    cell.number_format = "0%"  # ✅ 0 decimals for COS%
-                    print(f" → Formatted as Percentage (0 decimals): {cell.value}")
-
-                elif "Sessions" in metric_name:
-                    cell.value = val  # ✅ Keep value as is
-                    cell.number_format = "#,##0.0"  # ✅ 1 decimal for Sessions
-                    print(f" → Formatted as Number (1 decimal): {cell.value}")
-
-                else:
-                    cell.value = val  # ✅ Directly write value as is
-                    cell.number_format = "#,##0"  # ✅ Standard number formatting
-                    print(f" → Written as Number: {cell.value}")
-
-            else:
-                cell.value = val  # ✅ Keep non-numeric values unchanged
-                print(f" → Kept as text: '{cell.value}'")
+    row_specs = [
+        next(((fmt, div) for key, fmt, div in METRIC_FORMATS if key in str(metric)), DEFAULT_FORMAT)
+        for metric in df_parsed["Metric"]
+    ]
+    scales = pd.Series([div for _, div in row_specs], index=df_parsed.index)
+    df_block = df_parsed[headers].copy()
+    df_block["Year"] = df_block["Year"].astype(str)
+    df_block[iso_week_cols] = df_block[iso_week_cols].div(scales, axis=0)
 
+    # ✅ Write headers (row 5) and data (from row 6) as one block; unchanged cells are left alone
+    written, unchanged = write_frame(
+        ws, df_block, top=header_row, left=start_col, row_formats=[fmt for fmt, _ in row_specs],
+    )
+    logger.debug("\n📝 **Wrote %s cells (%s unchanged), headers:** %s", written, unchanged, headers)
 
     # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    save_workbook(wb, EXCEL_FILE, "online_kpis")
+    close_workbook(wb)
 
-    print("\n✅ Excel successfully updated with **ALL** KPI data!")
+    logger.info("\n✅ Excel successfully updated with **ALL** KPI data!")
 
-    # ✅ Automatically open the Excel file after saving
-    print("\n📂 **Opening Excel file...**")
-    
-    if platform.system() == "Darwin":  # macOS
-        os.system(f"open '{EXCEL_FILE}'")
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", EXCEL_FILE], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{EXCEL_FILE}'")
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
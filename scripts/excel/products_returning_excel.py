@@ -1,38 +1,12 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
-
-def is_excel_open():
-    """Checks if Excel is currently running."""
-    if platform.system() == "Windows":
-        tasklist = os.popen('tasklist').read().lower()
-        return "excel.exe" in tasklist
-    elif platform.system() == "Darwin":  # macOS
-        process_list = os.popen("ps aux").read()
-        return "Microsoft Excel" in process_list
-    return False
-
-def close_excel():
-    """Closes Excel if it's running."""
-    print("\n🛑 **Closing Excel to ensure the latest version is used...**")
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM excel.exe")
-    elif platform.system() == "Darwin":  # macOS
-        os.system("pkill -f 'Microsoft Excel'")
-    time.sleep(3)  # ✅ Ensure Excel fully closes before proceeding
-
-def open_excel(file_path):
-    """Opens the updated Excel file."""
-    print("\n📂 **Opening updated Excel file...**")
-    if platform.system() == "Darwin":  # macOS
-        subprocess.Popen(["open", file_path])
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from excel.workbook_session import show_workbook
+from excel.sheet_writer import write_sheet_block
 
 def update_products_returning_excel():
     """Inserts the finalized top 20 returning customer products into the Excel sheet with formatted values."""
@@ -50,11 +24,6 @@ def update_products_returning_excel():
     if not os.path.exists(CSV_FILE):
         raise FileNotFoundError(f"❌ File not found: {CSV_FILE}")
 
-    # ✅ Check if Excel is open and close it before updating
-    excel_was_open = is_excel_open()
-    if excel_was_open:
-        close_excel()
-
     # ✅ Load the data from CSV
     df_products = pd.read_csv(CSV_FILE, dtype=str)  # Keep data as strings
 
@@ -80,48 +49,19 @@ def update_products_returning_excel():
     print(df_products.columns.tolist())
 
     # ✅ Define starting positions:
-    header_row = 5  # Headers in row 5
-    start_row = 6  # Data starts from row 6 (below header)
+    header_row = 5  # Headers in row 5, data from row 6
     start_col = 5  # Column V (22 in Excel)
 
-    # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
-    
     ws_name = "products_returning"
-    if ws_name not in wb.sheetnames:
-        raise ValueError(f"❌ Worksheet '{ws_name}' not found in {EXCEL_FILE}!")
-
-    ws = wb[ws_name]
-
-    # ✅ Clear previous data dynamically
-    max_rows = start_row + len(df_products)
-    max_cols = start_col + len(df_products.columns)
-
-    for row in range(start_row, max_rows):
-        for col in range(start_col, max_cols):
-            ws.cell(row=row, column=col, value=None)
-
-    # ✅ Write headers to row 5 (column names)
-    print("\n📝 **Writing Headers to Excel:**", df_products.columns.tolist())
-    for col_idx, header in enumerate(df_products.columns, start=start_col):
-        ws.cell(row=header_row, column=col_idx, value=header)
-
-    # ✅ Write entire DataFrame to Excel
-    for row_idx, row_vals in enumerate(df_products.itertuples(index=False), start=start_row):
-        print(f"\n📝 Writing row {row_idx} → {row_vals[:3]}...")  # Debugging: print first few columns
-
-        for col_idx, val in enumerate(row_vals, start=start_col):
-            ws.cell(row=row_idx, column=col_idx, value=val)
 
-    # ✅ Save and close the Excel file
-    wb.save(EXCEL_FILE)
-    wb.close()
+    # ✅ Write headers (row 5) and all rows as one block; only this sheet is rewritten
+    written, unchanged = write_sheet_block(EXCEL_FILE, ws_name, df_products, top=header_row, left=start_col, formats={"Sales Qty": "#,##0"})
+    print(f"\n📝 **{written} cells updated, {unchanged} unchanged**")
 
     print("\n✅ Excel successfully updated with Top 20 Returning Customer Products!")
 
-    # ✅ If Excel was open before, reopen it
-    if excel_was_open:
-        open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
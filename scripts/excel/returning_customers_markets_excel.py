@@ -1,8 +1,15 @@
+import sys
 import os
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.artifacts import read_table
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def update_returning_customers_markets_excel():
     """Updates the Excel sheet 'returning_customers_markets' with finalized returning customers data and opens it."""
@@ -14,11 +21,8 @@ def update_returning_customers_markets_excel():
     if not os.path.exists(EXCEL_FILE):
         raise FileNotFoundError(f"❌ File not found: {EXCEL_FILE}")
 
-    with open(CSV_FILE, "r", encoding="utf-8") as file:
-        first_line = file.readline()
-    sep = ";" if ";" in first_line else ","
-
-    df_raw = pd.read_csv(CSV_FILE, sep=sep, decimal=",", dtype=str)
+    # ✅ Load the typed final table (numbers arrive as numbers, missing values as NaN)
+    df_raw = read_table(CSV_FILE)
 
     print("\n🔍 **Loaded Column Names:**")
     print(df_raw.columns.tolist())
@@ -34,15 +38,11 @@ def update_returning_customers_markets_excel():
 
     print(f"\n📊 **ISO Week Columns Found:** {iso_week_cols}")
 
-    for col in iso_week_cols:
-        df_raw[col] = pd.to_numeric(df_raw[col], errors="coerce")
-
     df_parsed = df_raw[["Market", "Year"] + iso_week_cols].copy()
 
-    print("\n📊 **Final Data (Before Writing to Excel):**")
-    print(df_parsed.to_string(index=False))
+    log_frame(logger, "Final Data (Before Writing to Excel)", df_parsed)
 
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     ws = wb["returning_customers_markets"]
 
     header_row, start_row, start_col = 5, 6, 2
@@ -85,37 +85,15 @@ def update_returning_customers_markets_excel():
                 print(f" → Kept as text: '{cell.value}'")
 
     # ✅ Force Excel refresh and save
-    wb.save(EXCEL_FILE)
+    save_workbook(wb, EXCEL_FILE, "returning_customers_markets")
     
     # ✅ Force recalculation to ensure all formulas/files update
-    wb.close()
+    close_workbook(wb)
     
     print("\n✅ Excel file saved and updated with **ALL** returning customers markets data!")
 
-    # ✅ Close any existing Excel windows and reopen file
-    print("\n📂 **Closing existing Excel windows and opening updated file...**")
-    
-    # ✅ Kill any existing Excel processes to ensure clean update
-    try:
-        if platform.system() == "Darwin":  # macOS
-            os.system("pkill -f 'Microsoft Excel' 2>/dev/null || true")
-            os.system("sleep 2")  # Wait a moment
-            os.system(f"open '{EXCEL_FILE}'")
-        elif platform.system() == "Windows":  # Windows
-            os.system("taskkill /F /IM EXCEL.EXE 2>nul || echo Excel not running")
-            subprocess.run(["start", "/wait", "excel", EXCEL_FILE], shell=True)
-        elif platform.system() == "Linux":  # Linux
-            os.system("pkill -f excel 2>/dev/null || true")
-            os.system(f"xdg-open '{EXCEL_FILE}'")
-    except Exception as e:
-        print(f"⚠️ Warning: Could not close existing Excel: {e}")
-        # Fallback: try to open anyway
-        if platform.system() == "Darwin":
-            os.system(f"open '{EXCEL_FILE}'")
-        elif platform.system() == "Windows":
-            subprocess.run(["start", "excel", EXCEL_FILE], shell=True)
-        elif platform.system() == "Linux":
-            os.system(f"xdg-open '{EXCEL_FILE}'")
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""
+Bulk block writer for the Excel sheets.
+
+Writes a DataFrame (optionally with its header row) as one block starting at
+a given cell, instead of clearing and rewriting every cell one by one:
+
+    write_frame(ws, df, top=5, left=2, formats={"32": "#,##0"})
+
+- Only cells whose value (or number format) differs from what the sheet
+  already holds are assigned, so re-running an unchanged slide touches nothing.
+- Number formats come from one spec per column (or per row) and are only
+  assigned where the cell's format differs, so the style table is not
+  touched for cells that already carry the right format.
+- With `clear_to_row`, rows below the new block left over from a longer
+  previous run are emptied (only the non-empty cells).
+
+`write_sheet_block(path, sheet, df, ...)` does the same for a workbook on
+disk: inside a workbook session it writes into the shared workbook, otherwise
+it patches just that sheet's XML in the xlsm (see xlsm_patcher) instead of
+loading and re-saving the whole package through openpyxl. Either way the
+`formats` land on the same cells (numeric data cells of those columns).
+"""
+
+import math
+
+def _clean(value):
+    """NaN/NaT → None, numpy scalars → Python scalars (openpyxl stores them as-is otherwise)."""
+    if value is None:
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value != value:  # ✅ NaT / pd.NA
+        return None
+    return value
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def write_frame(ws, df, top, left, header=True, formats=None, row_formats=None, clear_to_row=None, row_height=None):
+    """
+    Writes `df` with its top-left cell at (top, left).
+
+    formats       {column name: number format} for numeric cells of that column
+    row_formats   list with one number format per data row (or None), applied to
+                  numeric cells; used where the format depends on the metric
+    clear_to_row  last row a previous block may have used; stale cells below
+                  the new block up to this row are emptied
+    row_height    height for every row of the block (set only where it differs)
+
+    Returns (cells written, cells unchanged).
+    """
+    formats = formats or {}
+    columns = list(df.columns)
+    column_formats = [formats.get(c) for c in columns]
+    rows = [columns] if header else []
+    rows += [[_clean(v) for v in row] for row in df.itertuples(index=False, name=None)]
+    first_data_row = top + (1 if header else 0)
+
+    written = unchanged = 0
+    for r, values in enumerate(rows):
+        row_idx = top + r
+        data_row = row_idx - first_data_row
+        row_format = row_formats[data_row] if row_formats is not None and data_row >= 0 else None
+        for c, value in enumerate(values):
+            cell = ws.cell(row=row_idx, column=left + c)
+            number_format = (row_format or column_formats[c]) if data_row >= 0 and _is_number(value) else None
+
+            if cell.value == value and (number_format is None or cell.number_format == number_format):
+                unchanged += 1
+                continue
+            cell.value = value
+            if number_format is not None and cell.number_format != number_format:
+                cell.number_format = number_format
+            written += 1
+
+        if row_height is not None and ws.row_dimensions[row_idx].height != row_height:
+            ws.row_dimensions[row_idx].height = row_height
+
+    # ✅ Clear leftovers of a previous, longer block (only cells that hold something)
+    for row_idx in range(top + len(rows), (clear_to_row or 0) + 1):
+        for col_idx in range(left, left + len(columns)):
+            cell = ws.cell(row=row_idx, column=col_idx)
+            if cell.value is not None:
+                cell.value = None
+                written += 1
+
+    return written, unchanged
+
+def write_sheet_block(path, sheet, df, top, left, header=True, formats=None):
+    """Writes a block into `sheet` of the workbook at `path`. Returns (cells written, cells unchanged)."""
+    from excel import workbook_session, xlsm_patcher
+
+    if workbook_session.session_active(path):
+        wb = workbook_session.open_workbook(path)
+        if sheet not in wb.sheetnames:
+            raise ValueError(f"❌ Worksheet '{sheet}' not found in {path}!")
+        counts = write_frame(wb[sheet], df, top, left, header=header, formats=formats)
+        workbook_session.save_workbook(wb, path, sheet)
+        workbook_session.close_workbook(wb)
+        return counts
+
+    # ✅ No session: patch the sheet part in place; formats go into copies of the cells' styles
+    cells = {ref: _clean(value) for ref, value in xlsm_patcher.frame_cells(df, top, left, header).items()}
+    first_data_row = top + (1 if header else 0)
+    number_formats = {}
+    for ref, value in cells.items():
+        row, col = xlsm_patcher.split_ref(ref)
+        number_format = (formats or {}).get(df.columns[col - left])
+        if number_format and row >= first_data_row and _is_number(value):
+            number_formats[ref] = number_format
+    return xlsm_patcher.patch_workbook(path, {sheet: cells}, {sheet: number_formats})
@@ -1,11 +1,11 @@
 import os
 import sys
 import pandas as pd
-import openpyxl
 
 # Add scripts directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from calculator.date_utils import get_latest_full_week
+from excel.workbook_session import open_workbook, save_workbook
 
 # 📂 Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
@@ -45,7 +45,7 @@ def update_excel_with_top_markets():
     week_numbers = week_columns.copy()  # Keep week numbers consistent
 
     # ✅ Open Excel workbook
-    wb = openpyxl.load_workbook(EXCEL_FILE_PATH, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE_PATH)
     ws = wb[SHEET_NAME]
 
     # 🎯 Update current week date in C2
@@ -93,7 +93,7 @@ def update_excel_with_top_markets():
             ws.cell(row=row_idx, column=col_idx, value=value)
 
     # ✅ Save the updated Excel file
-    wb.save(EXCEL_FILE_PATH)
+    save_workbook(wb, EXCEL_FILE_PATH, SHEET_NAME)
 
     print("\n✅ **Excel updated successfully with Revenue, Growth, and Revenue Share Data!**")
     print(f"📄 {CSV_FINAL_PATH} → C4:K20 (Revenue & 8-Week Avg.)")
@@ -1,45 +1,14 @@
 import os
 import sys
 import pandas as pd
-import openpyxl
-import platform
-import subprocess
-import time
 from datetime import datetime
 
 # Ensure correct import paths
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.date_utils import get_latest_full_week
-
-def is_excel_open():
-    """Checks if Excel is currently running."""
-    if platform.system() == "Windows":
-        tasklist = os.popen('tasklist').read().lower()
-        return "excel.exe" in tasklist
-    elif platform.system() == "Darwin":  # macOS
-        process_list = os.popen("ps aux").read()
-        return "Microsoft Excel" in process_list
-    return False
-
-def close_excel():
-    """Closes Excel if it's running."""
-    print("\n🛑 **Closing Excel to ensure the latest version is used...**")
-    if platform.system() == "Windows":
-        os.system("taskkill /F /IM excel.exe")
-    elif platform.system() == "Darwin":  # macOS
-        os.system("pkill -f 'Microsoft Excel'")
-    time.sleep(3)  # ✅ Ensure Excel fully closes before proceeding
-
-def open_excel(file_path):
-    """Opens the updated Excel file."""
-    print("\n📂 **Opening updated Excel file...**")
-    if platform.system() == "Darwin":  # macOS
-        subprocess.Popen(["open", file_path])
-    elif platform.system() == "Windows":  # Windows
-        subprocess.run(["start", "excel", file_path], shell=True)
-    elif platform.system() == "Linux":  # Linux (requires LibreOffice or Excel equivalent)
-        os.system(f"xdg-open '{file_path}'")
+from excel.workbook_session import open_workbook, save_workbook, close_workbook, show_workbook
+from excel.sheet_writer import write_frame
 
 def update_top_table():
     """Updates the 'top_table' tab with finalized metrics, growth, and YTD data."""
@@ -70,11 +39,8 @@ def update_top_table():
         if df.empty:
             raise ValueError(f"❌ {name} dataset is empty!")
 
-    # ✅ Check if Excel is open and close it before updating
-    close_excel()
-
     # ✅ Open the Excel file and select the correct sheet
-    wb = openpyxl.load_workbook(EXCEL_FILE, keep_vba=True)
+    wb = open_workbook(EXCEL_FILE)
     
     # ✅ Ensure the 'top_table' sheet exists
     sheet_name = "top_table"
@@ -115,35 +81,38 @@ def update_top_table():
         "ytd_growth": 16,   # Column P
     }
 
-    # ✅ **Clear Previous Data Before Writing**
+    # **Step 4️⃣: Write Data to Excel (one block per dataset, unchanged cells are left alone)**
+    written = unchanged = 0
+    for name, df in dataframes.items():
+        block_written, block_unchanged = write_frame(ws, df, top=start_row, left=col_mapping[name], header=False)
+        written, unchanged = written + block_written, unchanged + block_unchanged
+
+    # ✅ Empty the spacer columns between the blocks
     max_rows = start_row + len(dataframes["metrics"])
     max_cols = max(col_mapping.values()) + len(dataframes["metrics"].columns)
-
+    covered = {col_mapping[name] + offset for name, df in dataframes.items() for offset in range(len(df.columns))}
     for row in range(start_row, max_rows):
         for col in range(3, max_cols + 1):
-            ws.cell(row=row, column=col, value=None)
+            if col not in covered and ws.cell(row=row, column=col).value is not None:
+                ws.cell(row=row, column=col, value=None)
 
-    # **Step 4️⃣: Write Data to Excel**
-    for name, df in dataframes.items():
-        col_start = col_mapping[name]
-        for row_idx, metric in enumerate(df.index, start=start_row):
-            values = df.loc[metric].values
-            for col_offset, value in enumerate(values):
-                ws.cell(row=row_idx, column=col_start + col_offset, value=value)
+    print(f"📝 **{written} cells updated, {unchanged} unchanged**")
 
     # **Step 5️⃣: Adjust Row Heights**
     for row_idx in range(1, ws.max_row + 1):
-        ws.row_dimensions[row_idx].height = 30  # Uniform height
+        if ws.row_dimensions[row_idx].height != 30:
+            ws.row_dimensions[row_idx].height = 30  # Uniform height
 
     # ✅ Save the Excel file
     try:
-        wb.save(EXCEL_FILE)
-        wb.close()
+        save_workbook(wb, EXCEL_FILE, sheet_name)
+        close_workbook(wb)
         print(f"\n✅ Excel file {EXCEL_FILE} has been updated successfully!")
     except Exception as e:
         print(f"\n⚠️ Error saving Excel file: {e}")
 
-    open_excel(EXCEL_FILE)
+    # ✅ Open the workbook for review (once, at the end, during a pipeline run)
+    show_workbook(EXCEL_FILE)
 
 # ✅ If running directly, execute function
 if __name__ == "__main__":
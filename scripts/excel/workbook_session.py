@@ -0,0 +1,248 @@
+"""
+Shared access to weekly_report.xlsm for the Excel writers.
+
+Outside a session, `open_workbook` / `save_workbook` behave like the old
+per-writer `load_workbook(..., keep_vba=True)` / `wb.save(...)`, except that
+saving is atomic (temp file + rename). Inside `workbook_session(path)` the
+workbook is parsed once, every writer gets the same in-memory object, their
+saves only mark it dirty, and it is serialized once when the session ends
+(or when `flush()` is called, e.g. before a macro reads the file).
+
+Excel is never killed. If the workbook is open elsewhere (an `~$` owner file
+sits next to it, or Windows refuses the write), saves go to a staged copy
+(`.weekly_report.staged.xlsm`) that later loads build on; it is swapped in
+atomically by `promote_staged()` once the lock clears, provided the original
+is still the file the staged copy was built on. If it was saved in the
+meantime, both are kept: the staged copy is moved aside and reported. An
+owner file counts as stale (a crashed Excel) when Windows no longer enforces
+the lock, or elsewhere when it is older than REPORT_STALE_LOCK_HOURS (12).
+`show_workbook()`
+opens a viewer, but during a pipeline run (REPORT_DEFER_VIEWER=1) the runner
+opens it once at the end instead.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import subprocess
+import threading
+from contextlib import contextmanager
+import openpyxl
+
+_lock = threading.RLock()
+_sessions = {}  # ✅ abs path → {"workbook": ..., "dirty": bool, "jobs": [sheet names]}
+_reported_stale = set()
+
+STALE_LOCK_HOURS = float(os.environ.get("REPORT_STALE_LOCK_HOURS", 12))
+
+def _key(path):
+    return os.path.abspath(path)
+
+def session_active(path=None):
+    """True if a session is open (for `path`, or for any workbook)."""
+    with _lock:
+        return bool(_sessions) if path is None else _key(path) in _sessions
+
+def owner_files(path):
+    """Excel/LibreOffice owner files that mark `path` as open (Excel drops the first two characters of long names)."""
+    directory, name = os.path.split(_key(path))
+    candidates = {f"~${name}", f"~${name[2:]}", f".~lock.{name}#"}
+    return [os.path.join(directory, c) for c in sorted(candidates) if os.path.exists(os.path.join(directory, c))]
+
+def _report_stale(owners):
+    for owner in owners:
+        if owner not in _reported_stale:
+            _reported_stale.add(owner)
+            print(f"⚠️ Ignoring stale owner file {os.path.basename(owner)} (left by an application that closed or crashed)")
+
+def is_locked(path):
+    """True if another application has the workbook open; stale owner files are ignored."""
+    owners = owner_files(path)
+    if os.name == "nt" and os.path.exists(path):
+        # ✅ Windows enforces Excel's lock: opening for writing fails
+        try:
+            with open(path, "r+b"):
+                pass
+        except PermissionError:
+            return True
+        _report_stale(owners)
+        return False
+
+    stale_before = time.time() - STALE_LOCK_HOURS * 3600
+    live = [owner for owner in owners if os.path.getmtime(owner) >= stale_before]
+    _report_stale([owner for owner in owners if owner not in live])
+    return bool(live)
+
+def staged_path(path):
+    directory, name = os.path.split(_key(path))
+    stem, extension = os.path.splitext(name)
+    return os.path.join(directory, f".{stem}.staged{extension}")
+
+def _base_path(path):
+    return f"{staged_path(path)}.base.json"
+
+def _file_state(path):
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+
+def save_target(path):
+    """
+    Where a save of `path` goes: `path` itself, or its staged copy while it is
+    locked. Staging starts by recording the original the copy is based on.
+    """
+    if not is_locked(path):
+        return path
+    staged = staged_path(path)
+    if not os.path.exists(staged) and os.path.exists(path):
+        with open(_base_path(path), "w") as f:
+            json.dump(_file_state(path), f)
+    return staged
+
+def discard_staged(path):
+    """Removes the staged copy and its base record once a save to `path` supersedes them."""
+    for leftover in (staged_path(path), _base_path(path)):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+def _original_unchanged(path):
+    """True if `path` is still the file the staged copy was built on (no base record: assume so)."""
+    if not os.path.exists(_base_path(path)) or not os.path.exists(path):
+        return True
+    with open(_base_path(path)) as f:
+        base = json.load(f)
+    stat = os.stat(path)
+    if (stat.st_mtime_ns, stat.st_size) == (base["mtime_ns"], base["size"]):
+        return True
+    return _file_state(path)["sha256"] == base["sha256"]
+
+def promote_staged(path):
+    """
+    Swaps a staged copy in over `path` if the lock has cleared and the original
+    is unchanged since staging. If it was edited meanwhile, the staged copy is
+    moved aside next to it and neither is overwritten. Returns True if swapped in.
+    """
+    staged = staged_path(path)
+    if not os.path.exists(staged) or is_locked(path):
+        return False
+    if not _original_unchanged(path):
+        directory, name = os.path.split(_key(path))
+        stem, extension = os.path.splitext(name)
+        kept = os.path.join(directory, f"{stem} (staged {time.strftime('%Y%m%d-%H%M%S')}){extension}")
+        os.replace(staged, kept)
+        os.remove(_base_path(path))
+        print(f"⚠️ **{name} was saved elsewhere while changes were staged: kept both, staged changes are in {os.path.basename(kept)}**")
+        return False
+    os.replace(staged, path)
+    discard_staged(path)
+    print(f"🔁 **Lock on {os.path.basename(path)} cleared: staged changes swapped in**")
+    return True
+
+def _load(path):
+    promote_staged(path)
+    # ✅ Still locked: keep building on the staged copy rather than the stale original
+    source = staged_path(path) if os.path.exists(staged_path(path)) else path
+    return openpyxl.load_workbook(source, keep_vba=str(path).endswith(".xlsm"))
+
+def atomic_save(workbook, path):
+    """
+    Saves next to `path` and renames over it, so a crash never leaves a
+    half-written workbook. A locked workbook is left alone and the result
+    goes to its staged copy instead.
+    """
+    target = save_target(path)
+    directory, name = os.path.split(_key(path))
+    temp_file = os.path.join(directory, f".{name}.tmp{os.path.splitext(name)[1]}")
+    try:
+        workbook.save(temp_file)
+        os.replace(temp_file, target)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    if target == path:
+        # ✅ The saved workbook was built on the staged copy (if any), which is now superseded
+        discard_staged(path)
+    elif target != path:
+        print(f"🔒 **{name} is open elsewhere: saved to {os.path.basename(target)}, swapped in once it is closed**")
+
+def open_workbook(path):
+    """The session's workbook if one is open for `path`, else a freshly loaded one."""
+    with _lock:
+        session = _sessions.get(_key(path))
+        if session is not None:
+            return session["workbook"]
+    return _load(path)
+
+def save_workbook(workbook, path, sheet=None):
+    """Records a sheet-update job in the session, or saves atomically when no session is open."""
+    with _lock:
+        session = _sessions.get(_key(path))
+        if session is not None and session["workbook"] is workbook:
+            session["dirty"] = True
+            if sheet:
+                session["jobs"].append(sheet)
+            return
+    atomic_save(workbook, path)
+
+def close_workbook(workbook):
+    """Closes a workbook unless it belongs to an open session."""
+    with _lock:
+        if any(session["workbook"] is workbook for session in _sessions.values()):
+            return
+    workbook.close()
+
+def flush(path):
+    """Writes the session's pending changes to disk now (no-op if nothing changed)."""
+    with _lock:
+        session = _sessions.get(_key(path))
+        if session is None or not session["dirty"]:
+            return False
+        atomic_save(session["workbook"], path)
+        jobs = ", ".join(session["jobs"]) or "unnamed sheets"
+        print(f"\n💾 **Saved {os.path.basename(path)} once for {len(session['jobs']) or 'all'} sheet updates ({jobs})**")
+        session["dirty"] = False
+        session["jobs"] = []
+        return True
+
+@contextmanager
+def workbook_session(path):
+    """Opens `path` once for all writers in this process and saves it once on exit."""
+    key = _key(path)
+    with _lock:
+        outer = _sessions.get(key)
+        if outer is None:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"❌ File not found: {path}")
+            _sessions[key] = {"workbook": _load(path), "dirty": False, "jobs": []}
+    if outer is not None:
+        # ✅ Nested use: the outer session owns load and save
+        yield outer["workbook"]
+        return
+    try:
+        yield _sessions[key]["workbook"]
+        flush(path)
+    finally:
+        with _lock:
+            session = _sessions.pop(key)
+        session["workbook"].close()
+
+def open_viewer(path):
+    """Opens `path` in the platform's default application (no-op with REPORT_NO_VIEWER=1)."""
+    if os.environ.get("REPORT_NO_VIEWER", "").lower() in ("1", "true", "yes"):
+        return
+    print(f"\n📂 **Opening {os.path.basename(path)}...**")
+    if sys.platform == "darwin":
+        subprocess.Popen(["open", path])
+    elif os.name == "nt":
+        os.startfile(path)
+    elif os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        subprocess.Popen(["xdg-open", path])
+
+def show_workbook(path):
+    """Opens the updated workbook now, or leaves it to the end of the pipeline run."""
+    if os.environ.get("REPORT_DEFER_VIEWER") or session_active(path):
+        return
+    open_viewer(path)
@@ -0,0 +1,361 @@
+"""
+Partial xlsm patcher: updates cell values in weekly_report.xlsm without
+loading the workbook through openpyxl.
+
+The xlsm is treated as the zip package it is. Only the worksheet parts of
+the touched sheets are rewritten, and within them only the touched <row>
+elements; every other row keeps its original bytes, and every other part
+(VBA project, drawings, styles, shared strings, other sheets) is copied over
+unchanged. Strings are written inline (t="inlineStr"), so sharedStrings.xml
+never has to be rewritten, and existing cell styles (s="...") are kept.
+A cell given a number format gets a copy of its style with that format,
+appended to styles.xml (only when the cell does not carry it already).
+Cells that already hold their value and format are not rewritten, and a
+workbook with nothing to change is not saved at all.
+calcChain.xml is dropped and full recalculation on load is requested, since
+patched cells may feed formulas elsewhere.
+
+    patch_workbook(EXCEL_FILE, {"products_new": {"E5": "Rank", "F6": 1234.5}},
+                   {"products_new": {"F6": "#,##0"}})
+"""
+
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape, unescape
+
+from excel.workbook_session import discard_staged, promote_staged, save_target, staged_path
+
+CALC_CHAIN = "xl/calcChain.xml"
+SHARED_STRINGS = "xl/sharedStrings.xml"
+STYLES = "xl/styles.xml"
+
+# ✅ Number formats Excel knows by id without a <numFmt> entry
+BUILTIN_FORMATS = {"General": 0, "0": 1, "0.00": 2, "#,##0": 3, "#,##0.00": 4, "0%": 9, "0.00%": 10}
+
+# ✅ Stands for the current value of a formula or error cell: never equal to a new value
+_CHANGED = object()
+
+_ROW = re.compile(r"<row\b[^>]*?(?:/>|>.*?</row>)", re.S)
+_CELL = re.compile(r"<c\b[^>]*?(?:/>|>.*?</c>)", re.S)
+_ATTR = re.compile(r'(\w+(?::\w+)?)="([^"]*)"')
+_REF = re.compile(r"([A-Z]+)(\d+)")
+
+def column_letter(col):
+    """1 → A, 27 → AA."""
+    letters = ""
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index
+
+def split_ref(ref):
+    letters, row = _REF.fullmatch(ref).groups()
+    return int(row), column_index(letters)
+
+def frame_cells(df, top, left, header=True):
+    """{"E5": value, ...} for a DataFrame block at (top, left), like sheet_writer.write_frame."""
+    rows = [list(df.columns)] if header else []
+    rows += [list(row) for row in df.itertuples(index=False, name=None)]
+    return {
+        f"{column_letter(left + c)}{top + r}": value
+        for r, values in enumerate(rows) for c, value in enumerate(values)
+    }
+
+def _attributes(tag):
+    return dict(_ATTR.findall(tag[:tag.index(">") + 1]))
+
+def _cell_xml(ref, value, attributes):
+    """Serializes one cell, keeping its style and any attributes other than the type."""
+    kept = "".join(f' {k}="{v}"' for k, v in attributes.items() if k not in ("r", "t"))
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        value = value.item()  # ✅ numpy scalar → Python scalar
+    if value is None or (isinstance(value, float) and value != value):
+        return f'<c r="{ref}"{kept}/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{kept} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{kept}><v>{value!r}</v></c>'
+    text = str(value)
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}"{kept} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+def load_styles(xml):
+    """The parts of styles.xml the patcher extends: number formats by code and the cell formats (xf)."""
+    cell_xfs = re.search(r"<cellXfs\b[^>]*>(.*?)</cellXfs>", xml, re.S)
+    return {
+        "xml": xml,
+        "formats": {
+            unescape(code, {"&quot;": '"'}): int(format_id)
+            for format_id, code in re.findall(r'<numFmt\b[^>]*numFmtId="(\d+)"[^>]*formatCode="([^"]*)"', xml)
+        },
+        "xfs": re.findall(r"<xf\b[^>]*?(?:/>|>.*?</xf>)", cell_xfs.group(1), re.S),
+        "new_formats": [],
+        "new_xfs": [],
+        "restyled": {},
+    }
+
+def style_with_format(styles, style, number_format):
+    """Index of a cell format like `style` but with `number_format`, added if it does not exist yet."""
+    key = (style, number_format)
+    if key in styles["restyled"]:
+        return styles["restyled"][key]
+
+    format_id = BUILTIN_FORMATS.get(number_format, styles["formats"].get(number_format))
+    if format_id is None:
+        format_id = max([163, *styles["formats"].values()]) + 1  # ✅ Custom formats start at 164
+        styles["formats"][number_format] = format_id
+        styles["new_formats"].append(f'<numFmt numFmtId="{format_id}" formatCode="{escape(number_format, {chr(34): "&quot;"})}"/>')
+
+    xfs = styles["xfs"] + styles["new_xfs"]
+    xf = xfs[int(style)]
+    opening_tag = xf[:xf.index(">") + 1]
+    attributes = dict(_ATTR.findall(opening_tag))
+    if attributes.get("numFmtId", "0") == str(format_id):
+        index = int(style)
+    else:
+        attributes.update(numFmtId=str(format_id), applyNumberFormat="1")
+        opening = "<xf" + "".join(f' {k}="{v}"' for k, v in attributes.items())
+        styles["new_xfs"].append(opening + ("/>" if opening_tag.endswith("/>") else ">" + xf[len(opening_tag):]))
+        index = len(xfs)
+    styles["restyled"][key] = str(index)
+    return str(index)
+
+def dump_styles(styles):
+    """styles.xml with the added number formats and cell formats (unchanged text if none were added)."""
+    xml = styles["xml"]
+    if styles["new_formats"]:
+        # ✅ Existing <numFmts> (open/close, or openpyxl's empty `<numFmts count="0"/>`) is replaced as a whole
+        existing = re.search(r"<numFmts\b[^>]*?(?:/>|>.*?</numFmts>)", xml, re.S)
+        kept = re.findall(r"<numFmt\b[^>]*/>", existing.group()) if existing else []
+        formats = kept + styles["new_formats"]
+        element = f'<numFmts count="{len(formats)}">' + "".join(formats) + "</numFmts>"
+        if existing:
+            xml = xml[:existing.start()] + element + xml[existing.end():]
+        else:
+            opening_end = xml.index(">", xml.index("<styleSheet")) + 1
+            xml = xml[:opening_end] + element + xml[opening_end:]
+    if styles["new_xfs"]:
+        total = len(styles["xfs"]) + len(styles["new_xfs"])
+        xml = re.sub(r'(<cellXfs\b[^>]*count=")\d+(")', lambda m: f"{m.group(1)}{total}{m.group(2)}", xml, count=1)
+        xml = xml.replace("</cellXfs>", "".join(styles["new_xfs"]) + "</cellXfs>", 1)
+    return xml
+
+def _comparable(value):
+    """A value as the patcher would store it: None, bool, number or text."""
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        value = value.item()
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, (bool, int, float)):
+        return value
+    return str(value)
+
+def _same(old, new):
+    if isinstance(old, bool) or isinstance(new, bool):
+        return type(old) is type(new) and old == new
+    if isinstance(new, (int, float)):
+        return isinstance(old, (int, float)) and old == new
+    return old == new
+
+def _cell_value(cell_xml, shared_strings):
+    """Value a cell holds now (numbers as float); formulas and errors are always rewritten."""
+    attributes = _attributes(cell_xml)
+    cell_type = attributes.get("t", "n")
+    if "<f" in cell_xml or cell_type in ("e", "str"):
+        return _CHANGED
+    if cell_type == "inlineStr":
+        return unescape("".join(re.findall(r"<t\b[^>]*>(.*?)</t>", cell_xml, re.S)))
+    value = re.search(r"<v>(.*?)</v>", cell_xml, re.S)
+    if value is None:
+        return None
+    if cell_type == "s":
+        return shared_strings()[int(value.group(1))]
+    if cell_type == "b":
+        return value.group(1) == "1"
+    return float(value.group(1))
+
+def load_shared_strings(xml):
+    """sharedStrings.xml → list of texts (rich text runs joined, phonetic runs left out)."""
+    return [
+        unescape("".join(re.findall(r"<t\b[^>]*>(.*?)</t>", re.sub(r"<rPh\b.*?</rPh>", "", item, flags=re.S), re.S)))
+        for item in re.findall(r"<si\b[^>]*?(?:/>|>.*?</si>)", xml, re.S)
+    ]
+
+def _patch_row(row_xml, row_number, updates, number_formats=None, styles=None, shared_strings=None):
+    """
+    Rewrites one <row> with `updates` ({col: (ref, value)}), keeping untouched
+    cells verbatim. Cells in `number_formats` ({ref: format}) are restyled.
+    Cells that already hold the value (and format) are kept as they are.
+    Returns (row xml or None for no row, cells written, cells unchanged).
+    """
+    if row_xml is None:
+        open_tag, body = f'<row r="{row_number}">', ""
+    elif row_xml.endswith("/>"):
+        open_tag, body = row_xml[:-2] + ">", ""
+    else:
+        open_tag = row_xml[:row_xml.index(">") + 1]
+        body = row_xml[len(open_tag):-len("</row>")]
+
+    cells = {}
+    for match in _CELL.finditer(body):
+        ref = _attributes(match.group())["r"]
+        cells[split_ref(ref)[1]] = match.group()
+
+    written = unchanged = 0
+    for col, (ref, value) in updates.items():
+        attributes = _attributes(cells[col]) if col in cells else {}
+        style = attributes.get("s", "0")
+        if number_formats and ref in number_formats:
+            attributes["s"] = style_with_format(styles, style, number_formats[ref])
+        old = _cell_value(cells[col], shared_strings) if col in cells else None
+        if old is not _CHANGED and _same(old, _comparable(value)) and attributes.get("s", "0") == style:
+            unchanged += 1
+            continue
+        cells[col] = _cell_xml(ref, value, attributes)
+        written += 1
+
+    if not written:
+        return row_xml, 0, unchanged
+    # ✅ `spans` is only an optimisation hint; drop it rather than keep a wrong one
+    open_tag = re.sub(r'\sspans="[^"]*"', "", open_tag)
+    return open_tag + "".join(cells[col] for col in sorted(cells)) + "</row>", written, unchanged
+
+def patch_sheet_xml(xml, cells, number_formats=None, styles=None, shared_strings=None):
+    """
+    Applies {"B5": value} to a worksheet part (text).
+    `number_formats` ({"B5": "#,##0"}) needs the workbook's `styles` (see load_styles),
+    and cells stored as shared strings are compared through `shared_strings()`.
+    Returns (new text, cells written, cells unchanged).
+    """
+    by_row = {}
+    for ref, value in cells.items():
+        row, col = split_ref(ref)
+        by_row.setdefault(row, {})[col] = (ref, value)
+
+    if "<sheetData/>" in xml:
+        xml = xml.replace("<sheetData/>", "<sheetData></sheetData>", 1)
+    start = xml.index(">", xml.index("<sheetData")) + 1
+    end = xml.index("</sheetData>")
+
+    rows, pending = [], sorted(by_row)
+    written = unchanged = 0
+    def patch(row_xml, row_number):
+        nonlocal written, unchanged
+        row_xml, row_written, row_unchanged = _patch_row(
+            row_xml, row_number, by_row[row_number], number_formats, styles, shared_strings,
+        )
+        written += row_written
+        unchanged += row_unchanged
+        if row_xml is not None:
+            rows.append(row_xml)
+
+    for match in _ROW.finditer(xml, start, end):
+        row_number = int(_attributes(match.group())["r"])
+        while pending and pending[0] < row_number:
+            patch(None, pending.pop(0))
+        if pending and pending[0] == row_number:
+            patch(match.group(), pending.pop(0))
+        else:
+            rows.append(match.group())
+    for row in pending:
+        patch(None, row)
+    return xml[:start] + "".join(rows) + xml[end:], written, unchanged
+
+def sheet_parts(archive):
+    """{sheet name: part name inside the zip}, from workbook.xml and its relationships."""
+    workbook = archive.read("xl/workbook.xml").decode("utf-8")
+    rels = archive.read("xl/_rels/workbook.xml.rels").decode("utf-8")
+    targets = {}
+    for tag in re.findall(r"<Relationship\b[^>]*>", rels):
+        attributes = dict(_ATTR.findall(tag))
+        target = attributes["Target"].lstrip("/")
+        targets[attributes["Id"]] = target if target.startswith("xl/") else f"xl/{target}"
+    parts = {}
+    for tag in re.findall(r"<sheet\b[^>]*>", workbook):
+        attributes = dict(_ATTR.findall(tag))
+        name = attributes["name"].replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"').replace("&apos;", "'")
+        parts[name] = targets[attributes["r:id"]]
+    return parts
+
+def _drop_calc_chain(name, data):
+    """Removes calcChain references and asks Excel to recalculate on load."""
+    text = data.decode("utf-8")
+    if name == "[Content_Types].xml":
+        text = re.sub(r'<Override\b[^>]*PartName="/xl/calcChain.xml"[^>]*/>', "", text)
+    elif name == "xl/_rels/workbook.xml.rels":
+        text = re.sub(r'<Relationship\b[^>]*Target="/?(?:xl/)?calcChain.xml"[^>]*/>', "", text)
+    elif name == "xl/workbook.xml":
+        if "<calcPr" in text and "fullCalcOnLoad" not in text:
+            text = text.replace("<calcPr", '<calcPr fullCalcOnLoad="1"', 1)
+    return text.encode("utf-8")
+
+def patch_workbook(path, updates, number_formats=None):
+    """
+    Writes {sheet: {"B5": value}} into the workbook, rewriting only those
+    sheets' parts (and styles.xml when `number_formats`, {sheet: {"B5": format}},
+    needs new cell formats). Saved atomically; a locked workbook is patched
+    into its staged copy instead (see workbook_session). Cells that already
+    hold the value are left alone, and a workbook with nothing to change is not
+    rewritten at all. Returns (cells written, cells unchanged).
+    """
+    number_formats = {sheet: formats for sheet, formats in (number_formats or {}).items() if formats}
+    promote_staged(path)
+    source = staged_path(path) if os.path.exists(staged_path(path)) else path
+    target = save_target(path)
+    directory, name = os.path.split(os.path.abspath(path))
+    temp_file = os.path.join(directory, f".{name}.patch.tmp")
+
+    try:
+        with zipfile.ZipFile(source) as archive, zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as patched:
+            parts = sheet_parts(archive)
+            missing = [sheet for sheet in updates if sheet not in parts]
+            if missing:
+                raise ValueError(f"❌ Worksheet(s) {missing} not found in {path}!")
+            styles = load_styles(archive.read(STYLES).decode("utf-8")) if number_formats else None
+            strings = []
+            def shared_strings():
+                # ✅ Read only when a touched cell is a shared string
+                if not strings and SHARED_STRINGS in archive.namelist():
+                    strings.extend(load_shared_strings(archive.read(SHARED_STRINGS).decode("utf-8")))
+                return strings
+
+            touched, written, unchanged = {}, 0, 0
+            for sheet, cells in updates.items():
+                xml, sheet_written, sheet_unchanged = patch_sheet_xml(
+                    archive.read(parts[sheet]).decode("utf-8"), cells, number_formats.get(sheet), styles, shared_strings,
+                )
+                unchanged += sheet_unchanged
+                if sheet_written:
+                    touched[parts[sheet]] = xml.encode("utf-8")
+                    written += sheet_written
+            if not written:
+                return 0, unchanged
+
+            for info in archive.infolist():
+                if info.filename == CALC_CHAIN:
+                    continue
+                data = archive.read(info.filename)
+                if info.filename in touched:
+                    data = touched[info.filename]
+                elif info.filename == STYLES and styles is not None:
+                    data = dump_styles(styles).encode("utf-8")
+                elif info.filename in ("[Content_Types].xml", "xl/_rels/workbook.xml.rels", "xl/workbook.xml"):
+                    data = _drop_calc_chain(info.filename, data)
+                patched.writestr(info, data)
+        os.replace(temp_file, target)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+    if target == path and source != path:
+        discard_staged(path)  # ✅ The staged copy was the base of this patch and is now superseded
+    elif target != path:
+        print(f"🔒 **{name} is open elsewhere: patched {os.path.basename(target)}, swapped in once it is closed**")
+    return written, unchanged
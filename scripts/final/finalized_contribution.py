@@ -7,13 +7,25 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.formatting import as_whole_numbers, round_by_label
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(BASE_DIR, "data", "raw", "contribution_raw.csv")
 CSV_OUTPUT_FILE = os.path.join(BASE_DIR, "data", "final", "contribution_final.csv")
 
+# ✅ Rounding per metric (first match wins); everything else → 0 decimals
+CONTRIBUTION_ROUNDING = [
+    ("Conversion Rate", {"decimals": 1}),
+    ("COS", {"decimals": 0}),
+]
+WHOLE_NUMBER = {"decimals": 0}
+
 # ✅ Ensure output directory exists
 os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 
@@ -26,30 +38,13 @@ def format_kpi_data(df):
     - All other values → 0 decimals (No division by 1000 anymore!)
     """
 
-    print("\n🔍 **Step 1: Raw 'Value' Column Before Formatting**")
-    print(df[["Metric", "Customer Type", "Value"]].head(10))  # Inspect raw values
+    log_frame(logger, "Step 1: Raw 'Value' Column Before Formatting", df[["Metric", "Customer Type", "Value"]], rows=10, index=True)
 
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")  # Ensure numeric values
 
-    def apply_formatting(row):
-        """Applies specific rounding rules based on metric type."""
-        original_value = row["Value"]  # Keep original for logging
-
-        if "Conversion Rate" in row["Metric"]:
-            formatted_value = round(row["Value"], 1)  # 1 decimal for Conversion Rate
-        elif "COS" in row["Metric"]:
-            formatted_value = round(row["Value"], 0)  # 0 decimals for COS
-        else:
-            formatted_value = round(row["Value"], 0)  # 0 decimals for everything else
-
-        # Log transformation for debugging
-        print(f"🔄 Formatting '{row['Metric']} ({row['Customer Type']})': {original_value} → {formatted_value}")
-        return formatted_value
-
-    df["Value"] = df.apply(apply_formatting, axis=1)
+    df["Value"] = round_by_label(df["Value"], df["Metric"], CONTRIBUTION_ROUNDING, default=WHOLE_NUMBER)
 
-    print("\n🔍 **Step 2: 'Value' Column After Formatting**")
-    print(df[["Metric", "Customer Type", "Value"]].head(10))  # Inspect transformed values
+    log_frame(logger, "Step 2: 'Value' Column After Formatting", df[["Metric", "Customer Type", "Value"]], rows=10, index=True)
 
     return df
 
@@ -59,7 +54,7 @@ def sort_and_save_kpi_data(input_file, csv_output):
 
     # ✅ Load the dataset
     try:
-        df = pd.read_csv(input_file)
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -73,8 +68,7 @@ def sort_and_save_kpi_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # ✅ Apply formatting BEFORE pivoting
     df = format_kpi_data(df)
@@ -88,17 +82,12 @@ def sort_and_save_kpi_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # ✅ Assign sorting order based on the correct week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     # ✅ Sort data based on the last 8 weeks order
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted KPI Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted KPI Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -112,30 +101,21 @@ def sort_and_save_kpi_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Metric", "Customer Type", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: KPI Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: KPI Data After Pivoting", df_pivot, rows=10, index=True)
 
     # ✅ Force final formatting after pivoting (No conversion to thousands!)
-    for col in iso_weeks_sorted:
-        if col in df_pivot.columns:
-            df_pivot[col] = df_pivot.apply(
-                lambda row: int(row[col]) if pd.notna(row[col]) and row["Metric"] not in ["COS%", "Conversion Rate (%)"]
-                else row[col],
-                axis=1
-            )
+    df_pivot = as_whole_numbers(df_pivot, iso_weeks_sorted, rows=~df_pivot["Metric"].isin(["COS%", "Conversion Rate (%)"]))
 
-    print("\n📊 **Step 6: KPI Data After Final Formatting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: KPI Data After Final Formatting", df_pivot, rows=10, index=True)
 
     # ✅ Display full DataFrame in terminal
     pd.set_option("display.max_rows", None)
     pd.set_option("display.float_format", lambda x: f"{x:.1f}" if isinstance(x, float) else str(int(x)))
 
-    print("\n📊 **Final Formatted KPI Data:**")
-    print(df_pivot.to_string(index=False))  # Display full DataFrame in readable format
+    log_frame(logger, "Final Formatted KPI Data", df_pivot)
 
     # ✅ Save the sorted and formatted data as a CSV file
-    df_pivot.to_csv(csv_output, index=False)
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted KPI data to CSV: {csv_output}")
 
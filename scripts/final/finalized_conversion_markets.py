@@ -5,7 +5,11 @@ from datetime import datetime
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(BASE_DIR, "data", "raw", "conversion_markets_raw.csv")
@@ -15,7 +19,7 @@ os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 
 def sort_and_save_conversion_data(input_file, csv_output):
     try:
-        df = pd.read_csv(input_file, sep=";", decimal=",")
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -28,14 +32,12 @@ def sort_and_save_conversion_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # Convert Value to numeric and ensure proper formatting for percentage display
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")
     
-    print("\n🔍 **Original Conversion Rate Values (Before Formatting) - Sample:**")
-    print(df[["Market", "Value"]].head(20))
+    log_frame(logger, "Original Conversion Rate Values (Before Formatting) - Sample", df[["Market", "Value"]], rows=20, index=True)
 
     # Sort data by week order (newest first)
     last_8_weeks, _ = get_last_8_weeks()
@@ -45,16 +47,11 @@ def sort_and_save_conversion_data(input_file, csv_output):
 
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted Conversion Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted Conversion Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # Pivot data for consistent week column order
     df_pivot = df_sorted.pivot_table(
@@ -67,26 +64,21 @@ def sort_and_save_conversion_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Market", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: Conversion Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: Conversion Data After Pivoting", df_pivot, rows=10, index=True)
 
-    # Apply formatting - conversion rates should be displayed as percentages with 1 decimal
-    for col in iso_weeks_sorted:
-        if col in df_pivot.columns:
-            df_pivot[col] = df_pivot[col].apply(lambda x: f"{x:.1f}%" if pd.notna(x) else "-")
+    # Conversion rates stay numeric (percent, 1 decimal); "%" and "-" for missing weeks are added at render time
+    df_pivot[iso_weeks_sorted] = df_pivot[iso_weeks_sorted].round(1)
 
-    print("\n📊 **Step 6: Conversion Data After Final Formatting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: Conversion Data After Final Formatting", df_pivot, rows=10, index=True)
 
     # Set pandas display options for better readability
     pd.set_option("display.max_rows", None)
     pd.set_option("display.float_format", lambda x: f"{x:.3f}" if isinstance(x, float) else str(x))
 
-    print("\n📊 **Final Formatted Conversion Data:**")
-    print(df_pivot.to_string(index=False))
+    log_frame(logger, "Final Formatted Conversion Data", df_pivot)
 
     # Save to CSV
-    df_pivot.to_csv(csv_output, index=False, sep=";", decimal=",")
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted conversion data to CSV: {csv_output}")
 
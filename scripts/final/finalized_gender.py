@@ -7,7 +7,12 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.formatting import as_whole_numbers
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -24,24 +29,13 @@ def format_gender_data(df):
     - No conversion to thousands, all values remain in full amounts.
     """
 
-    print("\n🔍 **Step 1: Raw 'Value' Column Before Formatting**")
-    print(df[["Metric", "Value"]].head(10))  # Inspect raw values
+    log_frame(logger, "Step 1: Raw 'Value' Column Before Formatting", df[["Metric", "Value"]], rows=10, index=True)
 
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")  # Ensure numeric values
 
-    def apply_formatting(row):
-        """Ensures values remain unchanged."""
-        original_value = row["Value"]  # Keep original for logging
-        formatted_value = round(original_value, 0)  # Round to nearest whole number
-
-        # Log transformation for debugging
-        print(f"🔄 Keeping '{row['Metric']}': {original_value} → {formatted_value}")
-        return formatted_value
-
-    df["Value"] = df.apply(apply_formatting, axis=1)
+    df["Value"] = df["Value"].round(0)  # ✅ Round to nearest whole number
 
-    print("\n🔍 **Step 2: 'Value' Column After Formatting**")
-    print(df[["Metric", "Value"]].head(10))  # Inspect transformed values
+    log_frame(logger, "Step 2: 'Value' Column After Formatting", df[["Metric", "Value"]], rows=10, index=True)
 
     return df
 
@@ -51,7 +45,7 @@ def sort_and_save_gender_data(input_file, csv_output):
 
     # ✅ Load the dataset
     try:
-        df = pd.read_csv(input_file)
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -65,8 +59,7 @@ def sort_and_save_gender_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # ✅ Apply formatting BEFORE pivoting
     df = format_gender_data(df)
@@ -80,17 +73,12 @@ def sort_and_save_gender_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # ✅ Assign sorting order based on the correct week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     # ✅ Sort data based on the last 8 weeks order
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted Gender Revenue Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted Gender Revenue Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -104,22 +92,15 @@ def sort_and_save_gender_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Metric", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: Gender Revenue Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: Gender Revenue Data After Pivoting", df_pivot, rows=10, index=True)
 
     # ✅ Force final formatting after pivoting
-    for col in iso_weeks_sorted:
-        if col in df_pivot.columns:
-            df_pivot[col] = df_pivot.apply(
-                lambda row: int(row[col]) if pd.notna(row[col]) else row[col],
-                axis=1
-            )
+    df_pivot = as_whole_numbers(df_pivot, iso_weeks_sorted)
 
-    print("\n📊 **Step 6: Gender Revenue Data After Final Formatting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: Gender Revenue Data After Final Formatting", df_pivot, rows=10, index=True)
 
     # ✅ Save the sorted and formatted data as a CSV file
-    df_pivot.to_csv(csv_output, index=False)
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted Gender Revenue data to CSV: {csv_output}")
 
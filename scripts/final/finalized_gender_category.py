@@ -8,6 +8,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
 from calculator.date_utils import get_last_8_weeks
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -49,8 +52,7 @@ def load_and_format_data(input_file):
     # ✅ Filter only `Current Year` data
     df = df[df["Year Type"] == "Current Year"]
 
-    print("\n📊 **Step 1: Data Loaded & Formatted**")
-    print(df.head(10))
+    log_frame(logger, "Step 1: Data Loaded & Formatted", df, rows=10, index=True)
 
     return df
 
@@ -69,8 +71,7 @@ def aggregate_and_pivot_data(df):
     # ✅ Ensure each (Gender, Category, ISO Week) has a single unique Value
     df_sorted = df.groupby(["ISO Week", "Gender", "Product Category"], as_index=False)["Value"].sum()
 
-    print("\n📊 **Step 3: Aggregated Data Before Pivoting**")
-    print(df_sorted.head(20))
+    log_frame(logger, "Step 3: Aggregated Data Before Pivoting", df_sorted, rows=20, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -84,8 +85,7 @@ def aggregate_and_pivot_data(df):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Gender", "Product Category"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 4: Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 4: Data After Pivoting", df_pivot, rows=10, index=True)
 
     # ✅ Replace NaN with 0 for missing values
     df_pivot = df_pivot.fillna(0)
@@ -167,8 +167,7 @@ def process_gender_category_data():
 
     df_final = add_totals(men_df, women_df, iso_weeks_sorted)
 
-    print("\n📊 **Final Processed Data**")
-    print(df_final.to_string(index=False))  # ✅ Print the full DataFrame
+    log_frame(logger, "Final Processed Data", df_final)
 
     save_to_csv(df_final, CSV_OUTPUT_FILE)
 
@@ -5,18 +5,25 @@ import pandas as pd
 # ✅ Ensure correct import paths
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from calculator.growth import growth_frame
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 CURRENT_YEAR_FILE = os.path.join(BASE_DIR, "data", "final", "gender_category_final.csv")
 LAST_YEAR_FILE = os.path.join(BASE_DIR, "data", "final", "gender_category_ly_final.csv")
 CSV_OUTPUT_FILE = os.path.join(BASE_DIR, "data", "final", "gender_category_growth_final.csv")
 
+LABEL_COLUMNS = ["Gender", "Product Category"]
+
 # ✅ Ensure output directory exists
 os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 
 
 def load_and_prepare_data():
-    """Loads and ensures all categories are included for both current and last year."""
+    """Loads current and last year data and checks that both carry the expected columns."""
     try:
         df_current = pd.read_csv(CURRENT_YEAR_FILE)
         df_last_year = pd.read_csv(LAST_YEAR_FILE)
@@ -31,23 +38,12 @@ def load_and_prepare_data():
     week_columns = [col for col in df_current.columns if col.isdigit()]
 
     # ✅ Ensure required columns exist
-    required_columns = set(week_columns + ["8-week avg", "Gender", "Product Category"])
+    required_columns = set(week_columns + ["8-week avg"] + LABEL_COLUMNS)
     if not required_columns.issubset(df_current.columns) or not required_columns.issubset(df_last_year.columns):
         print(f"❌ Missing required columns in one of the files: {required_columns}")
         return None, None, None
 
-    # ✅ Create a full list of unique Gender-Product Category combinations
-    all_categories = pd.concat([df_current[['Gender', 'Product Category']], df_last_year[['Gender', 'Product Category']]]).drop_duplicates()
-
-    # ✅ Merge to ensure all categories exist
-    df_current = all_categories.merge(df_current, on=["Gender", "Product Category"], how="left")
-    df_last_year = all_categories.merge(df_last_year, on=["Gender", "Product Category"], how="left")
-
-    # ✅ Fill missing values with 0 or NaN (depending on preference)
-    df_current.fillna(0, inplace=True)
-    df_last_year.fillna(0, inplace=True)
-
-    print("\n📊 **Step 1: Loaded Data with All Categories**")
+    print("\n📊 **Step 1: Loaded Data**")
     print(f"Current Year Data: {df_current.shape}, Last Year Data: {df_last_year.shape}")
 
     return df_current, df_last_year, week_columns
@@ -55,43 +51,14 @@ def load_and_prepare_data():
 def calculate_growth(df_current, df_last_year, week_columns):
     """Calculates the percentage growth based on last year's values."""
 
-    # ✅ Ensure both dataframes have the same column names before merging
-    rename_dict_current = {col: f"{col}_current" for col in week_columns + ["8-week avg"]}
-    rename_dict_last_year = {col: f"{col}_ly" for col in week_columns + ["8-week avg"]}
-
-    df_current = df_current.rename(columns=rename_dict_current)
-    df_last_year = df_last_year.rename(columns=rename_dict_last_year)
-
-    # ✅ Merge both datasets to align structures (preserve Gender & Category from df_current)
-    df_growth = df_current.merge(
-        df_last_year,
-        left_index=True,  # Ensure we merge correctly
-        right_index=True,
-        how="left"
-    )
-
-    # ✅ Restore Gender & Product Category
-    df_growth["Gender"] = df_current["Gender"]
-    df_growth["Product Category"] = df_current["Product Category"]
-
-    # ✅ Calculate Year-over-Year Growth for each week
-    for week in week_columns:
-        current_col = f"{week}_current"
-        last_year_col = f"{week}_ly"
-
-        if current_col in df_growth.columns and last_year_col in df_growth.columns:
-            df_growth[week] = ((df_growth[current_col] - df_growth[last_year_col]) / df_growth[last_year_col]) * 100
-            df_growth[week] = df_growth[week].replace([float("inf"), -float("inf")], None)  # Handle division by zero
+    # ✅ Every Gender-Product Category combination of either year; missing values count as 0,
+    # growth against a zero (or missing) last year is left empty
+    df_growth = growth_frame(df_current, df_last_year, LABEL_COLUMNS, week_columns, how="outer")
 
     # ✅ Calculate 8-week average growth from individual week growths
     df_growth["8-week avg"] = df_growth[week_columns].mean(axis=1)
 
-    # ✅ Keep only relevant columns (Gender, Product Category, Growth Values)
-    growth_columns = ["Gender", "Product Category"] + week_columns + ["8-week avg"]
-    df_growth = df_growth[growth_columns]
-
-    print("\n📊 **Step 2: Calculated Year-over-Year Growth (With Gender & Category)**")
-    print(df_growth.to_string(index=False))
+    log_frame(logger, "Step 2: Calculated Year-over-Year Growth (With Gender & Category)", df_growth)
 
     return df_growth
 
@@ -126,8 +93,7 @@ def process_gender_category_growth():
     df_growth_no_labels = df_growth.drop(columns=["Gender", "Category"], errors="ignore")
 
     # ✅ Print DataFrame without Gender & Category
-    print("\n📊 **Step 3: Final Growth Data (Without Gender & Category)**")
-    print(df_growth_no_labels.to_string(index=False))
+    log_frame(logger, "Step 3: Final Growth Data (Without Gender & Category)", df_growth_no_labels)
 
     # ✅ Save final output
     save_to_csv(df_growth_no_labels, CSV_OUTPUT_FILE)
@@ -1,6 +1,14 @@
+import sys
 import os
 import pandas as pd
 
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # ✅ Define paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(BASE_DIR, "data", "raw", "gender_category_share_raw.csv")
@@ -95,5 +103,4 @@ df_final.to_csv(OUTPUT_FILE, index=False)
 print(f"\n✅ Finalized gender-category share data successfully saved to: {OUTPUT_FILE}")
 
 # ✅ Preview the first few rows WITHOUT index
-print("\n📊 **Preview of Finalized Data:**")
-print(df_final.to_string(index=False))
+log_frame(logger, "Preview of Finalized Data", df_final)
@@ -5,6 +5,11 @@ import pandas as pd
 # ✅ Ensure correct import paths
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from calculator.growth import share_pct
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 CURRENT_YEAR_FILE = os.path.join(BASE_DIR, "data", "final", "gender_category_final.csv")
@@ -54,21 +59,14 @@ def calculate_share(df_current, week_columns):
     grand_total_values = grand_total_row[week_columns + ["8-week avg"]].iloc[0]
 
     # ✅ Debugging print: Show extracted Grand Total values
-    print("\n📊 **Extracted Grand Total Per Week (From 'Gender' Column):**")
-    print(grand_total_values)
-
-    # ✅ Compute share by dividing each revenue value by the **Grand Total per week**
-    df_share = df_current.copy()
-    
-    for week in week_columns + ["8-week avg"]:
-        df_share[week] = (df_share[week] / grand_total_values[week]) * 100  # Convert to percentage
+    log_frame(logger, "Extracted Grand Total Per Week (From 'Gender' Column)", grand_total_values, index=True)
 
-    # ✅ Keep only relevant columns (Gender, Category, Share Values)
-    share_columns = ["Gender", "Category"] + week_columns + ["8-week avg"]
-    df_share = df_share[share_columns]
+    # ✅ Compute share by dividing each revenue value by the **Grand Total per week** (one matrix operation)
+    value_columns = week_columns + ["8-week avg"]
+    df_share = df_current[["Gender", "Category"]].copy()
+    df_share[value_columns] = share_pct(df_current[value_columns], grand_total_values)
 
-    print("\n📊 **Step 2: Calculated Share of Revenue (With Gender & Category)**")
-    print(df_share.to_string(index=False))
+    log_frame(logger, "Step 2: Calculated Share of Revenue (With Gender & Category)", df_share)
 
     return df_share
 
@@ -76,8 +74,7 @@ def calculate_share(df_current, week_columns):
 def validate_total(df_share, week_columns):
     """Ensures the total per week sums to ~100% (Column-Wise)."""
     total_check = df_share[week_columns + ["8-week avg"]].sum()
-    print("\n✅ **Total Sum for Each Week (Should be 100% per column now!):**")
-    print(total_check)
+    log_frame(logger, "Total Sum for Each Week (Should be 100% per column now!)", total_check, index=True)
 
 
 def format_output(df_share):
@@ -117,8 +114,7 @@ def process_gender_category_share():
     df_share_formatted = format_output(df_share)
 
     # ✅ Print formatted DataFrame
-    print("\n📊 **Step 3: Final Share Data (Formatted as Percentages)**")
-    print(df_share_formatted.to_string(index=False))
+    log_frame(logger, "Step 3: Final Share Data (Formatted as Percentages)", df_share_formatted)
 
     # ✅ Drop Gender & Category Columns for final output
     df_share_no_labels = df_share_formatted.drop(columns=["Gender", "Category"], errors="ignore")
@@ -1,6 +1,14 @@
+import sys
 import os
 import pandas as pd
 
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # Define paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 RAW_DATA_DIR = os.path.join(BASE_DIR, "data", "raw")
@@ -75,8 +83,7 @@ def finalize_growth():
     df = df[EXPECTED_COLUMNS]
 
     # Debugging: Print formatted growth metrics
-    print("\n✅ **Final Growth Data After Formatting & Column Reorder:**")
-    print(df.to_string())
+    log_frame(logger, "Final Growth Data After Formatting & Column Reorder", df, index=True)
 
     # Save formatted growth data
     df.to_csv(GROWTH_FINAL_PATH, index=True)
@@ -5,6 +5,11 @@ import pandas as pd
 # Add the scripts folder to Python's import path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from calculator.formatting import THOUSANDS, WHOLE, format_frame
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))  
 RAW_METRICS_PATH = os.path.join(BASE_DIR, "data", "raw", "metrics_raw.csv")
@@ -30,7 +35,8 @@ METRIC_NAMES = [
 # Define required columns (including last_year & year_2023)
 EXPECTED_COLUMNS = ["current_week", "last_week", "last_year", "year_2023"]
 
-# Metrics that should be formatted in thousands
+# Display format per metric: revenue & spend in thousands, rates with one decimal and a percentage sign,
+# everything else as whole numbers. Non-numeric cells (e.g. "n/m") are kept as they are.
 THOUSANDS_METRICS = [
     "Online Gross Revenue",
     "Returns",
@@ -42,32 +48,17 @@ THOUSANDS_METRICS = [
     "Total Net Revenue",
     "Marketing Spend",  # ✅ Added Marketing Spend
 ]
-
-# Metrics that should have one decimal and a percentage sign
 PERCENTAGE_METRICS = ["Online Cost of Sale (CoS)", "Return rate %"]
+PERCENTAGE_FORMAT = {"decimals": 1, "suffix": " %"}
+
+METRIC_FORMATS = {
+    **{metric: THOUSANDS for metric in THOUSANDS_METRICS},
+    **{metric: PERCENTAGE_FORMAT for metric in PERCENTAGE_METRICS},
+}
 
 def format_metrics(df):
     """Formats numbers properly in the DataFrame while keeping them as strings."""
-    # Convert all numeric data to float where possible, but keep existing strings
-    for metric in df.index:
-        if metric in PERCENTAGE_METRICS:
-            df.loc[metric] = df.loc[metric].apply(
-                lambda x: f"{round(float(x), 1)} %" if pd.notna(x) and str(x).replace('.', '', 1).isdigit() else x
-            )
-        elif metric in THOUSANDS_METRICS:
-            df.loc[metric] = df.loc[metric].apply(
-                lambda x: f"{int(round(float(x) / 1000)):,}" if pd.notna(x) and str(x).replace('.', '', 1).isdigit() else x
-            )
-        elif metric in ["Returning Customers", "New Customers"]:
-            df.loc[metric] = df.loc[metric].apply(
-                lambda x: f"{int(round(float(x))):,}" if pd.notna(x) and str(x).replace(',', '').isdigit() else x
-            )
-        else:
-            df.loc[metric] = df.loc[metric].apply(
-                lambda x: f"{int(round(float(x))):,}" if pd.notna(x) and str(x).replace(',', '').isdigit() else x
-            )
-
-    return df
+    return format_frame(df, WHOLE, rows=METRIC_FORMATS)
 
 def load_and_prepare_finalized_data():
     """Extracts and saves the required metrics from metrics_raw.csv to metrics_final.csv."""
@@ -92,7 +83,7 @@ def load_and_prepare_finalized_data():
     # Save finalized metrics as strings to maintain formatting
     metrics_df.to_csv(FINAL_METRICS_PATH, index=True)
     print(f"✅ Finalized Metrics saved to `{FINAL_METRICS_PATH}`")
-    print(metrics_df)  # Debug output to verify
+    log_frame(logger, "Finalized Metrics", metrics_df, index=True)
 
 if __name__ == "__main__":
     load_and_prepare_finalized_data()
@@ -7,13 +7,27 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.formatting import as_whole_numbers, round_by_label
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(BASE_DIR, "data", "raw", "online_kpis_raw.csv")
 CSV_OUTPUT_FILE = os.path.join(BASE_DIR, "data", "final", "online_kpis_final.csv")
 
+# ✅ Scaling and rounding per metric (first match wins); everything else → 0 decimals
+KPI_ROUNDING = [
+    ("Conversion Rate", {"decimals": 1}),
+    ("COS", {"decimals": 0}),
+    ("Online Media Spend", {"scale": 1000, "decimals": 0}),  # ✅ Whole number in thousands
+    ("Sessions", {"scale": 1000, "decimals": 1}),            # ✅ 1 decimal in thousands
+]
+WHOLE_NUMBER = {"decimals": 0}
+
 # ✅ Ensure output directory exists
 os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 
@@ -28,34 +42,13 @@ def format_kpi_data(df):
     - All others → 0 decimals (displayed as integers)
     """
 
-    print("\n🔍 **Step 1: Raw 'Value' Column Before Formatting**")
-    print(df[["Metric", "Value"]].head(10))  # Inspect raw values
+    log_frame(logger, "Step 1: Raw 'Value' Column Before Formatting", df[["Metric", "Value"]], rows=10, index=True)
 
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")  # Ensure numeric values
 
-    def apply_formatting(row):
-        """Applies different rounding and scaling based on metric type."""
-        original_value = row["Value"]  # Keep original for logging
-
-        if "Conversion Rate" in row["Metric"]:
-            formatted_value = round(row["Value"], 1)  # 1 decimal for Conversion Rate
-        elif "COS" in row["Metric"]:
-            formatted_value = round(row["Value"], 0)  # 0 decimals for COS
-        elif "Online Media Spend" in row["Metric"]:
-            formatted_value = round(row["Value"] / 1000, 0)  # Whole number in thousands
-        elif "Sessions" in row["Metric"]:
-            formatted_value = round(row["Value"] / 1000, 1)  # 1 decimal in thousands
-        else:
-            formatted_value = round(row["Value"], 0)  # 0 decimals for everything else
-
-        # Log transformation for debugging
-        print(f"🔄 Formatting '{row['Metric']}': {original_value} → {formatted_value}")
-        return formatted_value
-
-    df["Value"] = df.apply(apply_formatting, axis=1)
+    df["Value"] = round_by_label(df["Value"], df["Metric"], KPI_ROUNDING, default=WHOLE_NUMBER)
 
-    print("\n🔍 **Step 2: 'Value' Column After Formatting**")
-    print(df[["Metric", "Value"]].head(10))  # Inspect transformed values
+    log_frame(logger, "Step 2: 'Value' Column After Formatting", df[["Metric", "Value"]], rows=10, index=True)
 
     return df
 
@@ -65,7 +58,7 @@ def sort_and_save_kpi_data(input_file, csv_output):
 
     # ✅ Load the dataset
     try:
-        df = pd.read_csv(input_file)
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -79,8 +72,7 @@ def sort_and_save_kpi_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # ✅ Apply formatting BEFORE pivoting
     df = format_kpi_data(df)
@@ -94,17 +86,12 @@ def sort_and_save_kpi_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # ✅ Assign sorting order based on the correct week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     # ✅ Sort data based on the last 8 weeks order
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted KPI Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted KPI Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -118,30 +105,21 @@ def sort_and_save_kpi_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Metric", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: KPI Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: KPI Data After Pivoting", df_pivot, rows=10, index=True)
 
-    # ✅ Force final formatting after pivoting
-    for col in iso_weeks_sorted:
-        if col in df_pivot.columns:
-            df_pivot[col] = df_pivot.apply(
-                lambda row: int(row[col]) if pd.notna(row[col]) and row["Metric"] not in ["COS%", "Conversion Rate (%)", "Sessions"]
-                else row[col],
-                axis=1
-            )
+    # ✅ Force final formatting after pivoting (whole numbers for every metric without decimals)
+    df_pivot = as_whole_numbers(df_pivot, iso_weeks_sorted, rows=~df_pivot["Metric"].isin(["COS%", "Conversion Rate (%)", "Sessions"]))
 
-    print("\n📊 **Step 6: KPI Data After Final Formatting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: KPI Data After Final Formatting", df_pivot, rows=10, index=True)
 
     # ✅ Display full DataFrame in terminal
     pd.set_option("display.max_rows", None)
     pd.set_option("display.float_format", lambda x: f"{x:.1f}" if isinstance(x, float) else str(int(x)))
 
-    print("\n📊 **Final Formatted KPI Data:**")
-    print(df_pivot.to_string(index=False))  # Display full DataFrame in readable format
+    log_frame(logger, "Final Formatted KPI Data", df_pivot)
 
     # ✅ Save the sorted and formatted data as a CSV file
-    df_pivot.to_csv(csv_output, index=False)
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted KPI data to CSV: {csv_output}")
 
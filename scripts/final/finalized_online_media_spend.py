@@ -5,7 +5,11 @@ from datetime import datetime
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(BASE_DIR, "data", "raw", "online_media_spend_raw.csv")
@@ -16,7 +20,7 @@ os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 def sort_and_save_online_media_spend_data(input_file, csv_output):
     try:
         # Read CSV file with semicolon separator
-        df = pd.read_csv(input_file, sep=";", decimal=",")
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -29,13 +33,11 @@ def sort_and_save_online_media_spend_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Spend Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Spend Data Loaded", df, rows=10, index=True)
 
     # Convert Value column to numeric for proper sorting
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")
-    print("\n🔍 **Original Spend Values (No Formatting) - Sample:**")
-    print(df[["Market", "Value"]].head(20))
+    log_frame(logger, "Original Spend Values (No Formatting) - Sample", df[["Market", "Value"]], rows=20, index=True)
 
     # Get week ordering (newest → oldest)
     last_8_weeks, _ = get_last_8_weeks()
@@ -46,16 +48,11 @@ def sort_and_save_online_media_spend_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # Sort data according to week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted Spend Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted Spend Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # Pivot the data
     df_pivot = df_sorted.pivot_table(
@@ -69,8 +66,7 @@ def sort_and_save_online_media_spend_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Market", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: Spend Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: Spend Data After Pivoting", df_pivot, rows=10, index=True)
 
     # Convert spend values to thousands (divide by 1000) for cleaner display
     for col in iso_weeks_sorted:
@@ -79,18 +75,15 @@ def sort_and_save_online_media_spend_data(input_file, csv_output):
                 lambda x: round(x / 1000, 1) if pd.notna(x) and x > 0 else 0
             )
 
-    print("\n📊 **Step 6: Spend Data After Converting to Thousands**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: Spend Data After Converting to Thousands", df_pivot, rows=10, index=True)
 
     # Set pandas display options for better readability
     pd.set_option("display.max_rows", None)
     pd.set_option("display.float_format", lambda x: f"{x:.1f}" if isinstance(x, float) else str(int(x)))
 
-    print("\n📊 **Final Spend Data (In Thousands):**")
-    print(df_pivot.to_string(index=False))
+    log_frame(logger, "Final Spend Data (In Thousands)", df_pivot)
 
-    # Save to CSV with point as decimal separator for better Excel compatibility
-    df_pivot.to_csv(csv_output, index=False, sep=";", decimal=".")
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted online media spend data to CSV: {csv_output}")
     print(f"📊 **Format:** Spend values converted to thousands (divide by 1000)")
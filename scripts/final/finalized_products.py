@@ -0,0 +1,70 @@
+import sys
+import os
+import pandas as pd
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.metrics_calculator import DATA_PATH, load_data, cached_aggregate
+from calculator.date_utils import get_latest_full_week
+from calculator.products import PRODUCT_SEGMENTS, rank_top_products
+
+# ✅ Define file paths
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+FINAL_DIR = os.path.join(BASE_DIR, "data", "final")
+
+# ✅ SOB% presentation per segment (None = keep numeric), as the excel writers expect
+SOB_FORMATS = {
+    "new": "{:.2f}%",
+    "returning": "{:.2f}%",
+    "men": None,
+    "women": "{:.1f}%",
+}
+
+def final_csv_path(segment):
+    """Returns the finalized CSV path for a product segment."""
+    return os.path.join(FINAL_DIR, f"products_{segment}_final.csv")
+
+def finalize_products(segments=None, data=None):
+    """
+    Ranks the top 20 products for the new, returning, men and women slides
+    from one scan of the current week and saves `products_<segment>_final.csv`.
+    """
+    segments = list(segments or PRODUCT_SEGMENTS)
+    unknown = set(segments) - set(PRODUCT_SEGMENTS)
+    if unknown:
+        raise ValueError(f"❌ Unknown product segments: {sorted(unknown)}")
+
+    # 1️⃣ **Get current week's start & end dates**
+    start_date, end_date = get_latest_full_week()["current_week"]
+    print(f"\n📆 **Using Date Range:** {start_date} → {end_date}")
+
+    # 2️⃣ **Rank all segments in one pass over the main dataset**
+    rules = {s: PRODUCT_SEGMENTS[s] for s in segments}
+    if data is None:
+        # ✅ Reused across runs in the same process (e.g. the report daemon) until the dataset changes
+        rankings = cached_aggregate(
+            DATA_PATH, ("top_products", start_date, end_date, tuple(segments)),
+            lambda: rank_top_products(load_data(), start_date, end_date, rules),
+        )
+    else:
+        rankings = rank_top_products(data, start_date, end_date, rules)
+
+    os.makedirs(FINAL_DIR, exist_ok=True)
+    for segment, df_final in rankings.items():
+        if len(df_final) <= 2:
+            print(f"⚠️ No {segment} product sales found for {start_date} - {end_date}.")
+
+        sob_format = SOB_FORMATS.get(segment)
+        if sob_format:
+            df_final["SOB%"] = df_final["SOB%"].apply(lambda x: sob_format.format(x) if pd.notna(x) else "-")
+
+        output_file = final_csv_path(segment)
+        df_final.to_csv(output_file, index=False)
+        print(f"📂 **Saved top 20 {segment} products with totals & SOB% to:** {output_file}")
+
+    return rankings
+
+# ✅ Run script
+if __name__ == "__main__":
+    finalize_products()
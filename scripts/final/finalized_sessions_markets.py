@@ -7,7 +7,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -24,26 +28,13 @@ def format_sessions_data(df):
     - Sessions → 1 decimal in thousands (e.g., 1.5 for 1500 sessions)
     """
 
-    print("\n🔍 **Step 1: Raw 'Value' Column Before Formatting**")
-    print(df[["Market", "Value"]].head(10))  # Inspect raw values
+    log_frame(logger, "Step 1: Raw 'Value' Column Before Formatting", df[["Market", "Value"]], rows=10, index=True)
 
     df["Value"] = pd.to_numeric(df["Value"], errors="coerce")  # Ensure numeric values
 
-    def apply_formatting(row):
-        """Applies formatting for sessions data."""
-        original_value = row["Value"]  # Keep original for logging
-        
-        # Sessions: 1 decimal in thousands
-        formatted_value = round(row["Value"] / 1000, 1)  # Convert to thousands with 1 decimal
-
-        # Log transformation for debugging
-        print(f"🔄 Formatting '{row['Market']}': {original_value} → {formatted_value}")
-        return formatted_value
-
-    df["Value"] = df.apply(apply_formatting, axis=1)
+    df["Value"] = (df["Value"] / 1000).round(1)  # ✅ Convert to thousands with 1 decimal (whole column at once)
 
-    print("\n🔍 **Step 2: 'Value' Column After Formatting**")
-    print(df[["Market", "Value"]].head(10))  # Inspect transformed values
+    log_frame(logger, "Step 2: 'Value' Column After Formatting", df[["Market", "Value"]], rows=10, index=True)
 
     return df
 
@@ -53,7 +44,7 @@ def sort_and_save_sessions_data(input_file, csv_output):
 
     # ✅ Load the dataset
     try:
-        df = pd.read_csv(input_file, sep=";", decimal=",")
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -67,8 +58,7 @@ def sort_and_save_sessions_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # ✅ Apply formatting BEFORE pivoting
     df = format_sessions_data(df)
@@ -82,17 +72,12 @@ def sort_and_save_sessions_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # ✅ Assign sorting order based on the correct week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     # ✅ Sort data based on the last 8 weeks order
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted Sessions Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted Sessions Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -106,29 +91,21 @@ def sort_and_save_sessions_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Market", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: Sessions Data After Pivoting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 5: Sessions Data After Pivoting", df_pivot, rows=10, index=True)
 
     # ✅ Force final formatting after pivoting
-    for col in iso_weeks_sorted:
-        if col in df_pivot.columns:
-            df_pivot[col] = df_pivot.apply(
-                lambda row: round(row[col], 1) if pd.notna(row[col]) else row[col],
-                axis=1
-            )
+    df_pivot[iso_weeks_sorted] = df_pivot[iso_weeks_sorted].round(1)
 
-    print("\n📊 **Step 6: Sessions Data After Final Formatting**")
-    print(df_pivot.head(10))
+    log_frame(logger, "Step 6: Sessions Data After Final Formatting", df_pivot, rows=10, index=True)
 
     # ✅ Display full DataFrame in terminal
     pd.set_option("display.max_rows", None)
     pd.set_option("display.float_format", lambda x: f"{x:.1f}" if isinstance(x, float) else str(int(x)))
 
-    print("\n📊 **Final Formatted Sessions Data:**")
-    print(df_pivot.to_string(index=False))  # Display full DataFrame in readable format
+    log_frame(logger, "Final Formatted Sessions Data", df_pivot)
 
     # ✅ Save the sorted and formatted data as a CSV file
-    df_pivot.to_csv(csv_output, index=False)
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted sessions data to CSV: {csv_output}")
 
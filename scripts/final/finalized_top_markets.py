@@ -1,7 +1,14 @@
-import pandas as pd
+import sys
 import os
+import pandas as pd
 import numpy as np
 
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.growth import growth_frame, share_pct
+from calculator.formatting import GROWTH_PARENS, format_frame
+
 # Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 TOP_MARKETS_FILE = os.path.join(BASE_DIR, "data", "raw", "top_markets_raw.csv")
@@ -75,38 +82,17 @@ def calculate_revenue_growth(df_current, df_last_year):
         print("⚠️ Warning: Missing data for one of the years. Skipping growth calculation.")
         return pd.DataFrame()
 
-    growth_df = df_current.merge(df_last_year, on="Market", suffixes=(" (CY)", " (LY)"), how="left")
-    
-    # Fill missing values with 0 for markets that don't exist in last year
-    numeric_columns = growth_df.select_dtypes(include=[np.number]).columns
-    growth_df[numeric_columns] = growth_df[numeric_columns].fillna(0)
-
-    week_columns_cy = [col for col in growth_df.columns if "(CY)" in col and "8-week avg" not in col]
-    week_columns_ly = [col for col in growth_df.columns if "(LY)" in col and "8-week avg" not in col]
-
-    if not week_columns_cy or not week_columns_ly:
-        print(f"❌ Error: Missing expected columns in DataFrame: {week_columns_cy + week_columns_ly}")
+    week_columns = [col for col in df_current.columns if col.isdigit() and col in df_last_year.columns]
+    if not week_columns:
+        print(f"❌ Error: No matching week columns between years: {list(df_current.columns)} / {list(df_last_year.columns)}")
         return pd.DataFrame()
 
-    for week_cy in week_columns_cy:
-        week_ly = week_cy.replace(" (CY)", " (LY)")
-        growth_column = week_cy.replace(" (CY)", "")  # Keep original column name
-
-        if week_cy not in growth_df.columns or week_ly not in growth_df.columns:
-            continue  
-
-        growth_df[growth_column] = growth_df.apply(
-            lambda row: ((row[week_cy] / row[week_ly] - 1) * 100) if row[week_ly] != 0 else 0, axis=1
-        )
+    # ✅ Aligned CY/LY matrices; markets without last year data get LY = 0 and therefore 0 growth
+    growth_df = growth_frame(df_current, df_last_year, "Market", week_columns, fill=0)
 
     # For 8-week avg, use current week vs last year same week (not 8-week averages)
-    if "39 (CY)" in growth_df.columns and "39 (LY)" in growth_df.columns:
-        growth_df["8-week avg"] = growth_df.apply(
-            lambda row: ((row["39 (CY)"] / row["39 (LY)"] - 1) * 100) if row["39 (LY)"] != 0 else 0, axis=1
-        )
-
-    final_columns = ["Market"] + [col for col in growth_df.columns if "(LY)" not in col and "(CY)" not in col and col != "Market"]
-    growth_df = growth_df[final_columns]
+    if "39" in week_columns:
+        growth_df["8-week avg"] = growth_df["39"]
 
     return format_percentage(growth_df)
 
@@ -116,14 +102,14 @@ def calculate_revenue_share(df_current):
         print("⚠️ Warning: No data available for revenue share calculation.")
         return df_current
 
-    df_share = df_current.copy()
-    total_revenue = df_share[df_share["Market"] == "Total"].iloc[:, 1:].values  # Extract total revenue row
-
-    if total_revenue.size == 0:
+    total_rows = df_current[df_current["Market"] == "Total"]
+    if total_rows.empty:
         print("❌ Error: Total revenue row not found. Cannot calculate revenue share.")
         return pd.DataFrame()
 
-    df_share.iloc[:, 1:] = df_share.iloc[:, 1:].div(total_revenue, axis=1) * 100
+    value_columns = list(df_current.columns[1:])
+    df_share = df_current[["Market"]].copy()
+    df_share[value_columns] = share_pct(df_current[value_columns], total_rows[value_columns].iloc[0])
 
     return format_percentage(df_share)
 
@@ -141,21 +127,8 @@ def format_revenue(df):
 
 def format_percentage(df):
     """Formats percentage values: rounds normally, removes decimals, and applies parentheses for negatives."""
-    formatted_df = df.copy()
-
-    def format_value(val):
-        try:
-            val = float(val)  # ✅ Ensure conversion to float
-            val = round(val)  # ✅ Normal rounding instead of always rounding up
-            return f"({abs(int(val))})" if val < 0 else str(int(val))  # ✅ Format negatives in parentheses
-        except (ValueError, TypeError):
-            return val  
-
-    # Apply formatting to all numeric columns
-    for col in formatted_df.columns[1:]:  # Skip 'Market' column
-        formatted_df[col] = formatted_df[col].apply(format_value)
-
-    return formatted_df
+    # ✅ 'Market' keeps its labels; every other column is formatted in one vectorised pass
+    return format_frame(df, GROWTH_PARENS, columns={"Market": None})
 
 def finalize_top_markets():
     """Runs the finalized processing for Top Markets data and saves outputs."""
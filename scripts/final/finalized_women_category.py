@@ -7,7 +7,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # ✅ Import function to get last 8 weeks
-from calculator.date_utils import get_last_8_weeks
+from calculator.date_utils import get_last_8_weeks, week_sort_key
+from calculator.artifacts import read_table, write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -21,8 +25,7 @@ os.makedirs(os.path.dirname(CSV_OUTPUT_FILE), exist_ok=True)
 def merge_categories(df):
     """Merges 'Poolwear' and 'Swimwear' into 'Swim & Pool' and ensures correct formatting."""
 
-    print("\n🔍 **Step 1: Raw Data Before Merging Categories**")
-    print(df[["Product Category", "Value"]].head(10))  # Inspect raw values
+    log_frame(logger, "Step 1: Raw Data Before Merging Categories", df[["Product Category", "Value"]], rows=10, index=True)
 
     # ✅ Merge categories
     category_mapping = {
@@ -34,8 +37,7 @@ def merge_categories(df):
     # ✅ Aggregate values after merging categories
     df = df.groupby(["Year Type", "Calendar Year", "ISO Week", "Gender", "Product Category"], as_index=False)["Value"].sum()
 
-    print("\n📊 **Step 2: Data After Merging Categories**")
-    print(df[["Product Category", "Value"]].head(10))  # Inspect transformed values
+    log_frame(logger, "Step 2: Data After Merging Categories", df[["Product Category", "Value"]], rows=10, index=True)
 
     return df
 
@@ -45,7 +47,7 @@ def sort_and_save_women_category_data(input_file, csv_output):
 
     # ✅ Load the dataset
     try:
-        df = pd.read_csv(input_file)
+        df = read_table(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}. Please check the path and try again.")
         return
@@ -59,8 +61,7 @@ def sort_and_save_women_category_data(input_file, csv_output):
         print(f"❌ Missing required columns: {required_columns - set(df.columns)}")
         return
 
-    print("\n📊 **Step 0: Raw Data Loaded**")
-    print(df.head(10))
+    log_frame(logger, "Step 0: Raw Data Loaded", df, rows=10, index=True)
 
     # ✅ Replace NaN or missing values in critical columns
     df.fillna({"Gender": "WOMEN", "Product Category": "UNKNOWN", "Value": 0}, inplace=True)
@@ -80,17 +81,12 @@ def sort_and_save_women_category_data(input_file, csv_output):
     print("\n📆 **Step 3: Expected Week Order (newest → oldest):**", last_8_weeks_order)
 
     # ✅ Assign sorting order based on the correct week order
-    df["SortOrder"] = df.apply(
-        lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-        if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-        axis=1
-    )
+    df["SortOrder"] = week_sort_key(df, last_8_weeks_order)
 
     # ✅ Sort data based on the last 8 weeks order
     df_sorted = df.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-    print("\n📊 **Step 4: Sorted Women Category Revenue Data Before Pivoting**")
-    print(df_sorted.head(10))
+    log_frame(logger, "Step 4: Sorted Women Category Revenue Data Before Pivoting", df_sorted, rows=10, index=True)
 
     # ✅ Pivot table to have weeks as columns (newest → oldest)
     df_pivot = df_sorted.pivot_table(
@@ -107,11 +103,10 @@ def sort_and_save_women_category_data(input_file, csv_output):
     iso_weeks_sorted = [week[1] for week in last_8_weeks_order]
     df_pivot = df_pivot[["Gender", "Product Category", "Year Type"] + iso_weeks_sorted]
 
-    print("\n📊 **Step 5: Women Category Revenue Data After Pivoting**")
-    print(df_pivot.head(20))
+    log_frame(logger, "Step 5: Women Category Revenue Data After Pivoting", df_pivot, rows=20, index=True)
 
     # ✅ Save the sorted and formatted data as a CSV file
-    df_pivot.to_csv(csv_output, index=False)
+    write_table(df_pivot, csv_output)
 
     print(f"\n✅ Successfully saved formatted Women Category Revenue data to CSV: {csv_output}")
 
@@ -1,6 +1,14 @@
+import sys
 import os
 import pandas as pd
 
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # Define paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 RAW_DATA_DIR = os.path.join(BASE_DIR, "data", "raw")
@@ -70,15 +78,13 @@ def finalize_ytd_growth():
     df = df[COLUMN_ORDER]  # Reorder columns correctly
 
     # Debugging: Print raw DataFrame before formatting
-    print("\n🔍 **Raw YTD Growth Data Before Formatting:**")
-    print(df)  # Print full table
+    log_frame(logger, "Raw YTD Growth Data Before Formatting", df, index=True)
 
     # Apply growth formatting
     df = df.applymap(format_growth)
 
     # Debugging: Print formatted DataFrame after formatting
-    print("\n✅ **Formatted YTD Growth Data After Formatting:**")
-    print(df)  # Print full table
+    log_frame(logger, "Formatted YTD Growth Data After Formatting", df, index=True)
 
     # Save formatted Fiscal YTD Growth data
     df.to_csv(YTD_GROWTH_FINAL_PATH, index=True)
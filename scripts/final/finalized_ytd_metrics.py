@@ -1,6 +1,15 @@
+import sys
 import os
 import pandas as pd
 
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.formatting import PERCENT_1, THOUSANDS, format_frame
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
+
 # Define paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 RAW_DATA_DIR = os.path.join(BASE_DIR, "data", "raw")
@@ -34,43 +43,26 @@ METRIC_NAMES = [
 PERCENTAGE_COLUMNS = ["Return rate %", "Online Cost of Sale (CoS)"]
 COUNT_COLUMNS = ["Returning Customers", "New Customers"]
 
+# ✅ Revenue & spend in thousands (e.g. `1,010`), percentages with one decimal (e.g. `22.2%`),
+# customer counts as whole numbers (e.g. `350`); missing values ("N/A", "n/m", NaN) become "-"
+REVENUE_FORMAT = {**THOUSANDS, "missing": "-"}
+PERCENTAGE_FORMAT = {**PERCENT_1, "missing": "-"}
+COUNT_FORMAT = {"missing": "-"}
+METRIC_FORMATS = {
+    **{metric: PERCENTAGE_FORMAT for metric in PERCENTAGE_COLUMNS},
+    **{metric: COUNT_FORMAT for metric in COUNT_COLUMNS},
+}
+
 # Define required column order
 COLUMN_ORDER = ["ytd_current_month", "ytd_last_year", "ytd_two_years", "Budget(1)"]
 
-def format_value(value, metric_name):
-    """
-    Formats numerical values properly:
-    - Revenue & Returns in thousands (e.g., `1,010`)
-    - Percentages with one decimal and `%` (e.g., `22.2%`)
-    - Customer counts remain unchanged as whole numbers (e.g., `350`)
-    - Missing values replaced with `"-"`
-    """
-
-    if pd.isna(value) or value in ["N/A", "n/m", "-"]:
-        return "-"
-
-    # Convert to float if it's a string to avoid errors
-    try:
-        value = float(value)
-    except ValueError:
-        return value  # Return as-is if conversion fails
-
-    # Apply formatting rules based on metric type
-    if metric_name in PERCENTAGE_COLUMNS:
-        return f"{value:.1f}%"  # One decimal for percentage
-    elif metric_name in COUNT_COLUMNS:
-        return f"{int(value)}"  # Whole numbers for Returning/New Customers
-    else:
-        return f"{int(round(value / 1000)):,}"  # Thousands format for revenue & spend
-
 def finalize_ytd_metrics():
     """Loads, filters, formats, and saves the finalized Fiscal YTD data file."""
     # Load raw YTD metrics data
     df = pd.read_csv(YTD_METRICS_RAW_PATH, index_col=0)
 
     # Debugging: Print raw YTD metrics in DataFrame format
-    print("\n🔍 **Raw YTD Metrics Data Before Filtering & Formatting:**")
-    print(df)
+    log_frame(logger, "Raw YTD Metrics Data Before Filtering & Formatting", df, index=True)
 
     # Filter only required metrics
     df = df.loc[METRIC_NAMES]
@@ -80,15 +72,13 @@ def finalize_ytd_metrics():
         df["Budget(1)"] = "-"
 
     # Apply formatting
-    for metric in df.index:
-        df.loc[metric] = df.loc[metric].apply(lambda x: format_value(x, metric))
+    df = format_frame(df, REVENUE_FORMAT, rows=METRIC_FORMATS)
 
     # Reorder columns
     df = df[COLUMN_ORDER]
 
     # Debugging: Print formatted YTD metrics in DataFrame format
-    print("\n✅ **Formatted YTD Metrics Data After Filtering & Formatting:**")
-    print(df)
+    log_frame(logger, "Formatted YTD Metrics Data After Filtering & Formatting", df, index=True)
 
     # Save formatted Fiscal YTD data
     df.to_csv(YTD_METRICS_FINAL_PATH, index=True)
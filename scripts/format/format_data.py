@@ -6,6 +6,9 @@ import pandas as pd
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.date_utils import get_key_dates  # Import date logic
+from calculator.report_logging import frames_enabled, get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def format_data(file_path, output_csv):
     """
@@ -59,9 +62,9 @@ def format_data(file_path, output_csv):
     df.to_csv(output_csv, index=False, na_rep="null")
     print(f"✅ Data formatted and saved to {output_csv}")
 
-    # Debugging: Print YEAR2 classification counts
-    print("\n📊 YEAR2 Classification Counts:")
-    print(df['YEAR2'].value_counts(dropna=False))  # Ensures null values are counted
+    # Debugging: Print YEAR2 classification counts (counted only when frame dumps are on)
+    if frames_enabled(logger):
+        log_frame(logger, "YEAR2 Classification Counts", df['YEAR2'].value_counts(dropna=False), index=True)
 
     return df  # Return DataFrame for further processing
 
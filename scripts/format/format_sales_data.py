@@ -1,6 +1,12 @@
+import sys
 import os
 import pandas as pd
 
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.control_totals import record_control_totals
+
 # ✅ Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 DATA_FOLDER = os.path.join(BASE_DIR, "data")
@@ -28,5 +34,8 @@ def convert_weekly_data():
     df.to_csv(CSV_OUTPUT_FILE, index=False)
     print(f"✅ Formatted data saved to: {CSV_OUTPUT_FILE}")
 
+    # ✅ Control totals for the reconciliation audit (by-product of the rows already in memory)
+    record_control_totals(df, "sales")
+
 if __name__ == "__main__":
     convert_weekly_data()
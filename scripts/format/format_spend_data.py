@@ -1,21 +1,32 @@
+import sys
 import os
+import json
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# ✅ Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator.control_totals import record_control_totals
+from calculator.report_logging import get_logger, log_frame
+from pipeline.build_cache import file_digest
+
+logger = get_logger(__file__)
+
 # ✅ Define paths
 BASE_DIR = "/Users/axelsamuelson/Documents/CDLP_CODE/weekly_reports_powerpoint"
 UNFORMATTED_DIR = os.path.join(BASE_DIR, "data/Marketing Spend/unformatted")
 FORMATTED_DIR = os.path.join(BASE_DIR, "data/formatted")
 
-MERGED_CSV_FILE = os.path.join(FORMATTED_DIR, "marketing_spend_merged.csv")  # Merged raw data
-FORMATTED_CSV_FILE = os.path.join(FORMATTED_DIR, "marketing_spend_formatted.csv")  # Final formatted dataset
-
-# ✅ Ensure output directory exists
-os.makedirs(FORMATTED_DIR, exist_ok=True)
+FORMATTED_CSV_FILE = os.path.join(FORMATTED_DIR, "marketing_spend_formatted.csv")  # Deduplicated spend store
+MANIFEST_FILE = os.path.join(FORMATTED_DIR, "marketing_spend_manifest.json")  # Exports behind the store
 
 # ✅ Expected column names (keeping only relevant ones)
 EXPECTED_COLUMNS = ["Market", "Date", "Total Spend", "Ad Spend", "FB Spend"]
 KEEP_COLUMNS = ["Market", "Date", "Total Spend"]  # ✅ Only keep these
+STORE_COLUMNS = KEEP_COLUMNS + ["Source"]  # ✅ Source = export file name
+SPEND_DTYPES = {"Market": str, "Date": str}  # ✅ Total Spend: float64 when clean, else text for clean_numeric_values
 
 def get_week_ranges():
     """Returns start and end dates for Current Week, Last Week, Last Year, and 2023."""
@@ -44,53 +55,191 @@ def get_week_ranges():
         "year_2023": (year_2023_monday.date(), year_2023_sunday.date()),
     }
 
-def clean_numeric_values(df, column_name):
-    """Converts values to numeric, handling potential formatting issues."""
-    df[column_name] = df[column_name].astype(str).str.replace(',', '', regex=True)
-    df[column_name] = pd.to_numeric(df[column_name], errors="coerce").fillna(0)
+def clean_numeric_values(values):
+    """
+    Spend values as floats (missing → 0). Columns the CSV parser already read
+    as numbers pass straight through; otherwise only the cells that are not
+    plain numbers (e.g. "1,234.50") get their thousands separators stripped.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).fillna(0)
+    numbers = pd.to_numeric(values, errors="coerce")
+    text = numbers.isna() & values.notna()
+    if text.any():
+        numbers[text] = pd.to_numeric(values[text].astype(str).str.replace(",", "", regex=False), errors="coerce")
+    return numbers.fillna(0)
+
+def load_spend_manifest():
+    """
+    The exports the store was built from (empty on the first run): per export
+    its digest, rows, last data date, file mtime and parse error, if any.
+    """
+    if not os.path.exists(MANIFEST_FILE) or not os.path.exists(FORMATTED_CSV_FILE):
+        return {"files": {}, "sources": {}}
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    manifest.setdefault("files", {})
+    manifest.setdefault("sources", {})
+    if not all(isinstance(entry, dict) for entry in manifest["sources"].values()):
+        manifest["sources"] = {}  # ✅ Written before exports had a recency key: start over
+    return manifest
+
+def save_spend_manifest(manifest):
+    """Writes the manifest atomically (temp file + rename)."""
+    os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+    temp_file = f"{MANIFEST_FILE}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(temp_file, MANIFEST_FILE)
+
+def parse_spend_file(file_path):
+    """
+    Reads one spend export into Market, Date, Total Spend rows (rows without a
+    valid date are dropped). Exports in another layout (e.g. the ";"-separated
+    dema files) have no valid dates in the Date position and yield no rows.
+    """
+    # ✅ Explicit dtypes; quoted "1,234.50" spend is parsed by the C reader. Columns are
+    # selected after reading: `usecols` fails on files with fewer columns than `names`
+    df = pd.read_csv(
+        file_path, header=None, names=EXPECTED_COLUMNS, skiprows=1,
+        dtype=SPEND_DTYPES, thousands=",", na_values=["#N/A"], low_memory=False,
+    )[KEEP_COLUMNS]
+
+    # ✅ Convert Date column to datetime
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.date
+    df = df.dropna(subset=["Date"])  # Drop rows with missing dates
+
+    # ✅ Ensure numeric formatting for Total Spend
+    df["Total Spend"] = clean_numeric_values(df["Total Spend"])
     return df
 
-def load_and_clean_spend_data():
-    """Reads, cleans, and processes marketing spend data (keeping all data)."""
-    all_dataframes = []
-    error_files = []
+def _parse_spend_export(file_path):
+    """Pool task: (rows, None) or (None, error message), so one bad export does not stop the others."""
+    try:
+        return parse_spend_file(file_path), None
+    except Exception as e:
+        return None, str(e)
 
-    # ✅ Load all CSV files in the unformatted directory
-    for filename in sorted(os.listdir(UNFORMATTED_DIR)):
-        if filename.endswith(".csv"):
-            file_path = os.path.join(UNFORMATTED_DIR, filename)
+def parse_spend_files(filenames, max_workers=None):
+    """
+    Parses the exports on a thread pool (pandas' C reader releases the GIL
+    while tokenizing, and threads also work when the pipeline runs this
+    script in-process). Returns {filename: (rows, error)}.
+    """
+    paths = {f: os.path.join(UNFORMATTED_DIR, f) for f in filenames}
+    workers = min(max_workers or os.cpu_count() or 2, len(paths))
+    if workers <= 1:
+        return {f: _parse_spend_export(path) for f, path in paths.items()}
 
-            try:
-                df = pd.read_csv(file_path, header=None, names=EXPECTED_COLUMNS, skiprows=1, na_values=["#N/A"], low_memory=False)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {f: pool.submit(_parse_spend_export, path) for f, path in paths.items()}
+        return {f: future.result() for f, future in futures.items()}
 
-                # ✅ Keep only required columns
-                df = df[KEEP_COLUMNS]
+def load_spend_store():
+    """The current deduplicated store."""
+    store = pd.read_csv(FORMATTED_CSV_FILE, dtype={"Market": str, "Source": str})
+    store["Date"] = pd.to_datetime(store["Date"]).dt.date
+    return store
 
-                # ✅ Convert Date column to datetime
-                df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.date
-                df = df.dropna(subset=["Date"])  # Drop rows with missing dates
+def source_entry(filename, digest, df=None, error=None):
+    """Manifest entry of one parsed (or failed) export."""
+    stat = os.stat(os.path.join(UNFORMATTED_DIR, filename))
+    rows = 0 if df is None else len(df)
+    return {
+        "digest": digest,
+        "rows": rows,
+        "last_date": df["Date"].max().isoformat() if rows else None,
+        "mtime_ns": stat.st_mtime_ns,
+        "error": error,
+    }
+
+def export_recency(filename, entry):
+    """
+    Sort key of an export: the last day it has data for, then when the file
+    was written, then its name. Export names mix several schemes (250309.csv,
+    W10.csv, Dec-21.csv, 210101-250930_dema_data.csv), so the name only breaks ties.
+    """
+    return (entry.get("last_date") or "", entry.get("mtime_ns") or 0, filename)
+
+def resolve_overlaps(df, sources):
+    """
+    Latest export wins: for each (Market, Date), only the rows from the most
+    recent source (see export_recency; `sources` is the manifest's entries)
+    are kept. Rows within one export are all kept.
+    """
+    order = sorted(df["Source"].unique(), key=lambda source: export_recency(source, sources.get(source, {})))
+    rank = df["Source"].map({source: i for i, source in enumerate(order)})
+    latest = rank.groupby([df["Market"], df["Date"]], dropna=False).transform("max")
+    return df[rank == latest]
+
+def load_and_clean_spend_data():
+    """
+    Updates the deduplicated spend store from the exports in the unformatted
+    directory. Unchanged exports (same content digest) are not parsed again;
+    new exports are merged into the store, and a changed or removed export
+    rebuilds it from all exports. Exports that failed to parse or had no rows
+    are recorded too, and skipped until their content changes.
+    """
+    error_files = []
+    manifest = load_spend_manifest()
+    filenames = sorted(f for f in os.listdir(UNFORMATTED_DIR) if f.endswith(".csv"))
 
-                # ✅ Ensure numeric formatting for Total Spend
-                df = clean_numeric_values(df, "Total Spend")
+    # ✅ Content digests (memoized by mtime & size) → which exports are new or changed
+    digests = {f: file_digest(os.path.join(UNFORMATTED_DIR, f), manifest) for f in filenames}
+    known = manifest["sources"]
+    changed = [f for f in filenames if known.get(f, {}).get("digest") != digests[f]]
+    removed = [f for f in known if f not in digests]
+    skipped = [f for f in filenames if f not in changed and not known[f]["rows"]]
+    if skipped:
+        print(f"⏭️ Skipping {len(skipped)} unchanged exports that failed or had no rows: {', '.join(skipped)}")
 
-                all_dataframes.append(df)
+    if not changed and not removed:
+        save_spend_manifest(manifest)
+        print(f"✅ Spend store up to date ({len(filenames)} exports unchanged): {FORMATTED_CSV_FILE}")
+        return
 
-            except Exception as e:
-                error_files.append((filename, str(e)))
-                print(f"❌ Error loading {filename}: {e}")
+    # ✅ Only rows already in the store force a rebuild; a new or previously empty export is merged
+    rebuild = bool(removed) or any(known.get(f, {}).get("rows") for f in changed)
+    to_parse = [f for f in filenames if f not in skipped] if rebuild else changed
+    print(f"📥 {'Rebuilding' if rebuild else 'Updating'} spend store: parsing {len(to_parse)} of {len(filenames)} exports")
 
-    if not all_dataframes:
-        print("⚠️ No valid files found. Please check the directory and file formats.")
+    sources = {f: known[f] for f in skipped} if rebuild else dict(known)
+    new_dataframes = []
+    for filename, (df, error) in parse_spend_files(to_parse).items():
+        sources[filename] = source_entry(filename, digests[filename], df, error)
+        if error is not None:
+            error_files.append((filename, error))
+            print(f"❌ Error loading {filename}: {error}")
+        elif df.empty:
+            print(f"⚠️ {filename}: no spend rows (skipped until it changes)")
+        else:
+            new_dataframes.append(df.assign(Source=filename))
+
+    manifest["sources"] = sources
+    if not new_dataframes:
+        if rebuild:
+            print("⚠️ No valid files found. Please check the directory and file formats.")
+        else:
+            save_spend_manifest(manifest)
+            print(f"✅ No new spend rows; store unchanged: {FORMATTED_CSV_FILE}")
         return
 
-    # ✅ Merge all data (without removing duplicates)
-    merged_df = pd.concat(all_dataframes, ignore_index=True)
-    merged_df.to_csv(MERGED_CSV_FILE, index=False)
-    print(f"\n📂 **Saved merged data (without duplicate removal) to:** {MERGED_CSV_FILE}")
+    # ✅ Resolve overlapping re-exports and write the single store
+    store = [] if rebuild or not any(entry["rows"] for entry in known.values()) else [load_spend_store()]
+    combined = pd.concat(store + new_dataframes, ignore_index=True)
+    merged_df = resolve_overlaps(combined, sources)
+    superseded = combined["Source"].value_counts().sub(merged_df["Source"].value_counts(), fill_value=0)
+    for filename, rows in superseded[superseded > 0].items():
+        print(f"🔁 {filename}: {int(rows)} rows superseded by a later export")
 
-    # ✅ Save the merged dataset as the final dataset (all data kept)
+    merged_df = merged_df[STORE_COLUMNS].sort_values(["Date", "Market"], kind="stable")
+    os.makedirs(os.path.dirname(FORMATTED_CSV_FILE), exist_ok=True)
     merged_df.to_csv(FORMATTED_CSV_FILE, index=False)
-    print(f"\n✅ **Final processed data saved to:** {FORMATTED_CSV_FILE}")
+    save_spend_manifest(manifest)
+    print(f"\n✅ **Deduplicated spend store saved to:** {FORMATTED_CSV_FILE}")
+
+    # ✅ Control totals for the reconciliation audit (by-product of the rows already in memory)
+    record_control_totals(merged_df, "spend")
 
     # ✅ Display debugging info
     print("\n📊 **Summary of Final Spend Data:**")
@@ -115,11 +264,10 @@ def load_and_clean_spend_data():
             print(f"📅 **Last Week Range:** {week_start} - {week_end}")
             print(f"🔢 **Unique Dates Found:** {week_df['Date'].nunique()} (should be 7)")
             print(f"💰 **Total Spend Last Week:** {round(total_spend)}")
-            print("\n📝 **First 5 Rows from Last Week Data:**")
-            print(week_df.head())
+            log_frame(logger, "First 5 Rows from Last Week Data", week_df, rows=5, index=True)
 
     # ✅ Print Spend Summary
-    print("\n💰 **Marketing Spend Summary (All Entries Kept):**")
+    print("\n💰 **Marketing Spend Summary (Latest Export per Market & Day):**")
     print(f"📅 **Current Week ({week_ranges['current_week'][0]} - {week_ranges['current_week'][1]}):** {round(spend_summaries['current_week'])}")
     print(f"📅 **Last Week ({week_ranges['last_week'][0]} - {week_ranges['last_week'][1]}):** {round(spend_summaries['last_week'])}")
     print(f"📅 **Last Year ({week_ranges['last_year'][0]} - {week_ranges['last_year'][1]}):** {round(spend_summaries['last_year'])}")
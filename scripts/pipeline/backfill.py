@@ -0,0 +1,200 @@
+"""
+Multi-week backfill: regenerates the slide data (data/raw + data/final) for a
+range of report Sundays in one run.
+
+Every week gets its own output root, data/backfill/<YYMMDD>/, laid out like
+the repo so the unmodified prepare/final scripts write into it: each script
+is executed with `__file__` pointing inside the week root, and the shared
+inputs (data/formatted, session_data.csv, gm2.csv) are linked in. Weeks are
+independent and run on a process pool; each worker sets
+`date_utils.MANUAL_LAST_SUNDAY` for its week and reuses the datasets the
+parent loaded once (inherited on fork, loaded once per worker otherwise).
+"""
+
+import sys
+import os
+import time
+import shutil
+import argparse
+import builtins
+import importlib
+import contextlib
+import multiprocessing
+from datetime import date, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ensure correct import paths
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from pipeline.steps import STEPS
+from pipeline.runner import DEFAULT_WORKERS, build_graph, select_steps, topological_order
+from calculator import date_utils
+
+BACKFILL_DIR = os.path.join(BASE_DIR, "data", "backfill")
+
+# ✅ Inputs read through the scripts' own BASE_DIR, linked into every week root
+SHARED_INPUTS = ["data/formatted", "data/session_data.csv", "data/gm2.csv"]
+
+def report_sundays(first, last):
+    """Every Sunday from `first` to `last` (both snapped back to a Sunday)."""
+    first = first - timedelta(days=(first.weekday() + 1) % 7)
+    last = last - timedelta(days=(last.weekday() + 1) % 7)
+    if first > last:
+        raise ValueError(f"❌ Backfill range is empty: {first} → {last}")
+    return [first + timedelta(weeks=i) for i in range((last - first).days // 7 + 1)]
+
+def week_root(sunday):
+    return os.path.join(BACKFILL_DIR, sunday.strftime("%y%m%d"))
+
+def backfill_steps(slides=None, steps=STEPS):
+    """Data steps (outputs only in data/raw or data/final) needed for the slides, in dependency order."""
+    data_steps = {
+        name: step for name, step in steps.items()
+        if step["outputs"] and all(o.startswith(("data/raw/", "data/final/")) for o in step["outputs"])
+    }
+    # ✅ Workbook and deck steps are dropped; their data-producing upstream is kept
+    selected = select_steps(slides, steps=steps)
+    return topological_order(selected & set(data_steps), build_graph(data_steps))
+
+def prepare_week_root(sunday):
+    """Creates data/backfill/<YYMMDD>/data/{raw,final} and links the shared inputs into it."""
+    root = week_root(sunday)
+    for folder in ("raw", "final"):
+        os.makedirs(os.path.join(root, "data", folder), exist_ok=True)
+
+    for artifact in SHARED_INPUTS:
+        source = os.path.join(BASE_DIR, artifact)
+        target = os.path.join(root, artifact)
+        if not os.path.exists(source) or os.path.lexists(target):
+            continue
+        try:
+            os.symlink(source, target, target_is_directory=os.path.isdir(source))
+        except OSError:
+            # ✅ No symlink permission (e.g. Windows without developer mode): copy instead
+            if os.path.isdir(source):
+                shutil.copytree(source, target)
+            else:
+                shutil.copy2(source, target)
+    return root
+
+def _exec_in_root(step, root):
+    """
+    Executes a step's source with `__file__` inside `root`, so every path the
+    script derives from its own location lands in the week's folder.
+    Entry steps are executed as a module namespace and their function called.
+    """
+    if step["entry"]:
+        module_name, function_name = step["entry"].split(":")
+        source = os.path.join(SCRIPTS_DIR, module_name.replace(".", os.sep) + ".py")
+        namespace_name = f"backfill.{module_name}"
+    else:
+        source = os.path.join(BASE_DIR, step["script"])
+        function_name, namespace_name = None, "__main__"
+
+    shadow_file = os.path.join(root, os.path.relpath(source, BASE_DIR))
+    with open(source, "rb") as file:
+        code = compile(file.read(), source, "exec")
+
+    namespace = {"__name__": namespace_name, "__file__": shadow_file, "__package__": None, "__builtins__": builtins}
+    saved_path = list(sys.path)
+    try:
+        exec(code, namespace)
+        if function_name:
+            namespace[function_name](*step.get("args", ()))
+    finally:
+        # ✅ Scripts append their (shadow) parent dir to sys.path; don't let it grow per week
+        sys.path[:] = saved_path
+
+def _warm_cache():
+    """Loads the shared datasets into the process-wide cache."""
+    metrics_calculator = importlib.import_module("calculator.metrics_calculator")
+    metrics_calculator.load_data()
+    metrics_calculator.load_spend_data()
+    metrics_calculator.load_session_data()
+
+def backfill_week(sunday, step_names):
+    """
+    Worker: runs the data steps for one report week into its own folder.
+    Returns (sunday, {step: status}, seconds); script output goes to backfill.log.
+    """
+    started = time.perf_counter()
+    date_utils.MANUAL_LAST_SUNDAY = sunday
+    root = prepare_week_root(sunday)
+    graph = build_graph({name: STEPS[name] for name in step_names})
+    statuses = {}
+
+    with open(os.path.join(root, "backfill.log"), "w", encoding="utf-8") as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        print(f"📆 **Backfill week ending {sunday}**")
+        for name in step_names:
+            if any(statuses.get(dep) in ("failed", "skipped") for dep in graph[name]):
+                statuses[name] = "skipped"
+                continue
+            print(f"\n🚀 **Running {name}...**")
+            try:
+                _exec_in_root(STEPS[name], root)
+                statuses[name] = "ok"
+            except SystemExit as exit_signal:
+                statuses[name] = "ok" if exit_signal.code in (None, 0) else "failed"
+            except Exception as e:
+                print(f"❌ **Error in {name}: {e}**")
+                statuses[name] = "failed"
+
+    return sunday, statuses, time.perf_counter() - started
+
+def _pool_context():
+    """Fork where available so workers inherit the parent's loaded datasets."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else methods[0])
+
+def run_backfill(first, last, slides=None, max_workers=DEFAULT_WORKERS):
+    """
+    Regenerates the slide data for every report Sunday between `first` and
+    `last` into data/backfill/<YYMMDD>/. Returns {sunday: {step: status}}.
+    """
+    sundays = report_sundays(first, last)
+    step_names = backfill_steps(slides)
+    print(f"\n🗓️ **Backfilling {len(sundays)} weeks ({sundays[0]} → {sundays[-1]}), {len(step_names)} steps per week**")
+
+    # 1️⃣ **Load the datasets once; forked workers inherit them**
+    started = time.perf_counter()
+    _warm_cache()
+    print(f"📥 **Datasets loaded in {time.perf_counter() - started:.1f}s**")
+
+    # 2️⃣ **Run independent weeks on a process pool**
+    context = _pool_context()
+    initializer = None if context.get_start_method() == "fork" else _warm_cache
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(sundays)), mp_context=context, initializer=initializer) as pool:
+        futures = {pool.submit(backfill_week, sunday, step_names): sunday for sunday in sundays}
+        for future in as_completed(futures):
+            sunday = futures[future]
+            try:
+                _, statuses, seconds = future.result()
+            except Exception as e:
+                print(f"❌ **Week {sunday} crashed: {e}**")
+                results[sunday] = {name: "failed" for name in step_names}
+                continue
+            results[sunday] = statuses
+            failed = sorted(name for name, status in statuses.items() if status != "ok")
+            icon = "✅" if not failed else "⚠️"
+            detail = f" (failed/skipped: {', '.join(failed)})" if failed else ""
+            print(f"{icon} **Week {sunday} done in {seconds:.1f}s → {week_root(sunday)}**{detail}")
+
+    print(f"\n⏱️ **Backfill wall time:** {time.perf_counter() - started:.1f}s")
+    return dict(sorted(results.items()))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the slide data for a range of report weeks.")
+    parser.add_argument("first", type=date.fromisoformat, help="First report Sunday (YYYY-MM-DD)")
+    parser.add_argument("last", type=date.fromisoformat, help="Last report Sunday (YYYY-MM-DD)")
+    parser.add_argument("--slides", type=int, nargs="*", help="Slide numbers to backfill (default: all)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Weeks processed in parallel")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_backfill(args.first, args.last, args.slides or None, args.workers)
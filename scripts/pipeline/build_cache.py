@@ -0,0 +1,154 @@
+"""
+Content-addressed build tracking for the step DAG.
+
+Every step gets a fingerprint made of the hashes of its input artifacts,
+the source of the code it runs (plus the shared `calculator`, `excel` and
+`visualization` packages) and the report parameters. A step whose fingerprint matches the last successful
+build, and whose output files still exist, is skipped.
+"""
+
+import sys
+import os
+import json
+import glob
+import hashlib
+import threading
+
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from calculator.date_utils import get_latest_sunday
+
+BUILD_DIR = os.path.join(BASE_DIR, "data", ".build")
+MANIFEST_FILE = os.path.join(BUILD_DIR, "manifest.json")
+# ✅ Packages the step scripts import: a change to any of them re-runs every step
+SHARED_CODE = [os.path.join(SCRIPTS_DIR, package, "*.py") for package in ("calculator", "excel", "visualization")]
+
+_MANIFEST_LOCK = threading.Lock()
+
+def load_manifest():
+    """Loads the build manifest (empty if this is the first incremental run)."""
+    if not os.path.exists(MANIFEST_FILE):
+        return {"files": {}, "steps": {}}
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    manifest.setdefault("files", {})
+    manifest.setdefault("steps", {})
+    return manifest
+
+def save_manifest(manifest):
+    """Writes the manifest atomically (temp file + rename)."""
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with _MANIFEST_LOCK:
+        temp_file = f"{MANIFEST_FILE}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1, sort_keys=True)
+        os.replace(temp_file, MANIFEST_FILE)
+
+def file_digest(path, manifest):
+    """
+    SHA-256 of a file's content. The digest is memoized in the manifest by
+    (mtime, size) so unchanged multi-hundred-MB exports are not re-read.
+    """
+    stat = os.stat(path)
+    key = os.path.relpath(path, BASE_DIR)
+    with _MANIFEST_LOCK:
+        cached = manifest["files"].get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    with _MANIFEST_LOCK:
+        manifest["files"][key] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+    return digest.hexdigest()
+
+def artifact_digest(artifact, manifest, producers):
+    """
+    Digest of one input artifact: file content, directory listing + contents,
+    or – for workbook sheets – the fingerprint of the step that wrote it.
+    """
+    if artifact.startswith("xlsm:"):
+        with _MANIFEST_LOCK:
+            return "|".join(manifest["steps"].get(p, {}).get("fingerprint", "missing") for p in producers.get(artifact, []))
+
+    path = os.path.join(BASE_DIR, artifact)
+    if os.path.isdir(path):
+        entries = sorted(os.listdir(path))
+        return hashlib.sha256("".join(
+            f"{entry}:{file_digest(os.path.join(path, entry), manifest)};"
+            for entry in entries if os.path.isfile(os.path.join(path, entry))
+        ).encode()).hexdigest()
+    if os.path.exists(path):
+        return file_digest(path, manifest)
+    return "missing"
+
+def code_files(step):
+    """Source files whose content defines the step's code version."""
+    if step["entry"]:
+        module_path = step["entry"].split(":")[0].replace(".", os.sep) + ".py"
+        files = [os.path.join(SCRIPTS_DIR, module_path)]
+    else:
+        files = [os.path.join(BASE_DIR, step["script"])]
+    for pattern in SHARED_CODE:
+        files.extend(sorted(glob.glob(pattern)))
+    return files
+
+def build_params():
+    """Report parameters every step depends on (covers `MANUAL_LAST_SUNDAY`)."""
+    return {"last_sunday": str(get_latest_sunday())}
+
+def step_fingerprint(name, step, manifest, producers, params=None):
+    """Hash of the step's inputs, code version and parameters."""
+    parts = {
+        "step": name,
+        "inputs": {artifact: artifact_digest(artifact, manifest, producers) for artifact in step["inputs"]},
+        "code": {os.path.relpath(path, BASE_DIR): file_digest(path, manifest) for path in code_files(step) if os.path.exists(path)},
+        "params": params if params is not None else build_params(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+def outputs_exist(step):
+    """True if every output file of the step is on disk (sheets count as present when the workbook exists)."""
+    for artifact in step["outputs"]:
+        path = os.path.join(BASE_DIR, "data", "weekly_report.xlsm") if artifact.startswith("xlsm:") else os.path.join(BASE_DIR, artifact)
+        if not os.path.exists(path):
+            return False
+    return True
+
+def is_up_to_date(name, step, fingerprint, manifest):
+    """True if the last successful build of `name` had the same fingerprint and its outputs still exist."""
+    with _MANIFEST_LOCK:
+        recorded = manifest["steps"].get(name, {}).get("fingerprint")
+    return recorded == fingerprint and outputs_exist(step)
+
+def record_build(name, fingerprint, manifest):
+    """Stores the fingerprint of a successful build and persists the manifest."""
+    with _MANIFEST_LOCK:
+        manifest["steps"][name] = {"fingerprint": fingerprint}
+    save_manifest(manifest)
+
+def plan_rebuild(order, graph, steps, manifest, producers, force=False):
+    """
+    Dry run: returns {step: reason} for every step that would rebuild, walking
+    `order` topologically. A step is stale when forced, when an upstream step is
+    stale, when its fingerprint changed or when an output file is missing.
+    """
+    params = build_params()
+    stale = {}
+    for name in order:
+        step = steps[name]
+        upstream = sorted(dep for dep in graph[name] if dep in stale)
+        if force:
+            stale[name] = "forced"
+        elif upstream:
+            stale[name] = f"upstream {', '.join(upstream)}"
+        elif not outputs_exist(step):
+            stale[name] = "missing output"
+        elif not is_up_to_date(name, step, step_fingerprint(name, step, manifest, producers, params), manifest):
+            stale[name] = "inputs, code or parameters changed"
+    return stale
@@ -0,0 +1,208 @@
+"""
+Resident report daemon.
+
+Keeps one interpreter alive with pandas/openpyxl imported and the order,
+spend and session datasets (plus cached aggregates such as the product
+cube) in memory. A watcher polls the exports in data/ and refreshes only
+the source that changed. Requests arrive over a local TCP socket as one
+JSON line each:
+
+    python scripts/pipeline/daemon.py serve
+    python scripts/pipeline/daemon.py slide 4 12
+    python scripts/pipeline/daemon.py deck
+    python scripts/pipeline/daemon.py status
+    python scripts/pipeline/daemon.py stop
+
+Slides are rebuilt through the incremental runner, so only steps whose
+inputs changed are re-run.
+"""
+
+import sys
+import os
+import json
+import time
+import socket
+import argparse
+import threading
+import socketserver
+
+# Ensure correct import paths
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from pipeline.steps import STEPS, SLIDES
+from pipeline import build_cache
+from pipeline.runner import DEFAULT_WORKERS, WORKBOOK_PATH, producers_by_artifact, run_pipeline, run_step
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("REPORT_DAEMON_PORT", "8765"))
+POLL_SECONDS = 2.0
+
+# ✅ Watched sources: export → format step → formatted dataset → loader name in metrics_calculator
+SOURCES = {
+    "sales": {"export": "data/Weekly_Data.xlsx", "format_step": "format_sales_data", "loader": "load_data"},
+    "spend": {"export": "data/Marketing Spend/unformatted", "format_step": "format_spend_data", "loader": "load_spend_data"},
+    "sessions": {"export": "data/session_data.csv", "format_step": None, "loader": "load_session_data"},
+}
+
+def source_stamp(artifact):
+    """Latest modification time of a file, or of any file in a directory (None if missing)."""
+    path = os.path.join(BASE_DIR, artifact)
+    if os.path.isdir(path):
+        stamps = [os.path.getmtime(os.path.join(path, f)) for f in os.listdir(path)]
+        return max(stamps, default=os.path.getmtime(path))
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+class ReportState:
+    """In-memory state shared by the watcher and the request handlers."""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        from calculator import metrics_calculator
+        from excel import workbook_session
+        self.metrics_calculator = metrics_calculator
+        self.workbook_session = workbook_session
+        self.workers = workers
+        self.build_lock = threading.Lock()  # ✅ One build at a time; the workbook is a single file
+        self.stamps = {}
+        self.started = time.time()
+        self.refreshed = {}
+
+    def refresh_source(self, name):
+        """Re-formats a changed export (if it has a format step) and reloads only its dataset."""
+        source = SOURCES[name]
+        if source["format_step"]:
+            step = STEPS[source["format_step"]]
+            status, seconds = run_step(source["format_step"], step)
+            if status != "ok":
+                print(f"❌ **Could not re-format {name} export**")
+                return
+            # ✅ Record the build so the next incremental run does not format it again
+            manifest = build_cache.load_manifest()
+            fingerprint = build_cache.step_fingerprint(source["format_step"], step, manifest, producers_by_artifact())
+            build_cache.record_build(source["format_step"], fingerprint, manifest)
+
+        started = time.perf_counter()
+        getattr(self.metrics_calculator, source["loader"])()
+        self.refreshed[name] = time.strftime("%Y-%m-%d %H:%M:%S")
+        print(f"🔄 **Reloaded {name} dataset in {time.perf_counter() - started:.1f}s**")
+
+    def warm(self):
+        """Loads every dataset once and records the export stamps."""
+        for name, source in SOURCES.items():
+            self.stamps[name] = source_stamp(source["export"])
+            getattr(self.metrics_calculator, source["loader"])()
+            self.refreshed[name] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def poll(self):
+        """Refreshes every source whose export changed since the last poll, and swaps in a staged workbook once unlocked."""
+        if os.path.exists(self.workbook_session.staged_path(WORKBOOK_PATH)):
+            with self.build_lock:
+                self.workbook_session.promote_staged(WORKBOOK_PATH)
+        for name, source in SOURCES.items():
+            stamp = source_stamp(source["export"])
+            if stamp != self.stamps.get(name):
+                self.stamps[name] = stamp
+                with self.build_lock:
+                    print(f"\n👀 **New {name} export detected**")
+                    try:
+                        self.refresh_source(name)
+                    except Exception as e:
+                        print(f"❌ **Error refreshing {name}: {e}**")
+
+    def build(self, slides=None, force=False):
+        with self.build_lock:
+            started = time.perf_counter()
+            results = run_pipeline(slides, self.workers, force=force, viewer=False)
+            return {"results": results, "seconds": round(time.perf_counter() - started, 3)}
+
+    def status(self):
+        return {
+            "uptime_seconds": round(time.time() - self.started),
+            "datasets_refreshed": self.refreshed,
+            "slides": sorted(SLIDES),
+        }
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handles one JSON request line and answers with one JSON line."""
+
+    def handle(self):
+        state = self.server.state
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            command = request.get("command")
+            if command == "slide":
+                response = state.build([int(s) for s in request["slides"]], request.get("force", False))
+            elif command == "deck":
+                response = state.build(None, request.get("force", False))
+            elif command == "status":
+                response = state.status()
+            elif command == "stop":
+                response = {"stopping": True}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = {"error": f"Unknown command: {command}"}
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+
+class ReportServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+def serve(host=HOST, port=PORT, workers=DEFAULT_WORKERS, poll_seconds=POLL_SECONDS):
+    """Warms the datasets, starts the export watcher and serves requests until stopped."""
+    print("\n🔥 **Loading datasets...**")
+    state = ReportState(workers)
+    state.warm()
+
+    stop = threading.Event()
+
+    def watch():
+        while not stop.wait(poll_seconds):
+            state.poll()
+
+    threading.Thread(target=watch, daemon=True).start()
+
+    with ReportServer((host, port), RequestHandler) as server:
+        server.state = state
+        print(f"✅ **Report daemon listening on {host}:{port}**")
+        try:
+            server.serve_forever()
+        finally:
+            stop.set()
+    print("🛑 **Report daemon stopped**")
+
+def send(request, host=HOST, port=PORT, timeout=None):
+    """Sends one request to a running daemon and returns its JSON response."""
+    with socket.create_connection((host, port), timeout=timeout) as connection:
+        connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        reply = connection.makefile("r", encoding="utf-8").readline()
+    return json.loads(reply)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Resident weekly report daemon.")
+    parser.add_argument("command", choices=["serve", "slide", "deck", "status", "stop"])
+    parser.add_argument("slides", type=int, nargs="*", help="Slide numbers (for `slide`)")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent steps per build (serve)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every step of the request")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "serve":
+        serve(port=args.port, workers=args.workers)
+    else:
+        request = {"command": args.command, "force": args.force}
+        if args.command == "slide":
+            if not args.slides:
+                sys.exit("❌ Give at least one slide number, e.g. `slide 4`")
+            request["slides"] = args.slides
+        response = send(request, port=args.port)
+        if "results" in response:
+            failed = sorted(name for name, r in response["results"].items() if r["status"] not in ("ok", "cached"))
+            print(f"⏱️ **Done in {response['seconds']:.2f}s**" + (f" | ⚠️ failed/skipped: {', '.join(failed)}" if failed else ""))
+        else:
+            print(json.dumps(response, indent=2))
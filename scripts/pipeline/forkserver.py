@@ -0,0 +1,79 @@
+"""
+Process pool for the legacy scripts, backed by a preloaded fork server.
+
+The fork server imports pandas, numpy, openpyxl and the `calculator`
+package and loads the datasets once. Every step then runs in a fresh child
+forked from it, executed with `runpy` as `__main__` with its own `__file__`,
+`sys.argv` and script directory on `sys.path`, exactly as if launched with
+`python <script>`, but without interpreter start-up and import cost.
+"""
+
+import sys
+import os
+import time
+import runpy
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Ensure correct import paths
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from calculator import tracing
+
+PRELOAD_MODULES = ["pandas", "numpy", "openpyxl", "calculator.metrics_calculator", "pipeline.preload"]
+
+def worker_pool(max_workers):
+    """
+    Returns a process pool whose children fork from a preloaded server, one
+    fresh child per step. Falls back to `spawn` where fork servers are not
+    available (Windows), which still isolates steps but pays the imports.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(PRELOAD_MODULES)
+    else:
+        print("⚠️ Fork server not available on this platform, using spawn")
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context, max_tasks_per_child=1)
+
+def run_in_child(step, trace=False):
+    """
+    Executes one step in the current (forked) child. Returns (status, trace events,
+    the child's peak RSS in MB); event start times are relative to the start of this call.
+    The child runs this one step only, so its peak is the step's (plus the preloaded modules).
+    """
+    if trace:
+        tracing.enable()
+    try:
+        if step["entry"]:
+            module_name, function_name = step["entry"].split(":")
+            getattr(importlib.import_module(module_name), function_name)(*step.get("args", ()))
+        else:
+            path = os.path.join(BASE_DIR, step["script"])
+            sys.argv = [path]
+            sys.path.insert(0, os.path.dirname(path))
+            runpy.run_path(path, run_name="__main__")
+        status = "ok"
+    except SystemExit as exit_signal:
+        status = "ok" if exit_signal.code in (None, 0) else "failed"
+    except Exception as e:
+        print(f"❌ **Error in {step['script'] or step['entry']}: {e}**")
+        status = "failed"
+    finally:
+        sys.stdout.flush()
+    return status, tracing.get_events() if trace else [], tracing.peak_rss_mb()
+
+def run_step_in_pool(pool, step):
+    """
+    Runs a step on the pool, merging the child's trace spans into this process's
+    trace. Returns (status, the child's peak RSS in MB).
+    """
+    submitted = time.perf_counter()
+    status, events, peak_mb = pool.submit(run_in_child, step, tracing.is_enabled()).result()
+    if events:
+        tracing.add_events(events, offset_s=tracing.elapsed(submitted))
+    return status, peak_mb
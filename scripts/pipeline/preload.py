@@ -0,0 +1,20 @@
+"""
+Imported once by the fork server (see `pipeline.forkserver`): loads the
+shared datasets so every forked script starts with them already in memory.
+"""
+
+import sys
+import os
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from calculator import metrics_calculator
+
+try:
+    metrics_calculator.load_data()
+    metrics_calculator.load_spend_data()
+    metrics_calculator.load_session_data()
+except Exception as e:
+    # ✅ Missing exports are not fatal here: the first step that needs them reports the error
+    print(f"⚠️ Could not preload datasets in the fork server: {e}")
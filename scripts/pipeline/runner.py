@@ -0,0 +1,354 @@
+import sys
+import os
+import time
+import builtins
+import argparse
+import importlib
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Ensure correct import paths
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from pipeline.steps import STEPS, SLIDES, WORKBOOK
+from pipeline import build_cache, forkserver
+from calculator import tracing
+
+WORKBOOK_PATH = os.path.join(BASE_DIR, WORKBOOK)
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 2))
+MODES = ("thread", "forkserver")
+
+def producers_by_artifact(steps=STEPS):
+    """Maps every artifact to the steps that write it, in declaration order."""
+    producers = {}
+    for name, step in steps.items():
+        for artifact in step["outputs"]:
+            producers.setdefault(artifact, []).append(name)
+    return producers
+
+def build_graph(steps=STEPS):
+    """
+    Returns {step: set(upstream steps)}.
+
+    A step depends on every producer of its inputs. Steps writing the same
+    artifact (e.g. three writers on the `gender_category` sheet) keep their
+    declaration order.
+    """
+    producers = producers_by_artifact(steps)
+    graph = {name: set() for name in steps}
+    for name, step in steps.items():
+        for artifact in step["inputs"]:
+            graph[name].update(p for p in producers.get(artifact, []) if p != name)
+        for artifact in step["outputs"]:
+            writers = producers[artifact]
+            graph[name].update(writers[:writers.index(name)])
+    return graph
+
+def select_steps(slides=None, graph=None, steps=STEPS):
+    """
+    Returns the steps needed for the given slides (all slides if None), including
+    upstream steps. Only input edges are followed: another writer of the same
+    artifact (e.g. the shared deck) is ordered against, but not pulled in.
+    """
+    slides = sorted(SLIDES) if slides is None else list(slides)
+
+    unknown = [s for s in slides if s not in SLIDES]
+    if unknown:
+        raise ValueError(f"❌ Unknown slides: {unknown}. Available: {sorted(SLIDES)}")
+
+    producers = producers_by_artifact(steps)
+    selected = set()
+    pending = [step for slide in slides for step in SLIDES[slide]]
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(p for artifact in steps[name]["inputs"] for p in producers.get(artifact, []) if p != name)
+    return selected
+
+def topological_order(selected, graph):
+    """Returns the selected steps in a dependency-respecting order (ties broken by name)."""
+    order, done = [], set()
+    remaining = {name: graph[name] & selected for name in selected}
+    while remaining:
+        ready = sorted(name for name, upstream in remaining.items() if upstream <= done)
+        if not ready:
+            raise RuntimeError(f"❌ Dependency cycle between steps: {sorted(remaining)}")
+        for name in ready:
+            order.append(name)
+            done.add(name)
+            del remaining[name]
+    return order
+
+def critical_path(durations, graph):
+    """Length (seconds) of the longest dependency chain given per-step durations."""
+    finish = {}
+
+    def finish_time(name):
+        if name not in finish:
+            upstream = [finish_time(dep) for dep in graph[name] if dep in durations]
+            finish[name] = durations[name] + max(upstream, default=0.0)
+        return finish[name]
+
+    return max((finish_time(name) for name in durations), default=0.0)
+
+def _exec_script(path):
+    """
+    Executes a legacy script as `__main__` in this interpreter.
+    Unlike `runpy.run_path`, this does not swap `sys.modules['__main__']`, so it is safe across threads.
+    """
+    with open(path, "rb") as file:
+        code = compile(file.read(), path, "exec")
+    exec(code, {"__name__": "__main__", "__file__": path, "__package__": None, "__builtins__": builtins})
+
+def _call_entry(entry, args=()):
+    """Imports "module:function" (relative to scripts/) and calls the function with `args`."""
+    module_name, function_name = entry.split(":")
+    getattr(importlib.import_module(module_name), function_name)(*args)
+
+def writes_workbook(step):
+    return any(artifact.startswith("xlsm:") for artifact in step["outputs"])
+
+def reads_workbook(step):
+    return any(artifact.startswith("xlsm:") for artifact in step["inputs"])
+
+def count_output_rows(step):
+    """Data rows written to the step's CSV outputs (None if it writes none)."""
+    rows = None
+    for artifact in step["outputs"]:
+        path = os.path.join(BASE_DIR, artifact)
+        if artifact.endswith(".csv") and os.path.exists(path):
+            with open(path, "rb") as file:
+                rows = (rows or 0) + max(sum(1 for _ in file) - 1, 0)
+    return rows
+
+def run_step(name, step, pool=None):
+    """
+    Runs one step in-process, or in a child forked from the preloaded server
+    when a `pool` from `forkserver.worker_pool` is given.
+    Returns (status, seconds); status is "ok" or "failed".
+    """
+    started = time.perf_counter()
+    with tracing.trace_span(name, "step") as span:
+        try:
+            if pool is not None:
+                status, span["step_peak_rss_mb"] = forkserver.run_step_in_pool(pool, step)
+            elif step["entry"]:
+                _call_entry(step["entry"], step.get("args", ()))
+                status = "ok"
+            else:
+                _exec_script(os.path.join(BASE_DIR, step["script"]))
+                status = "ok"
+        except SystemExit as exit_signal:
+            status = "ok" if exit_signal.code in (None, 0) else "failed"
+        except Exception as e:
+            print(f"❌ **Error in {name}: {e}**")
+            status = "failed"
+        if tracing.is_enabled():
+            span["rows_out"] = count_output_rows(step)
+    return status, time.perf_counter() - started
+
+def print_rebuild_plan(selected, graph, steps, force=False):
+    """Dry run: prints which steps would rebuild and why, without running anything."""
+    manifest = build_cache.load_manifest()
+    order = topological_order(selected, graph)
+    stale = build_cache.plan_rebuild(order, graph, steps, manifest, producers_by_artifact(steps), force)
+
+    print(f"\n🔎 **Dry run: {len(stale)} of {len(order)} steps would rebuild**")
+    for name in order:
+        if name in stale:
+            print(f"   🔁 {name} ({stale[name]})")
+        else:
+            print(f"   ⏭️ {name} (up to date)")
+    return stale
+
+@contextlib.contextmanager
+def _deferred_viewer():
+    """Tells the Excel writers (and forked children) not to open the workbook themselves."""
+    previous = os.environ.get("REPORT_DEFER_VIEWER")
+    os.environ["REPORT_DEFER_VIEWER"] = "1"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("REPORT_DEFER_VIEWER", None)
+        else:
+            os.environ["REPORT_DEFER_VIEWER"] = previous
+
+def run_pipeline(slides=None, max_workers=DEFAULT_WORKERS, steps=STEPS, incremental=True, force=False, dry_run=False, trace=True, mode="thread", viewer=True):
+    """
+    Runs the steps for the given slides as a DAG: each shared step runs once,
+    independent branches run concurrently and steps sharing a lock are serialized.
+    Dependents of a failed step are skipped.
+
+    With `incremental`, steps whose inputs, code and parameters match the last
+    successful build are not re-run (status "cached"); `force` rebuilds everything
+    and `dry_run` only prints the rebuild plan. With `trace`, per-step and
+    calculator spans are written to data/.build (JSON + Chrome trace).
+
+    `mode="thread"` executes steps in this interpreter; `mode="forkserver"`
+    runs each step in a fresh child forked from a server with pandas, openpyxl
+    and the datasets preloaded, isolating the scripts' global state.
+
+    In thread mode the Excel writers share one workbook session: the workbook
+    is parsed once, saved once before any step that reads the file back
+    and once at the end. Their builds are recorded only after that save.
+    Writers never open Excel themselves; with `viewer`, the workbook is opened
+    once after the run (a staged copy of a locked workbook is swapped in first
+    if the lock has cleared).
+
+    Returns {step: {"status": ..., "seconds": ...}}.
+    """
+    if mode not in MODES:
+        raise ValueError(f"❌ Unknown mode: {mode}. Available: {MODES}")
+    graph = build_graph(steps)
+    selected = select_steps(slides, graph, steps)
+    if dry_run:
+        print_rebuild_plan(selected, graph, steps, force)
+        return {}
+
+    remaining = {name: graph[name] & selected for name in selected}
+    locks = {lock: threading.Lock() for name in selected for lock in steps[name]["locks"]}
+    manifest = build_cache.load_manifest() if incremental else None
+    producers = producers_by_artifact(steps)
+    params = build_cache.build_params()
+    results = {}
+    if trace:
+        tracing.enable()
+
+    def run_locked(name):
+        fingerprint = None
+        if manifest is not None:
+            fingerprint = build_cache.step_fingerprint(name, steps[name], manifest, producers, params)
+            if not force and build_cache.is_up_to_date(name, steps[name], fingerprint, manifest):
+                return "cached", 0.0
+
+        step_locks = [locks[lock] for lock in sorted(steps[name]["locks"])]
+        for lock in step_locks:
+            lock.acquire()
+        try:
+            if session is not None and reads_workbook(steps[name]) and not writes_workbook(steps[name]):
+                flush_workbook()
+            print(f"\n🚀 **Running {name}...**")
+            status, seconds = run_step(name, steps[name], process_pool)
+        finally:
+            for lock in reversed(step_locks):
+                lock.release()
+
+        if status == "ok" and fingerprint is not None:
+            if session is not None and writes_workbook(steps[name]):
+                # ✅ The sheet is only on disk after the session saves
+                with deferred_lock:
+                    deferred_builds.append((name, fingerprint))
+            else:
+                build_cache.record_build(name, fingerprint, manifest)
+        return status, seconds
+
+    def flush_workbook():
+        session.flush(WORKBOOK_PATH)
+        with deferred_lock:
+            for name, fingerprint in deferred_builds:
+                build_cache.record_build(name, fingerprint, manifest)
+            deferred_builds.clear()
+
+    # ✅ One in-memory workbook for every Excel writer of this run (thread mode only)
+    session = None
+    deferred_builds, deferred_lock = [], threading.Lock()
+    session_scope = contextlib.ExitStack()
+    session_scope.enter_context(_deferred_viewer())
+    if mode == "thread" and os.path.exists(WORKBOOK_PATH) and any(writes_workbook(steps[n]) for n in selected):
+        from excel import workbook_session as session
+        session_scope.enter_context(session.workbook_session(WORKBOOK_PATH))
+
+    started = time.perf_counter()
+    process_pool = forkserver.worker_pool(max_workers) if mode == "forkserver" else None
+    with session_scope, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = {}
+        while remaining or running:
+            # ✅ Skip steps whose upstream failed, submit steps whose upstream all succeeded
+            pending_before = len(remaining)
+            for name in sorted(remaining):
+                upstream = remaining[name]
+                if any(results.get(dep, {}).get("status") in ("failed", "skipped") for dep in upstream):
+                    results[name] = {"status": "skipped", "seconds": 0.0}
+                    del remaining[name]
+                elif all(dep in results for dep in upstream):
+                    running[pool.submit(run_locked, name)] = name
+                    del remaining[name]
+
+            if not running:
+                if len(remaining) == pending_before:
+                    raise RuntimeError(f"❌ Dependency cycle between steps: {sorted(remaining)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                status, seconds = future.result()
+                results[name] = {"status": status, "seconds": seconds}
+                if status == "cached":
+                    print(f"⏭️ **{name} up to date, skipped**")
+                else:
+                    icon = "✅" if status == "ok" else "❌"
+                    print(f"{icon} **{name} {status} in {seconds:.1f}s**")
+
+    if process_pool is not None:
+        process_pool.shutdown()
+    # ✅ The session saved the workbook on exit; now its writers count as built
+    for name, fingerprint in deferred_builds:
+        build_cache.record_build(name, fingerprint, manifest)
+
+    if any(writes_workbook(steps[name]) and result["status"] == "ok" for name, result in results.items()):
+        from excel import workbook_session
+        workbook_session.promote_staged(WORKBOOK_PATH)
+        if viewer:
+            workbook_session.open_viewer(WORKBOOK_PATH)
+
+    wall = time.perf_counter() - started
+    durations = {name: result["seconds"] for name, result in results.items()}
+    print(f"\n⏱️ **Wall time:** {wall:.1f}s | **Critical path:** {critical_path(durations, graph):.1f}s | **Sum of steps:** {sum(durations.values()):.1f}s")
+
+    cached = sum(1 for result in results.values() if result["status"] == "cached")
+    if cached:
+        print(f"⏭️ **{cached} of {len(results)} steps were up to date**")
+
+    failed = sorted(name for name, result in results.items() if result["status"] not in ("ok", "cached"))
+    if failed:
+        print(f"⚠️ **Failed or skipped steps:** {', '.join(failed)}")
+
+    if trace:
+        tracing.disable()
+        tracing.write_trace()
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the weekly report slides as a dependency graph.")
+    parser.add_argument("--slides", type=int, nargs="*", help="Slide numbers to build (default: all)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent steps")
+    parser.add_argument("--dry-run", action="store_true", help="Show which steps would rebuild and exit")
+    parser.add_argument("--force", action="store_true", help="Rebuild every step, ignoring the build manifest")
+    parser.add_argument("--no-incremental", action="store_true", help="Run every step without reading or writing the build manifest")
+    parser.add_argument("--no-trace", action="store_true", help="Do not record a trace")
+    parser.add_argument("--no-viewer", action="store_true", help="Do not open the workbook when the run is done")
+    parser.add_argument("--mode", choices=MODES, default="thread", help="Run steps in-process (thread) or in children of a preloaded fork server")
+    return parser.parse_args(argv)
+
+def run_from_args(args):
+    """Runs the pipeline with options parsed by `parse_args`."""
+    return run_pipeline(
+        args.slides or None,
+        args.workers,
+        incremental=not args.no_incremental,
+        force=args.force,
+        dry_run=args.dry_run,
+        trace=not args.no_trace,
+        mode=args.mode,
+        viewer=not args.no_viewer,
+    )
+
+if __name__ == "__main__":
+    run_from_args(parse_args())
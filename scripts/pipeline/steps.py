@@ -0,0 +1,215 @@
+"""
+Declarative catalogue of every step in the weekly report deck.
+
+Each step names what it runs (`script` executed as `__main__`, or `entry` as
+"module:function" relative to `scripts/`), the artifacts it reads (`inputs`)
+and the artifacts it produces (`outputs`). Artifacts are repo-relative paths
+(`data/raw/...`, `data/final/...`) or workbook sheets (`xlsm:<sheet>`).
+Steps that share a `lock` never run at the same time.
+"""
+
+SALES = "data/formatted/weekly_data_formatted.csv"
+SPEND = "data/formatted/marketing_spend_formatted.csv"
+SESSIONS = "data/session_data.csv"
+WORKBOOK = "data/weekly_report.xlsm"
+POWERPOINT = "data/powerpoint/weekly_report.pptx"
+SALES_CONTROL_TOTALS = "data/audit/control_totals_sales.csv"
+SPEND_CONTROL_TOTALS = "data/audit/control_totals_spend.csv"
+MONTHLY_CUBE = "data/analyse/monthly_cube.csv"
+
+# ✅ Everything that imports `calculator.metrics_calculator` loads these at import time
+CALCULATOR_INPUTS = [SALES, SPEND, SESSIONS]
+WORKBOOK_LOCK = "weekly_report.xlsm"
+POWERPOINT_LOCK = "weekly_report.pptx"
+
+def _step(inputs, outputs, script=None, entry=None, locks=(), args=()):
+    return {
+        "script": script,
+        "entry": entry,
+        "args": list(args),
+        "inputs": list(inputs),
+        "outputs": list(outputs),
+        "locks": list(locks),
+    }
+
+def _prepare(name, outputs, extra_inputs=(), calculator=True):
+    inputs = (CALCULATOR_INPUTS if calculator else []) + list(extra_inputs)
+    return _step(inputs, [f"data/raw/{o}" for o in outputs], script=f"scripts/prepare/{name}.py")
+
+def _final(name, inputs, outputs):
+    return _step(inputs, [f"data/final/{o}" for o in outputs], script=f"scripts/final/{name}.py")
+
+def _excel(name, finals, sheet):
+    return _step([f"data/final/{f}" for f in finals], [f"xlsm:{sheet}"], script=f"scripts/excel/{name}.py", locks=[WORKBOOK_LOCK])
+
+def _market_chain(metric):
+    """prepare → final → excel for the per-market slides (sessions, conversion, customers, AOV)."""
+    return {
+        f"prepare_{metric}": _prepare(f"prepare_{metric}", [f"{metric}_raw.csv"], [SESSIONS]),
+        f"finalized_{metric}": _final(f"finalized_{metric}", [f"data/raw/{metric}_raw.csv"], [f"{metric}_final.csv"]),
+        f"{metric}_excel": _excel(f"{metric}_excel", [f"{metric}_final.csv"], metric),
+    }
+
+STEPS = {
+    # 🔄 Format
+    "format_sales_data": _step(
+        ["data/Weekly_Data.xlsx"], [SALES, SALES_CONTROL_TOTALS], script="scripts/format/format_sales_data.py",
+    ),
+    "format_spend_data": _step(
+        ["data/Marketing Spend/unformatted"],
+        [SPEND, SPEND_CONTROL_TOTALS],
+        script="scripts/format/format_spend_data.py",
+    ),
+
+    # 📊 Slide 2 – top table
+    "prepare_metrics": _prepare("prepare_metrics", ["metrics_raw.csv"]),
+    "prepare_growth": _prepare("prepare_growth", ["growth_metrics_raw.csv"], ["data/raw/metrics_raw.csv"]),
+    "prepare_ytd_metrics": _prepare("prepare_ytd_metrics", ["ytd_metrics_raw.csv"]),
+    "prepare_ytd_growth": _prepare("prepare_ytd_growth", ["ytd_growth_metrics_raw.csv"], ["data/raw/ytd_metrics_raw.csv"]),
+    "finalized_metrics": _final("finalized_metrics", ["data/raw/metrics_raw.csv"], ["metrics_final.csv"]),
+    "finalized_growth": _final("finalized_growth", ["data/raw/growth_metrics_raw.csv"], ["growth_metrics_final.csv"]),
+    "finalized_ytd_metrics": _final("finalized_ytd_metrics", ["data/raw/ytd_metrics_raw.csv"], ["ytd_metrics_final.csv"]),
+    "finalized_ytd_growth": _final("finalized_ytd_growth", ["data/raw/ytd_growth_metrics_raw.csv"], ["ytd_growth_final.csv"]),
+    "top_table_excel": _excel(
+        "top_table_excel",
+        ["metrics_final.csv", "growth_metrics_final.csv", "ytd_metrics_final.csv", "ytd_growth_final.csv"],
+        "top_table",
+    ),
+
+    # 🌍 Slide 3 – top markets (function entry points, as main_slide_3 calls them)
+    "prepare_top_markets": _step(
+        CALCULATOR_INPUTS, ["data/raw/top_markets_raw.csv"],
+        entry="prepare.prepare_top_markets:load_and_prepare_top_markets",
+    ),
+    "prepare_top_markets_pry": _step(
+        CALCULATOR_INPUTS, ["data/raw/top_markets_pry_raw.csv"],
+        entry="prepare.prepare_top_markets_pry:load_and_prepare_top_markets_pry",
+    ),
+    "finalized_top_markets": _step(
+        ["data/raw/top_markets_raw.csv", "data/raw/top_markets_pry_raw.csv"],
+        ["data/final/top_markets_final.csv", "data/final/top_markets_growth_final.csv", "data/final/top_markets_share_final.csv"],
+        entry="final.finalized_top_markets:finalize_top_markets",
+    ),
+    "top_markets_excel": _step(
+        ["data/final/top_markets_final.csv", "data/final/top_markets_growth_final.csv", "data/final/top_markets_share_final.csv"],
+        ["xlsm:top_markets"],
+        entry="excel.top_markets_excel:update_excel_with_top_markets",
+        locks=[WORKBOOK_LOCK],
+    ),
+
+    # 💻 Slide 4 – online KPIs
+    "prepare_online_kpis": _prepare("prepare_online_kpis", ["online_kpis_raw.csv"]),
+    "finalized_online_kpis": _final("finalized_online_kpis", ["data/raw/online_kpis_raw.csv"], ["online_kpis_final.csv"]),
+    "online_kpis_excel": _excel("online_kpis_excel", ["online_kpis_final.csv"], "online_kpis"),
+
+    # 💰 Slide 5 – contribution
+    "prepare_contribution": _prepare("prepare_contribution", ["contribution_raw.csv"], ["data/gm2.csv"]),
+    "finalized_contribution": _final("finalized_contribution", ["data/raw/contribution_raw.csv"], ["contribution_final.csv"]),
+    "contribution_excel": _excel("contribution_excel", ["contribution_final.csv"], "contribution"),
+
+    # 👫 Slide 6 – gender
+    "prepare_gender": _prepare("prepare_gender", ["gender_revenue_raw.csv"]),
+    "finalized_gender": _final("finalized_gender", ["data/raw/gender_revenue_raw.csv"], ["gender_revenue_final.csv"]),
+    "gender_excel": _excel("gender_excel", ["gender_revenue_final.csv"], "gender"),
+
+    # 👔 Slide 7 – men category
+    "prepare_men_category": _prepare("prepare_men_category", ["men_category_revenue_raw.csv"]),
+    "finalized_men_category": _final("finalized_men_category", ["data/raw/men_category_revenue_raw.csv"], ["men_category_revenue_final.csv"]),
+    "men_category_excel": _excel("men_category_excel", ["men_category_revenue_final.csv"], "men_category"),
+
+    # 👗 Slide 8 – women category
+    "prepare_women_category": _prepare("prepare_women_category", ["women_category_revenue_raw.csv"]),
+    "finalized_women_category": _final("finalized_women_category", ["data/raw/women_category_revenue_raw.csv"], ["women_category_revenue_final.csv"]),
+    "women_category_excel": _excel("women_category_excel", ["women_category_revenue_final.csv"], "women_category"),
+
+    # 🧩 Slide 9 – gender × category
+    "prepare_gender_category": _prepare("prepare_gender_category", ["gender_category_raw.csv"]),
+    "prepare_gender_category_ly": _prepare("prepare_gender_category_ly", ["gender_category_ly_raw.csv"]),
+    "finalized_gender_category": _final("finalized_gender_category", ["data/raw/gender_category_raw.csv"], ["gender_category_final.csv"]),
+    "finalized_gender_category_ly": _final("finalized_gender_category_ly", ["data/raw/gender_category_ly_raw.csv"], ["gender_category_ly_final.csv"]),
+    "finalized_gender_category_growth": _final(
+        "finalized_gender_category_growth",
+        ["data/final/gender_category_final.csv", "data/final/gender_category_ly_final.csv"],
+        ["gender_category_growth_final.csv"],
+    ),
+    "finalized_gender_category_sob": _final(
+        "finalized_gender_category_sob", ["data/final/gender_category_final.csv"], ["gender_category_sob_final.csv"],
+    ),
+    "gender_category_excel": _excel("gender_category_excel", ["gender_category_final.csv"], "gender_category"),
+    "gender_category_growth_excel": _excel("gender_category_growth_excel", ["gender_category_growth_final.csv"], "gender_category"),
+    "gender_category_sob_excel": _excel("gender_category_sob_excel", ["gender_category_share_final.csv"], "gender_category"),
+
+    # 🏆 Slides 10 & 11 – top products (one pass for all four segments)
+    "finalized_products": _step(
+        CALCULATOR_INPUTS,
+        [f"data/final/products_{s}_final.csv" for s in ("new", "returning", "men", "women")],
+        script="scripts/final/finalized_products.py",
+    ),
+    "products_new_excel": _excel("products_new_excel", ["products_new_final.csv"], "products_new"),
+    "products_returning_excel": _excel("products_returning_excel", ["products_returning_final.csv"], "products_returning"),
+    "products_men_excel": _excel("products_men_excel", ["products_men_final.csv"], "products_men"),
+    "products_women_excel": _excel("products_women_excel", ["products_women_final.csv"], "products_women"),
+
+    # 📈 Slides 12–17 – per-market chains
+    **_market_chain("sessions_markets"),
+    **_market_chain("conversion_markets"),
+    **_market_chain("new_customers_markets"),
+    **_market_chain("returning_customers_markets"),
+    **_market_chain("aov_new_markets"),
+    **_market_chain("aov_returning_markets"),
+
+    # 📣 Slide 18 – online media spend (reads the spend store directly)
+    "prepare_online_media_spend": _prepare(
+        "prepare_online_media_spend", ["online_media_spend_raw.csv"],
+        [SPEND], calculator=False,
+    ),
+    "finalized_online_media_spend": _final(
+        "finalized_online_media_spend", ["data/raw/online_media_spend_raw.csv"], ["online_media_spend_final.csv"],
+    ),
+    "online_media_spend_excel": _excel("online_media_spend_excel", ["online_media_spend_final.csv"], "online_media_spend"),
+
+    # 🧾 Audit – reconcile slide tables and the monthly cube against the ingest control totals
+    "monthly_cube": _step(CALCULATOR_INPUTS, [MONTHLY_CUBE], script="scripts/analyze/other/monthly_cube.py"),
+    "reconcile_audit": _step(
+        [SALES_CONTROL_TOTALS, SPEND_CONTROL_TOTALS, MONTHLY_CUBE, "data/raw/gender_revenue_raw.csv", "data/raw/online_media_spend_raw.csv"],
+        ["data/audit/reconciliation.csv"],
+        script="scripts/audits/reconcile_audit.py",
+    ),
+}
+
+# ✅ Terminal steps per slide; upstream steps are pulled in through the DAG
+SLIDES = {
+    2: ["top_table_excel"],
+    3: ["top_markets_excel"],
+    4: ["online_kpis_excel"],
+    5: ["contribution_excel"],
+    6: ["gender_excel"],
+    7: ["men_category_excel"],
+    8: ["women_category_excel"],
+    9: ["gender_category_excel", "gender_category_growth_excel", "gender_category_sob_excel", "finalized_gender_category_sob"],
+    10: ["products_new_excel", "products_returning_excel"],
+    11: ["products_men_excel", "products_women_excel"],
+    12: ["sessions_markets_excel"],
+    13: ["conversion_markets_excel"],
+    14: ["new_customers_markets_excel"],
+    15: ["returning_customers_markets_excel"],
+    16: ["aov_new_markets_excel"],
+    17: ["aov_returning_markets_excel"],
+    18: ["online_media_spend_excel"],
+}
+
+def _pptx_slide(slide):
+    """Renders a slide's placeholder shapes into the deck straight from its final CSVs."""
+    from visualization.pptx_renderer import PPTX_SHAPES, shapes_for_slide
+    finals = sorted({f"data/final/{source}" for name in shapes_for_slide(slide) for source in PPTX_SHAPES[name]["sources"]})
+    return _step(
+        finals, [POWERPOINT],
+        entry="visualization.pptx_renderer:render_slide", args=[slide],
+        locks=[POWERPOINT_LOCK],
+    )
+
+# 🖼️ Deck – one native render step per slide (replaces the Excel/AppleScript macros)
+for _slide in SLIDES:
+    STEPS[f"pptx_slide_{_slide}"] = _pptx_slide(_slide)
+    SLIDES[_slide].append(f"pptx_slide_{_slide}")
+del _slide
@@ -6,7 +6,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 data = load_data()
 
@@ -176,16 +180,11 @@ aov_new_last_year = calculate_aov_new_markets_data(last_8_weeks_last_year, "Last
 aov_new_final = pd.concat([aov_new_last_year, aov_new_current_year])
 
 # Sort data correctly
-aov_new_final["SortOrder"] = aov_new_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+aov_new_final["SortOrder"] = week_sort_key(aov_new_final, last_8_weeks_order)
 
 aov_new_final = aov_new_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final AOV New Customers Markets DataFrame (First Rows)**")
-print(aov_new_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final AOV New Customers Markets DataFrame (First Rows)", aov_new_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -193,7 +192,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "aov_new_markets_raw.csv")
-aov_new_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(aov_new_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **AOV New Customers Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(aov_new_final)}")
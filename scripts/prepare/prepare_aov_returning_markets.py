@@ -6,7 +6,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 data = load_data()
 
@@ -176,16 +180,11 @@ aov_returning_last_year = calculate_aov_returning_markets_data(last_8_weeks_last
 aov_returning_final = pd.concat([aov_returning_last_year, aov_returning_current_year])
 
 # Sort data correctly
-aov_returning_final["SortOrder"] = aov_returning_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+aov_returning_final["SortOrder"] = week_sort_key(aov_returning_final, last_8_weeks_order)
 
 aov_returning_final = aov_returning_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final AOV Returning Customers Markets DataFrame (First Rows)**")
-print(aov_returning_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final AOV Returning Customers Markets DataFrame (First Rows)", aov_returning_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -193,7 +192,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "aov_returning_markets_raw.csv")
-aov_returning_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(aov_returning_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **AOV Returning Customers Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(aov_returning_final)}")
@@ -10,6 +10,9 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics
 )
 from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load dataset
 data = load_data()
@@ -42,8 +45,7 @@ def calculate_category_revenue_last_8_weeks():
             })
 
     category_revenue_df = pd.DataFrame(category_revenue)
-    print("\n📊 **Gross Revenue by Category (Current Year)**")  
-    print(category_revenue_df.head(10))  
+    log_frame(logger, "Gross Revenue by Category (Current Year)", category_revenue_df, rows=10, index=True)
 
     return category_revenue_df
 
@@ -76,8 +78,7 @@ def calculate_category_revenue_last_8_weeks_last_year():
             })
 
     category_revenue_df = pd.DataFrame(category_revenue)
-    print("\n📊 **Gross Revenue by Category (Last Year)**")  
-    print(category_revenue_df.head(10))  
+    log_frame(logger, "Gross Revenue by Category (Last Year)", category_revenue_df, rows=10, index=True)
 
     return category_revenue_df
 
@@ -12,7 +12,11 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics,
     calculate_marketing_spend
 )
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -38,8 +42,7 @@ def extract_week_number(week_str):
 gm2_df['ISO Week'] = gm2_df['Weeks'].apply(extract_week_number)
 gm2_df['GM2'] = gm2_df['Gross margin 2 - Dema MTA'].astype(float)
 
-print("\n📊 **Loaded GM2 Data (First Rows):**")
-print(gm2_df.head())
+log_frame(logger, "Loaded GM2 Data (First Rows)", gm2_df, rows=5, index=True)
 
 
 def calculate_contribution(weekly_ranges, year_label):
@@ -143,18 +146,13 @@ contribution_last_year = calculate_contribution(last_8_weeks_last_year, "Last Ye
 contribution_final = pd.concat([contribution_last_year, contribution_current_year])
 
 # ✅ Assign sorting order based on last 8 weeks order
-contribution_final["SortOrder"] = contribution_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+contribution_final["SortOrder"] = week_sort_key(contribution_final, last_8_weeks_order)
 
 # ✅ Ensure correct sorting
 contribution_final = contribution_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
 # ✅ Debug before saving
-print("\n📊 **Final Contribution DataFrame (First Rows)**")
-print(contribution_final[["Year Type", "Calendar Year", "ISO Week", "Metric", "Customer Type"]].drop_duplicates())
+log_frame(logger, "Final Contribution DataFrame (First Rows)", contribution_final[["Year Type", "Calendar Year", "ISO Week", "Metric", "Customer Type"]].drop_duplicates(), index=True)
 
 # ✅ Define save path
 OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
@@ -162,6 +160,6 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ✅ Save as a single file
 output_path = os.path.join(OUTPUT_DIR, "contribution_raw.csv")
-contribution_final.to_csv(output_path, index=False)
+write_table(contribution_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ Successfully saved Contribution data to: {output_path}")
\ No newline at end of file
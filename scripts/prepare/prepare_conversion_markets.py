@@ -6,7 +6,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 data = load_data()
 
@@ -220,16 +224,11 @@ conversions_last_year = calculate_conversion_market_data(last_8_weeks_last_year,
 conversions_final = pd.concat([conversions_last_year, conversions_current_year])
 
 # Sort data correctly
-conversions_final["SortOrder"] = conversions_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+conversions_final["SortOrder"] = week_sort_key(conversions_final, last_8_weeks_order)
 
 conversions_final = conversions_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final Conversion Markets DataFrame (First Rows)**")
-print(conversions_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final Conversion Markets DataFrame (First Rows)", conversions_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -237,7 +236,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "conversion_markets_raw.csv")
-conversions_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(conversions_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **Conversion Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(conversions_final)}")
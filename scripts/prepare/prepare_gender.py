@@ -10,7 +10,11 @@ from calculator.metrics_calculator import (
     load_data,
     calculate_revenue_metrics
 )
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -98,18 +102,13 @@ last_8_weeks_last_year_order = [
 ]
 
 # ✅ Assign sorting order based on last 8 weeks order
-gender_revenue_final["SortOrder"] = gender_revenue_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+gender_revenue_final["SortOrder"] = week_sort_key(gender_revenue_final, last_8_weeks_order)
 
 # ✅ Ensure correct sorting
 gender_revenue_final = gender_revenue_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
 # ✅ Debug before saving
-print("\n📊 **Final Gender Revenue DataFrame (First Rows)**")
-print(gender_revenue_final.head(10))  # ✅ Print first few rows including values
+log_frame(logger, "Final Gender Revenue DataFrame (First Rows)", gender_revenue_final, rows=10, index=True)
 
 # ✅ Define save path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -118,10 +117,9 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ✅ Save as a single file
 output_path = os.path.join(OUTPUT_DIR, "gender_revenue_raw.csv")
-gender_revenue_final.to_csv(output_path, index=False)
+write_table(gender_revenue_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ Successfully saved Gender Revenue data to: {output_path}")
 
 # ✅ Print the entire final dataset
-print("\n📊 **Full Gender Revenue Dataset:**")
-print(gender_revenue_final.to_string(index=False))  # ✅ Print entire dataset for verification
\ No newline at end of file
+log_frame(logger, "Full Gender Revenue Dataset", gender_revenue_final)
\ No newline at end of file
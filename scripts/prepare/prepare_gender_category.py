@@ -11,6 +11,9 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics
 )
 from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -25,7 +28,7 @@ def calculate_gender_category_revenue(weekly_ranges, year_label):
         iso_week = week["week_start"].isocalendar()[1]  
         calendar_year = week["week_start"].year  
 
-        print(f"\n📆 Processing {year_label}: Week {iso_week} ({start_date} to {end_date})")
+        logger.debug("\n📆 Processing %s: Week %s (%s to %s)", year_label, iso_week, start_date, end_date)
 
         # ✅ Retrieve revenue metrics
         revenue_metrics = calculate_revenue_metrics(data, start_date, end_date)
@@ -51,9 +54,8 @@ def calculate_gender_category_revenue(weekly_ranges, year_label):
         # ✅ Convert values to integers
         revenue_by_gender_category["Gross Revenue"] = revenue_by_gender_category["Gross Revenue"].round().astype(int)
 
-        # ✅ Log revenue values
-        print("\n📊 **Revenue Breakdown by Gender & Category:**")
-        print(revenue_by_gender_category)
+        # ✅ Opt-in dump of the weekly breakdown (REPORT_DEBUG_FRAMES=prepare_gender_category)
+        log_frame(logger, "Revenue Breakdown by Gender & Category", revenue_by_gender_category)
 
         for _, row in revenue_by_gender_category.iterrows():
             weekly_gender_category_revenue.append({
@@ -80,7 +82,7 @@ gender_category_revenue_last_year = calculate_gender_category_revenue(last_8_wee
 gender_category_revenue_final = pd.concat([gender_category_revenue_last_year, gender_category_revenue_current_year])
 
 if gender_category_revenue_final.empty:
-    print("\n❌ No revenue data found for Gender & Category. Exiting...")
+    logger.error("\n❌ No revenue data found for Gender & Category. Exiting...")
     sys.exit(1)
 
 # ✅ Sort DataFrame ("Last Year" first)
@@ -98,7 +100,6 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 output_path = os.path.join(OUTPUT_DIR, "gender_category_raw.csv")
 gender_category_revenue_final.to_csv(output_path, index=False)
 
-# ✅ Print confirmation with file path and preview of saved data
-print(f"\n✅ Successfully saved Gender & Category Revenue data to: {output_path}")
-print("\n📂 **Saved CSV Preview (First 10 Rows):**")
-print(gender_category_revenue_final.head(25).to_string(index=False))
\ No newline at end of file
+# ✅ Print confirmation with file path and (opt-in) preview of saved data
+logger.info("\n✅ Successfully saved Gender & Category Revenue data to: %s", output_path)
+log_frame(logger, "Saved CSV Preview", gender_category_revenue_final, rows=25)
\ No newline at end of file
@@ -8,6 +8,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
 from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def load_and_prepare_gender_category_growth():
     """Loads and processes gender-category growth data."""
@@ -28,8 +31,7 @@ def load_and_prepare_gender_category_growth():
     output_path = os.path.join(OUTPUT_DIR, "gender_category_growth_raw.csv")
     gender_category_growth_data.to_csv(output_path, index=False)
     print(f"\n✅ Successfully saved Gender & Category Growth data to: {output_path}")
-    print("\n📊 **Full Gender & Category Growth Dataset:**")
-    print(gender_category_growth_data.to_string(index=False))
+    log_frame(logger, "Full Gender & Category Growth Dataset", gender_category_growth_data)
 
 def calculate_gender_category_growth(data, weekly_ranges, last_year_ranges):
     """Calculates the growth in Gross Revenue by Gender & Category between Current Year and Last Year."""
@@ -82,16 +84,14 @@ def calculate_gender_category_growth(data, weekly_ranges, last_year_ranges):
             suffixes=("_current", "_last_year")
         ).fillna(0)
 
-        print("\n📊 **Gross Revenue Comparison (Current Year vs Last Year) by Gender & Category:**")
-        print(revenue_comparison[[gender_col, category_col, f"{revenue_col}_current", f"{revenue_col}_last_year"]])
+        log_frame(logger, "Gross Revenue Comparison (Current Year vs Last Year) by Gender & Category", revenue_comparison[[gender_col, category_col, f"{revenue_col}_current", f"{revenue_col}_last_year"]], index=True)
 
         revenue_comparison["Growth (%)"] = (
             ((revenue_comparison[f"{revenue_col}_current"] - revenue_comparison[f"{revenue_col}_last_year"]) / 
             revenue_comparison[f"{revenue_col}_last_year"].replace(0, 1)) * 100
         ).round(1)
 
-        print("\n📊 **Revenue Growth by Gender & Category:**")
-        print(revenue_comparison[[gender_col, category_col, "Growth (%)"]])
+        log_frame(logger, "Revenue Growth by Gender & Category", revenue_comparison[[gender_col, category_col, "Growth (%)"]], index=True)
 
         for _, row in revenue_comparison.iterrows():
             weekly_growth_data.append({
@@ -11,6 +11,9 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics
 )
 from calculator.date_utils import get_last_8_weeks_last_year
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -52,8 +55,7 @@ def calculate_gender_category_revenue_last_year(weekly_ranges, year_label="Last
         revenue_by_gender_category["Gross Revenue"] = revenue_by_gender_category["Gross Revenue"].round().astype(int)
 
         # ✅ Log revenue values
-        print("\n📊 **Revenue Breakdown by Gender & Category (Last Year):**")
-        print(revenue_by_gender_category)
+        log_frame(logger, "Revenue Breakdown by Gender & Category (Last Year)", revenue_by_gender_category, index=True)
 
         for _, row in revenue_by_gender_category.iterrows():
             weekly_gender_category_revenue.append({
@@ -95,5 +97,4 @@ gender_category_revenue_last_year.to_csv(output_path, index=False)
 
 # ✅ Print confirmation with file path and preview of saved data
 print(f"\n✅ Successfully saved Last Year's Gender & Category Revenue data to: {output_path}")
-print("\n📂 **Saved CSV Preview (First 10 Rows):**")
-print(gender_category_revenue_last_year.head(25).to_string(index=False))
+log_frame(logger, "Saved CSV Preview (First 10 Rows)", gender_category_revenue_last_year, rows=25)
@@ -10,6 +10,9 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics
 )
 from calculator.date_utils import get_last_8_weeks
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load dataset
 data = load_data()
@@ -120,5 +123,4 @@ final_share_data.to_csv(output_file, index=False)
 print(f"\n✅ Gender Category Share data successfully saved to: {output_file}")
 
 # ✅ Preview output
-print("\n📊 **Preview of Share Data:**")
-print(final_share_data.head(10).to_string(index=False))
+log_frame(logger, "Preview of Share Data", final_share_data, rows=10)
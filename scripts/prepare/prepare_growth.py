@@ -5,7 +5,10 @@ import pandas as pd
 # Ensure correct import paths
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from calculator.metrics_calculator import calculate_growth
+from calculator.growth import growth_pct
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # Define file paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))  
@@ -48,46 +51,19 @@ def load_and_prepare_growth():
     metrics_df = pd.read_csv(METRICS_INPUT_PATH, index_col=0)
 
     # Debugging: Check structure of DataFrame
-    print("\n🔍 Debug: Metrics DataFrame Structure")
-    print(metrics_df.head())
+    log_frame(logger, "Debug: Metrics DataFrame Structure", metrics_df, rows=5, index=True)
     print("🔍 Columns:", metrics_df.columns.tolist())
     print("🔍 Index:", metrics_df.index.tolist())
 
-    # Initialize dictionary for storing growth calculations
-    growth_data = {metric: {} for metric in METRIC_NAMES}
-
-    for metric in METRIC_NAMES:
-        try:
-            # Get values safely, defaulting to "N/A" if missing
-            current_week = metrics_df.at[metric, "current_week"] if metric in metrics_df.index else "N/A"
-            last_week = metrics_df.at[metric, "last_week"] if metric in metrics_df.index else "N/A"
-            last_year = metrics_df.at[metric, "last_year"] if metric in metrics_df.index else "N/A"
-            year_2023 = metrics_df.at[metric, "year_2023"] if metric in metrics_df.index else "N/A"
-
-            # Convert values to float for calculations
-            if current_week != "N/A" and last_week != "N/A":
-                growth_data[metric]["last_week"] = calculate_growth(float(current_week), float(last_week))
-            else:
-                growth_data[metric]["last_week"] = "N/A"
-
-            if current_week != "N/A" and last_year != "N/A":
-                growth_data[metric]["last_year"] = calculate_growth(float(current_week), float(last_year))
-            else:
-                growth_data[metric]["last_year"] = "N/A"
-
-            if current_week != "N/A" and year_2023 != "N/A":
-                growth_data[metric]["year_2023"] = calculate_growth(float(current_week), float(year_2023))
-            else:
-                growth_data[metric]["year_2023"] = "N/A"
-
-        except Exception as e:
-            print(f"⚠️ Error calculating growth for {metric}: {e}")
-            growth_data[metric]["last_week"] = "N/A"
-            growth_data[metric]["last_year"] = "N/A"
-            growth_data[metric]["year_2023"] = "N/A"
+    # ✅ All metrics × periods as one numeric matrix; metrics missing from the raw file stay NaN → "N/A"
+    periods = ["last_week", "last_year", "year_2023"]
+    values = metrics_df.reindex(index=METRIC_NAMES, columns=["current_week"] + periods)
+    values = values.apply(lambda column: pd.to_numeric(column.astype(str).str.replace(",", ""), errors="coerce"))
+    missing = values[periods].isna().to_numpy() | values[["current_week"]].isna().to_numpy()
 
-    # Convert to DataFrame
-    growth_df = pd.DataFrame.from_dict(growth_data, orient="index")
+    # ✅ Growth vs every comparison period in one pass (0 where the comparison value is 0, as before)
+    growth = growth_pct(values[["current_week"]].to_numpy(), values[periods].to_numpy(), fill=0).round(2)
+    growth_df = pd.DataFrame(growth, index=METRIC_NAMES, columns=periods).astype(object).mask(missing, "N/A")
 
     # Ensure correct column order and add missing columns
     growth_df["Budget(1)"] = "n/m"
@@ -100,7 +76,7 @@ def load_and_prepare_growth():
     growth_df.to_csv(GROWTH_OUTPUT_PATH, index=True)
 
     print(f"\n✅ Growth Metrics saved to `{GROWTH_OUTPUT_PATH}`")
-    print(growth_df)
+    log_frame(logger, "Growth Metrics", growth_df, index=True)
 
 if __name__ == "__main__":
     load_and_prepare_growth()
\ No newline at end of file
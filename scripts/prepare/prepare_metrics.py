@@ -14,6 +14,9 @@ from calculator.metrics_calculator import (
 )
 
 from calculator.date_utils import get_latest_full_week
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # Define output file path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))  
@@ -111,7 +114,7 @@ def load_and_prepare_data():
     metrics_df.to_csv(RAW_METRICS_OUTPUT_PATH, index=True)
     print(f"✅ Raw Metrics saved to `{RAW_METRICS_OUTPUT_PATH}`")
 
-    print(metrics_df)  # Debug output to verify
+    log_frame(logger, "Raw Metrics", metrics_df, index=True)
 
 if __name__ == "__main__":
     load_and_prepare_data()
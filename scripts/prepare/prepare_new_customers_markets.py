@@ -6,7 +6,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 data = load_data()
 
@@ -160,16 +164,11 @@ new_customers_last_year = calculate_new_customers_market_data(last_8_weeks_last_
 new_customers_final = pd.concat([new_customers_last_year, new_customers_current_year])
 
 # Sort data correctly
-new_customers_final["SortOrder"] = new_customers_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+new_customers_final["SortOrder"] = week_sort_key(new_customers_final, last_8_weeks_order)
 
 new_customers_final = new_customers_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final New Customers Markets DataFrame (First Rows)**")
-print(new_customers_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final New Customers Markets DataFrame (First Rows)", new_customers_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -177,7 +176,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "new_customers_markets_raw.csv")
-new_customers_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(new_customers_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **New Customers Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(new_customers_final)}")
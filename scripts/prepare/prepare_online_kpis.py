@@ -13,7 +13,11 @@ from calculator.metrics_calculator import (
     calculate_marketing_spend
 )
 from calculator.orders import deduplicate_orders  # ✅ Import deduplicated order calculation
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -157,18 +161,13 @@ kpis_last_year = calculate_kpis(last_8_weeks_last_year, "Last Year")
 kpis_final = pd.concat([kpis_last_year, kpis_current_year])
 
 # ✅ Assign sorting order based on last 8 weeks order
-kpis_final["SortOrder"] = kpis_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+kpis_final["SortOrder"] = week_sort_key(kpis_final, last_8_weeks_order)
 
 # ✅ Ensure correct sorting
 kpis_final = kpis_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
 # ✅ Debug before saving
-print("\n📊 **Final Online KPIs DataFrame (First Rows)**")
-print(kpis_final[["Year Type", "Calendar Year", "ISO Week", "Metric"]].drop_duplicates())
+log_frame(logger, "Final Online KPIs DataFrame (First Rows)", kpis_final[["Year Type", "Calendar Year", "ISO Week", "Metric"]].drop_duplicates(), index=True)
 
 # ✅ Define save path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -177,6 +176,6 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ✅ Save as a single file
 output_path = os.path.join(OUTPUT_DIR, "online_kpis_raw.csv")
-kpis_final.to_csv(output_path, index=False)
+write_table(kpis_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ Successfully saved Online KPIs data to: {output_path}")
\ No newline at end of file
@@ -5,12 +5,16 @@ from datetime import datetime
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def load_spend_data():
     """Load marketing spend data"""
     BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-    spend_file = os.path.join(BASE_DIR, "data", "formatted", "marketing_spend_final.csv")
+    spend_file = os.path.join(BASE_DIR, "data", "formatted", "marketing_spend_formatted.csv")  # ✅ Deduplicated spend store
     
     print(f"📊 **Loading spend data from:** {spend_file}")
     
@@ -181,16 +185,11 @@ online_media_spend_last_year = calculate_online_media_spend_data(last_8_weeks_la
 online_media_spend_final = pd.concat([online_media_spend_last_year, online_media_spend_current_year])
 
 # Sort data correctly
-online_media_spend_final["SortOrder"] = online_media_spend_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+online_media_spend_final["SortOrder"] = week_sort_key(online_media_spend_final, last_8_weeks_order)
 
 online_media_spend_final = online_media_spend_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final Online Media Spend Markets DataFrame (First Rows)**")
-print(online_media_spend_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final Online Media Spend Markets DataFrame (First Rows)", online_media_spend_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -198,7 +197,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "online_media_spend_raw.csv")
-online_media_spend_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(online_media_spend_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **Online Media Spend Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(online_media_spend_final)}")
@@ -7,6 +7,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data, calculate_revenue_metrics
 from calculator.date_utils import get_latest_full_week
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def filter_men_products():
     """
@@ -76,8 +79,7 @@ def filter_men_products():
     print(f"💰 **Total MEN Gross Revenue:** {total_revenue:,.2f}")
     print(f"📦 **Total MEN Sales Qty:** {total_sales_qty:,}")
 
-    print("\n✅ **Filtered MEN Products Data (First 10 Rows):**")
-    print(df_men.head(10))
+    log_frame(logger, "Filtered MEN Products Data (First 10 Rows)", df_men, rows=10, index=True)
 
     # 9️⃣ **Save final dataset**
     output_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/raw"))
@@ -7,6 +7,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data, calculate_revenue_metrics
 from calculator.date_utils import get_latest_full_week
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 def filter_new_customers_products():
     """
@@ -77,8 +80,7 @@ def filter_new_customers_products():
     print(f"💰 **Total New Customer Gross Revenue:** {total_revenue:,.2f}")
     print(f"📦 **Total New Customer Sales Qty:** {total_sales_qty:,}")
 
-    print("\n✅ **Filtered New Customer Products Data (First 10 Rows):**")
-    print(df_new_customers.head(10))
+    log_frame(logger, "Filtered New Customer Products Data (First 10 Rows)", df_new_customers, rows=10, index=True)
 
     # 9️⃣ **Save final dataset**
     output_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/raw"))
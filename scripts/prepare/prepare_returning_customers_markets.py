@@ -6,7 +6,11 @@ from datetime import datetime
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from calculator.metrics_calculator import load_data
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 data = load_data()
 
@@ -160,16 +164,11 @@ returning_customers_last_year = calculate_returning_customers_market_data(last_8
 returning_customers_final = pd.concat([returning_customers_last_year, returning_customers_current_year])
 
 # Sort data correctly
-returning_customers_final["SortOrder"] = returning_customers_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+returning_customers_final["SortOrder"] = week_sort_key(returning_customers_final, last_8_weeks_order)
 
 returning_customers_final = returning_customers_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
-print("\n📊 **Final Returning Customers Markets DataFrame (First Rows)**")
-print(returning_customers_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final Returning Customers Markets DataFrame (First Rows)", returning_customers_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # Save to CSV
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -177,7 +176,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "data", "raw")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 output_path = os.path.join(OUTPUT_DIR, "returning_customers_markets_raw.csv")
-returning_customers_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(returning_customers_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **Returning Customers Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(returning_customers_final)}")
@@ -10,7 +10,11 @@ from calculator.metrics_calculator import (
     load_data,
     calculate_revenue_metrics
 )
-from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year, week_sort_key
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -141,18 +145,13 @@ sessions_last_year = calculate_session_market_data(last_8_weeks_last_year, "Last
 sessions_final = pd.concat([sessions_last_year, sessions_current_year])
 
 # ✅ Assign sorting order based on last 8 weeks order
-sessions_final["SortOrder"] = sessions_final.apply(
-    lambda row: last_8_weeks_order.index((row["Calendar Year"], row["ISO Week"]))
-    if (row["Calendar Year"], row["ISO Week"]) in last_8_weeks_order else float("inf"),
-    axis=1
-)
+sessions_final["SortOrder"] = week_sort_key(sessions_final, last_8_weeks_order)
 
 # ✅ Ensure correct sorting
 sessions_final = sessions_final.sort_values(by="SortOrder").drop(columns=["SortOrder"])
 
 # ✅ Debug before saving
-print("\n📊 **Final Sessions Markets DataFrame (First Rows)**")
-print(sessions_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates())
+log_frame(logger, "Final Sessions Markets DataFrame (First Rows)", sessions_final[["Year Type", "Calendar Year", "ISO Week", "Market"]].drop_duplicates(), index=True)
 
 # ✅ Define save path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -161,7 +160,7 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ✅ Save as a single file
 output_path = os.path.join(OUTPUT_DIR, "sessions_markets_raw.csv")
-sessions_final.to_csv(output_path, index=False, sep=";", decimal=",")
+write_table(sessions_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ **Sessions Markets data saved to:** {output_path}")
 print(f"📊 **Total rows:** {len(sessions_final)}")
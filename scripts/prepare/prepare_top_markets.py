@@ -4,12 +4,13 @@ import pandas as pd
 import logging
 from tabulate import tabulate
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-
 # Add script directory to import path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Setup logging (level from REPORT_LOG_LEVEL / REPORT_QUIET)
+from calculator.report_logging import log_level
+logging.basicConfig(level=log_level(), format="%(asctime)s - %(levelname)s - %(message)s")
+
 # Import necessary functions
 from calculator.metrics_calculator import (
     load_data,
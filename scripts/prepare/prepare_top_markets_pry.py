@@ -3,12 +3,13 @@ import os
 import pandas as pd
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-
 # Add script directory to import path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Setup logging (level from REPORT_LOG_LEVEL / REPORT_QUIET)
+from calculator.report_logging import log_level
+logging.basicConfig(level=log_level(), format="%(asctime)s - %(levelname)s - %(message)s")
+
 # Import functions
 from calculator.metrics_calculator import load_data, load_spend_data, calculate_revenue_metrics, calculate_marketing_spend
 from calculator.date_utils import get_last_8_weeks_last_year
@@ -11,6 +11,10 @@ from calculator.metrics_calculator import (
     calculate_revenue_metrics
 )
 from calculator.date_utils import get_last_8_weeks, get_last_8_weeks_last_year
+from calculator.artifacts import write_table
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # ✅ Load data once to reuse
 data = load_data()
@@ -66,8 +70,7 @@ def calculate_women_category_revenue(weekly_ranges, year_label):
         revenue_by_category["Gross Revenue"] = revenue_by_category["Gross Revenue"].round().astype(int)
 
         # ✅ Log revenue values
-        print("\n📊 **Revenue Breakdown by Category for WOMEN:**")
-        print(revenue_by_category)
+        log_frame(logger, "Revenue Breakdown by Category for WOMEN", revenue_by_category, index=True)
 
         for _, row in revenue_by_category.iterrows():
             weekly_women_category_revenue.append({
@@ -110,10 +113,9 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # ✅ Save as a single file
 output_path = os.path.join(OUTPUT_DIR, "women_category_revenue_raw.csv")
-women_category_revenue_final.to_csv(output_path, index=False)
+write_table(women_category_revenue_final, output_path)  # ✅ Typed table + CSV view
 
 print(f"\n✅ Successfully saved WOMEN Category Revenue data to: {output_path}")
 
 # ✅ Print the entire final dataset
-print("\n📊 **Full WOMEN Category Revenue Dataset:**")
-print(women_category_revenue_final.to_string(index=False))
\ No newline at end of file
+log_frame(logger, "Full WOMEN Category Revenue Dataset", women_category_revenue_final)
\ No newline at end of file
@@ -6,7 +6,10 @@ import pandas as pd
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import necessary functions
-from calculator.metrics_calculator import calculate_growth
+from calculator.growth import growth_pct
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # Define file paths
 RAW_YTD_METRICS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/raw/ytd_metrics_raw.csv"))
@@ -38,16 +41,15 @@ METRIC_NAMES = [
     "Online nCAC (SEK)(4)"
 ]
 
-def calculate_percentage_growth(current, previous):
+def format_percentage_growth(growth):
     """
-    Calculates percentage growth: ((current - previous) / previous) * 100.
-    Returns formatted growth as a percentage string.
+    Formats a growth array as percentage strings: "8.2%", "(11.4%)", and
+    "n/m" where growth is undefined (zero or missing previous value).
     """
-    if previous == 0 or pd.isna(previous):
-        return "n/m"  # Avoid division by zero or missing data
-
-    growth = ((current - previous) / previous) * 100
-    return f"{growth:.1f}%" if growth >= 0 else f"({abs(growth):.1f}%)"
+    growth = pd.Series(growth)
+    text = growth.abs().map("{:.1f}%".format)
+    text = text.where(growth >= 0, "(" + text + ")")
+    return text.where(growth.notna(), "n/m").to_numpy()
 
 def load_and_prepare_ytd_growth():
     """Computes and saves growth metrics for Fiscal YTD."""
@@ -56,34 +58,20 @@ def load_and_prepare_ytd_growth():
     metrics_df = pd.read_csv(RAW_YTD_METRICS_PATH, index_col=0)
 
     # Debugging: Print structure of loaded data
-    print("\n🔍 **Debug: YTD Metrics DataFrame Structure**")
-    print(metrics_df.head())
+    log_frame(logger, "Debug: YTD Metrics DataFrame Structure", metrics_df, rows=5, index=True)
     print("🔍 Columns:", metrics_df.columns.tolist())
     print("🔍 Index:", metrics_df.index.tolist())
 
-    # Initialize dictionary for storing growth calculations
-    growth_data = {metric: {} for metric in METRIC_NAMES}
-
-    for column in ["ytd_last_year", "ytd_two_years"]:
-        for metric in METRIC_NAMES:
-            try:
-                # Get values safely, defaulting to "n/m" if missing
-                current_value = metrics_df.at[metric, "ytd_current_month"] if metric in metrics_df.index else "n/m"
-                previous_value = metrics_df.at[metric, column] if metric in metrics_df.index else "n/m"
-
-                # Convert to float for calculations
-                if current_value != "n/m" and previous_value != "n/m":
-                    current_value = float(str(current_value).replace(",", ""))
-                    previous_value = float(str(previous_value).replace(",", ""))
-                    growth_data[metric][column] = calculate_percentage_growth(current_value, previous_value)
-                else:
-                    growth_data[metric][column] = "n/m"
-            except Exception as e:
-                print(f"⚠️ Error calculating YTD growth for {metric}: {e}")
-                growth_data[metric][column] = "n/m"  # Handle errors gracefully
-
-    # Convert to DataFrame
-    growth_df = pd.DataFrame.from_dict(growth_data, orient="index")
+    # ✅ All metrics × YTD periods as one numeric matrix (missing metrics stay NaN → "n/m")
+    periods = ["ytd_last_year", "ytd_two_years"]
+    values = metrics_df.reindex(index=METRIC_NAMES, columns=["ytd_current_month"] + periods)
+    values = values.apply(lambda column: pd.to_numeric(column.astype(str).str.replace(",", ""), errors="coerce"))
+
+    growth = growth_pct(values[["ytd_current_month"]].to_numpy(), values[periods].to_numpy())
+    growth_df = pd.DataFrame(
+        {period: format_percentage_growth(growth[:, i]) for i, period in enumerate(periods)},
+        index=METRIC_NAMES,
+    )
 
     # Ensure correct column order and rename columns
     growth_df["budget"] = "n/m"
@@ -97,7 +85,7 @@ def load_and_prepare_ytd_growth():
     growth_df.to_csv(YTD_GROWTH_OUTPUT_PATH, index=True)
 
     print(f"\n✅ Fiscal YTD Growth Metrics saved to `{YTD_GROWTH_OUTPUT_PATH}`")
-    print(growth_df)
+    log_frame(logger, "YTD Growth Metrics", growth_df, index=True)
 
 if __name__ == "__main__":
     load_and_prepare_ytd_growth()
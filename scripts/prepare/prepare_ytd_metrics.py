@@ -9,6 +9,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # Import necessary modules
 from calculator.metrics_calculator import load_data, load_spend_data, calculate_revenue_metrics, calculate_marketing_spend
 from calculator.date_utils import get_ytd_time_periods, get_latest_sunday
+from calculator.report_logging import get_logger, log_frame
+
+logger = get_logger(__file__)
 
 # Define output file path
 RAW_YTD_METRICS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/raw/ytd_metrics_raw.csv"))
@@ -69,8 +72,7 @@ def load_and_prepare_ytd_data():
         revenue_data = calculate_revenue_metrics(df, start_date, end_date)
 
         # Debugging: Print revenue data for this period
-        print(f"\n🔍 Debug: Revenue Data for {period_name}")
-        print(revenue_data)
+        log_frame(logger, f"Debug: Revenue Data for {period_name}", revenue_data)
 
         spend, cost_of_sale, ncac = calculate_marketing_spend(
             spend_df, start_date, end_date, revenue_data.get("Gross Revenue", 0), revenue_data.get("New Customers", 0)
@@ -94,8 +96,7 @@ def load_and_prepare_ytd_data():
     metrics_df = metrics_df[COLUMN_ORDER]
 
     # Debugging: Check the final formatted DataFrame
-    print("\n✅ **Final YTD Metrics Before Saving:**")
-    print(metrics_df)
+    log_frame(logger, "Final YTD Metrics Before Saving", metrics_df, index=True)
 
     # Ensure output directory exists before saving
     os.makedirs(os.path.dirname(RAW_YTD_METRICS_PATH), exist_ok=True)
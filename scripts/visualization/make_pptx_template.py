@@ -0,0 +1,92 @@
+"""
+Builds data/powerpoint/weekly_report_template.pptx from a finished deck.
+
+The renderer only writes into shapes named after PPTX_SHAPES. This copies the
+deck and renames the pasted pictures and charts that hold each table or chart
+(PowerPoint names them "Bildobjekt N", "Chart N", "Diagram N") to their
+placeholder names. The rename is done on the slide XML, so python-pptx is not
+needed here.
+
+Charts pasted from Excel keep a link to the workbook they came from (a file
+path on the machine that made the deck). python-pptx cannot replace the data
+of a chart whose workbook is external, so those links are dropped; the
+renderer then embeds a fresh workbook on the first render.
+
+    python scripts/visualization/make_pptx_template.py [source deck]
+"""
+
+import sys
+import os
+import re
+import zipfile
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from visualization.pptx_renderer import DECK_FILE, DECK_SLIDES, PPTX_SHAPES, TEMPLATE_FILE
+
+# ✅ Deck slide → {shape name in the finished deck: placeholder name}
+TEMPLATE_PLACEHOLDERS = {
+    2: {"Bildobjekt 3": "top_table"},
+    3: {"Bildobjekt 6": "top_markets"},
+    6: {"Diagram 6": "gender_men", "Diagram 7": "gender_women"},
+    9: {"Bildobjekt 1": "gender_category"},
+    10: {"Bildobjekt 1": "products_new", "Bildobjekt 2": "products_returning"},
+    11: {"Bildobjekt 1": "products_men", "Bildobjekt 2": "products_women"},
+}
+
+def _rename_shapes(xml, renames, slide):
+    """Renames the `<p:cNvPr name=...>` of each shape in `renames`; every shape must exist once."""
+    for old, new in renames.items():
+        pattern = re.compile(r'(<p:cNvPr id="\d+" name=")' + re.escape(old) + '"')
+        xml, count = pattern.subn(lambda m: f'{m.group(1)}{new}"', xml)
+        if count != 1:
+            raise ValueError(f"❌ Slide {slide}: expected one shape named '{old}', found {count}")
+    return xml
+
+def _external_links(deck):
+    """{chart part: [relationship ids]} of the chart relationships that point outside the package."""
+    links = {}
+    for name in deck.namelist():
+        match = re.fullmatch(r"ppt/charts/_rels/(chart\d+\.xml)\.rels", name)
+        if match:
+            rels = deck.read(name).decode("utf-8")
+            ids = re.findall(r'<Relationship\b[^>]*\bId="(\w+)"[^>]*TargetMode="External"[^>]*/>', rels)
+            if ids:
+                links[f"ppt/charts/{match.group(1)}"] = ids
+    return links
+
+def _drop_external_links(name, text, links):
+    """Removes the external relationships from a chart's .rels, or the <c:externalData> using them from the chart."""
+    if name.endswith(".rels"):
+        return re.sub(r'<Relationship\b[^>]*TargetMode="External"[^>]*/>', "", text)
+    for rel_id in links[name]:
+        text = re.sub(r'<c:externalData r:id="' + rel_id + r'"(?:/>|>.*?</c:externalData>)', "", text, flags=re.S)
+    return text
+
+def make_template(source=DECK_FILE, target=TEMPLATE_FILE):
+    """Copies `source` to `target` with the placeholder shapes renamed."""
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"❌ File not found: {source}")
+
+    with zipfile.ZipFile(source) as deck, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as template:
+        links = _external_links(deck)
+        chart_parts = set(links) | {part.replace("ppt/charts/", "ppt/charts/_rels/") + ".rels" for part in links}
+        for item in deck.infolist():
+            data = deck.read(item.filename)
+            match = re.fullmatch(r"ppt/slides/slide(\d+)\.xml", item.filename)
+            if match and int(match.group(1)) in TEMPLATE_PLACEHOLDERS:
+                slide = int(match.group(1))
+                data = _rename_shapes(data.decode("utf-8"), TEMPLATE_PLACEHOLDERS[slide], slide).encode("utf-8")
+            elif item.filename in chart_parts:
+                data = _drop_external_links(item.filename, data.decode("utf-8"), links).encode("utf-8")
+            template.writestr(item, data)
+
+    placed = {name for renames in TEMPLATE_PLACEHOLDERS.values() for name in renames.values()}
+    print(f"✅ **Template saved to {target}** ({len(placed)} placeholders, {len(links)} external chart links dropped)")
+    unplaced = [name for name, spec in PPTX_SHAPES.items() if name not in placed and spec["slide"] in DECK_SLIDES]
+    if unplaced:
+        print(f"ℹ️ No placeholder in the deck yet (name one in PowerPoint's Selection Pane): {', '.join(unplaced)}")
+
+if __name__ == "__main__":
+    make_template(*sys.argv[1:2])
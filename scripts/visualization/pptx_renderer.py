@@ -0,0 +1,309 @@
+"""
+Native PowerPoint renderer for the weekly report deck.
+
+Writes the data/final frames straight into data/powerpoint/weekly_report.pptx
+with python-pptx, replacing the Excel → VBA → PowerPoint hop of the macro
+scripts. Every table or chart lives in a shape named after its entry in
+PPTX_SHAPES (set in PowerPoint via Selection Pane); the renderer fills tables
+in place and swaps chart data, so the template's styling is kept. A
+placeholder that is a pasted picture, a table of another size, or a chart
+linked to an external workbook is replaced at its own position; a shape with
+no placeholder on its slide is skipped and reported, and a shape that fails
+to render is reported without losing the rest of the deck. Report slide numbers (the pipeline's SLIDES) are mapped to the
+deck's slides through DECK_SLIDES.
+
+The deck is rendered in place once it carries the placeholder names; until
+then the render starts from weekly_report_template.pptx, which
+make_pptx_template.py builds from a finished deck.
+
+pandas and python-pptx are imported where used, so the pipeline can read
+PPTX_SHAPES (to wire the render steps) without loading either.
+
+    python scripts/visualization/pptx_renderer.py          # whole deck
+    python scripts/visualization/pptx_renderer.py 2 3      # slides 2 and 3
+"""
+
+import sys
+import os
+import time
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+FINAL_DIR = os.path.join(BASE_DIR, "data", "final")
+POWERPOINT_DIR = os.path.join(BASE_DIR, "data", "powerpoint")
+DECK_FILE = os.path.join(POWERPOINT_DIR, "weekly_report.pptx")
+TEMPLATE_FILE = os.path.join(POWERPOINT_DIR, "weekly_report_template.pptx")
+
+# ✅ Placeholder shape name → slide, kind and the final CSVs it shows.
+# Multiple sources are placed side by side; with `index_col` set, the label
+# column is kept from the first source only (the tables share their row order).
+# Sources are shown as written, unless a `format` spec (see calculator.formatting)
+# is given: then the typed table is read and its numeric columns formatted here.
+# `rows` keeps only the rows whose first column has that value.
+PPTX_SHAPES = {
+    "top_table": {
+        "slide": 2, "kind": "table", "index_col": 0,
+        "sources": ["metrics_final.csv", "growth_metrics_final.csv", "ytd_metrics_final.csv", "ytd_growth_final.csv"],
+    },
+    "top_markets": {
+        "slide": 3, "kind": "table",
+        "sources": ["top_markets_final.csv", "top_markets_growth_final.csv", "top_markets_share_final.csv"],
+    },
+    "online_kpis": {"slide": 4, "kind": "table", "sources": ["online_kpis_final.csv"]},
+    "contribution": {"slide": 5, "kind": "table", "sources": ["contribution_final.csv"]},
+    "gender_men": {"slide": 6, "kind": "chart", "sources": ["gender_revenue_final.csv"], "rows": "Gross Revenue - MEN"},
+    "gender_women": {"slide": 6, "kind": "chart", "sources": ["gender_revenue_final.csv"], "rows": "Gross Revenue - WOMEN"},
+    "men_category": {"slide": 7, "kind": "table", "sources": ["men_category_revenue_final.csv"]},
+    "women_category": {"slide": 8, "kind": "table", "sources": ["women_category_revenue_final.csv"]},
+    "gender_category": {"slide": 9, "kind": "table", "sources": ["gender_category_final.csv"]},
+    "gender_category_sob": {"slide": 9, "kind": "table", "sources": ["gender_category_sob_final.csv"]},
+    "products_new": {"slide": 10, "kind": "table", "sources": ["products_new_final.csv"]},
+    "products_returning": {"slide": 10, "kind": "table", "sources": ["products_returning_final.csv"]},
+    "products_men": {"slide": 11, "kind": "table", "sources": ["products_men_final.csv"]},
+    "products_women": {"slide": 11, "kind": "table", "sources": ["products_women_final.csv"]},
+    "sessions_markets": {"slide": 12, "kind": "table", "sources": ["sessions_markets_final.csv"]},
+    "conversion_markets": {
+        "slide": 13, "kind": "table", "sources": ["conversion_markets_final.csv"],
+        "format": {"decimals": 1, "suffix": "%", "missing": "-"},
+    },
+    "new_customers_markets": {"slide": 14, "kind": "table", "sources": ["new_customers_markets_final.csv"]},
+    "returning_customers_markets": {"slide": 15, "kind": "table", "sources": ["returning_customers_markets_final.csv"]},
+    "aov_new_markets": {"slide": 16, "kind": "table", "sources": ["aov_new_markets_final.csv"]},
+    "aov_returning_markets": {"slide": 17, "kind": "table", "sources": ["aov_returning_markets_final.csv"]},
+    "online_media_spend": {"slide": 18, "kind": "chart", "sources": ["online_media_spend_final.csv"]},
+}
+
+# ✅ Report slide → slide in the deck (1-based). Slides 12–18 (per-market tables
+# and media spend) have no slide in the current deck; their shapes are skipped.
+DECK_SLIDES = {report_slide: report_slide for report_slide in range(2, 12)}
+
+FONT_SIZE_PT = 9
+
+def shapes_for_slide(slide):
+    return [name for name, spec in PPTX_SHAPES.items() if spec["slide"] == slide]
+
+def load_frame(spec):
+    """Reads the shape's final tables as display text and joins them side by side."""
+    import pandas as pd
+    from calculator.artifacts import read_table
+    from calculator.formatting import format_frame
+
+    frames = []
+    for position, source in enumerate(spec["sources"]):
+        path = os.path.join(FINAL_DIR, source)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"❌ File not found: {path}")
+        if "format" in spec:
+            df = read_table(path)
+            numeric = {c: spec["format"] for c in df.columns if pd.api.types.is_numeric_dtype(df[c])}
+            df = format_frame(df, columns=numeric)
+        else:
+            df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        if position and spec.get("index_col") is not None:
+            df = df.drop(columns=df.columns[spec["index_col"]])
+        frames.append(df)
+
+    frame = pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
+    if "rows" in spec:
+        frame = frame[frame.iloc[:, 0] == spec["rows"]]
+    return frame.rename(columns=lambda c: "" if str(c).startswith("Unnamed") else str(c)).fillna("")
+
+def to_number(text):
+    """Parses report-formatted numbers: '1,170', '(35.7%)', '6.41%', '-' → float or None."""
+    text = str(text).strip().replace(",", "").replace("%", "")
+    if text in ("", "-", "n/m", "nan"):
+        return None
+    negative = text.startswith("(") and text.endswith(")")
+    try:
+        value = float(text.strip("()"))
+    except ValueError:
+        return None
+    return -value if negative else value
+
+def _shape_by_name(slide, name):
+    return next((shape for shape in slide.shapes if shape.name == name), None)
+
+def _geometry(shape):
+    return shape.left, shape.top, shape.width, shape.height
+
+def _remove(shape):
+    element = shape._element
+    element.getparent().remove(element)
+
+def fill_table(slide, name, frame):
+    """
+    Writes `frame` (header + rows) into the named table, replacing it at the
+    same position if it is not a table of that size. Returns "filled",
+    "replaced" or "missing" (no shape of that name on the slide).
+    """
+    from pptx.util import Pt
+
+    rows, cols = len(frame) + 1, len(frame.columns)
+    shape = _shape_by_name(slide, name)
+    if shape is None:
+        return "missing"
+    fits = shape.has_table and len(shape.table.rows) == rows and len(shape.table.columns) == cols
+    if not fits:
+        left, top, width, height = _geometry(shape)
+        _remove(shape)
+        shape = slide.shapes.add_table(rows, cols, left, top, width, height)
+        shape.name = name
+
+    table = shape.table
+    values = [list(frame.columns)] + frame.astype(str).values.tolist()
+    for r, row_values in enumerate(values):
+        for c, value in enumerate(row_values):
+            text_frame = table.cell(r, c).text_frame
+            paragraph = text_frame.paragraphs[0]
+            if paragraph.runs:
+                # ✅ Keep the template's run formatting; only the text changes
+                paragraph.runs[0].text = value
+                for extra in paragraph.runs[1:]:
+                    extra.text = ""
+            else:
+                paragraph.text = value
+                if not fits:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(FONT_SIZE_PT)
+    return "filled" if fits else "replaced"
+
+def chart_data(frame):
+    """Categories are the week columns; each remaining row becomes a series labelled by its text columns."""
+    from pptx.chart.data import CategoryChartData
+
+    week_columns = [c for c in frame.columns if c.isdigit()]
+    label_columns = [c for c in frame.columns if c not in week_columns and "avg" not in c.lower()]
+    data = CategoryChartData()
+    data.categories = week_columns
+    for _, row in frame.iterrows():
+        label = " – ".join(str(row[c]) for c in label_columns if str(row[c]))
+        data.add_series(label, [to_number(row[c]) for c in week_columns])
+    return data
+
+def _links_external_workbook(chart):
+    """True for a chart pasted with a link to its Excel file: python-pptx cannot replace its data."""
+    return any(rel.is_external for rel in chart.part.rels.values())
+
+def fill_chart(slide, name, frame):
+    """
+    Replaces the named chart's data, or puts a chart in place of a placeholder
+    that is not a chart (a line chart) or whose workbook is an external file
+    (a chart of the same type).
+    """
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+
+    data = chart_data(frame)
+    shape = _shape_by_name(slide, name)
+    if shape is None:
+        return "missing"
+    chart_type = XL_CHART_TYPE.LINE_MARKERS
+    if shape.has_chart:
+        if not _links_external_workbook(shape.chart):
+            shape.chart.replace_data(data)
+            return "filled"
+        try:
+            chart_type = shape.chart.chart_type
+        except NotImplementedError:
+            pass  # ✅ A plot type python-pptx does not know: fall back to a line chart
+
+    left, top, width, height = _geometry(shape)
+    _remove(shape)
+    graphic_frame = slide.shapes.add_chart(chart_type, left, top, width, height, data)
+    graphic_frame.name = name
+    graphic_frame.chart.has_legend = True
+    graphic_frame.chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+    graphic_frame.chart.legend.include_in_layout = False
+    return "replaced"
+
+def _has_placeholders(presentation):
+    return any(shape.name in PPTX_SHAPES for slide in presentation.slides for shape in slide.shapes)
+
+def open_deck():
+    """The current deck once it carries the placeholder names, else the template."""
+    from pptx import Presentation
+
+    if os.path.exists(DECK_FILE):
+        presentation = Presentation(DECK_FILE)
+        if _has_placeholders(presentation):
+            return presentation
+        print(f"ℹ️ {os.path.relpath(DECK_FILE, BASE_DIR)} has no placeholder shapes; starting from the template.")
+    if not os.path.exists(TEMPLATE_FILE):
+        raise FileNotFoundError(f"❌ File not found: {TEMPLATE_FILE} (build it with scripts/visualization/make_pptx_template.py)")
+    return Presentation(TEMPLATE_FILE)
+
+def _slide(presentation, number):
+    """The deck slide for report slide `number`, or None if the deck has no such slide."""
+    index = DECK_SLIDES.get(number)
+    if index is None or index > len(presentation.slides):
+        return None
+    return presentation.slides[index - 1]
+
+def save_deck(presentation, path=DECK_FILE):
+    """Saves next to `path` and renames over it, so PowerPoint never sees a half-written deck."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_file = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp.pptx")
+    try:
+        presentation.save(temp_file)
+        os.replace(temp_file, path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+def render_slides(slides):
+    """Renders every shape of the given slides in one open/save of the deck."""
+    started = time.perf_counter()
+    presentation = open_deck()
+    replaced, no_placeholder, missing, failed = [], [], [], []
+
+    for number in slides:
+        slide = _slide(presentation, number)
+        if slide is None:
+            print(f"⚠️ Skipping slide {number}: no matching slide in the deck (see DECK_SLIDES).")
+            no_placeholder.extend(shapes_for_slide(number))
+            continue
+        for name in shapes_for_slide(number):
+            spec = PPTX_SHAPES[name]
+            try:
+                frame = load_frame(spec)
+            except FileNotFoundError as e:
+                print(f"⚠️ Skipping {name}: {e}")
+                missing.append(name)
+                continue
+            try:
+                status = fill_table(slide, name, frame) if spec["kind"] == "table" else fill_chart(slide, name, frame)
+            except Exception as e:
+                # ✅ One broken shape must not cost the rest of the deck
+                print(f"⚠️ Skipping {name}: {type(e).__name__}: {e}")
+                failed.append(name)
+                continue
+            if status == "missing":
+                print(f"⚠️ Skipping {name}: no shape named '{name}' on slide {number}.")
+                no_placeholder.append(name)
+            elif status == "replaced":
+                replaced.append(name)
+
+    save_deck(presentation, DECK_FILE)
+    print(f"✅ **Rendered slides {', '.join(map(str, slides))} into {os.path.relpath(DECK_FILE, BASE_DIR)} in {time.perf_counter() - started:.2f}s**")
+    if replaced:
+        print(f"ℹ️ Replaced placeholders with a new table or chart: {', '.join(replaced)}")
+    if no_placeholder:
+        print(f"⚠️ Not rendered (no placeholder in the deck): {', '.join(no_placeholder)}")
+    if missing:
+        print(f"⚠️ Missing data for: {', '.join(missing)}")
+    if failed:
+        print(f"❌ Failed to render: {', '.join(failed)}")
+
+def render_slide(slide):
+    """Pipeline entry point: renders one slide."""
+    render_slides([int(slide)])
+
+def render_deck():
+    render_slides(sorted({spec["slide"] for spec in PPTX_SHAPES.values()}))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        render_slides([int(arg) for arg in sys.argv[1:]])
+    else:
+        render_deck()
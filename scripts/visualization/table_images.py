@@ -0,0 +1,236 @@
+"""
+Table images for the slides, rendered from the data/final CSVs.
+
+Every entry in TABLE_IMAGES names a final CSV and how to format it. An image
+is only re-rendered when its content hash changes: the hash covers the CSV
+bytes, the entry's spec and the style settings, and is kept in
+data/images/manifest.json next to the PNGs. Stale tables are rendered in
+parallel on a process pool; each worker sets up matplotlib (backend, fonts,
+style) once and reuses one figure for all tables it draws.
+
+    python scripts/visualization/table_images.py                 # all tables
+    python scripts/visualization/table_images.py top_table --force
+"""
+
+import sys
+import os
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ensure correct import paths
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+FINAL_DIR = os.path.join(BASE_DIR, "data", "final")
+IMAGES_DIR = os.path.join(BASE_DIR, "data", "images")
+MANIFEST_FILE = os.path.join(IMAGES_DIR, "manifest.json")
+
+# ✅ Image name → final CSV, label column and number formatting
+# ("thousands": whole numbers with separators and negatives in parentheses; "text": as written in the CSV)
+TABLE_IMAGES = {
+    "top_table": {"source": "metrics_final.csv", "index_col": 0, "format": "thousands"},
+    "top_table_growth": {"source": "growth_metrics_final.csv", "index_col": 0, "format": "text"},
+    "top_table_ytd": {"source": "ytd_metrics_final.csv", "index_col": 0, "format": "text"},
+    "top_markets": {"source": "top_markets_final.csv", "index_col": 0, "format": "text"},
+    "online_kpis": {"source": "online_kpis_final.csv", "index_col": None, "format": "text"},
+    "gender_category": {"source": "gender_category_final.csv", "index_col": None, "format": "thousands"},
+    "products_new": {"source": "products_new_final.csv", "index_col": None, "format": "text"},
+    "products_returning": {"source": "products_returning_final.csv", "index_col": None, "format": "text"},
+    "products_men": {"source": "products_men_final.csv", "index_col": None, "format": "text"},
+    "products_women": {"source": "products_women_final.csv", "index_col": None, "format": "text"},
+}
+
+# ✅ Shared look of every table (part of the cache key)
+STYLE = {
+    "dpi": 300,
+    "font_size": 12,
+    "font_family": "DejaVu Sans",
+    "header_color": "#2E3B55",
+    "header_text_color": "#ffffff",
+    "row_colors": ["#f1f1f1", "#ffffff"],
+    "width_in": 16,
+    "row_height_in": 0.6,
+    "scale": (1.5, 1.5),
+}
+
+_figure = None  # ✅ One figure per worker, cleared between tables
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def image_path(name):
+    return os.path.join(IMAGES_DIR, f"{name}.png")
+
+def content_hash(name):
+    """Hash of everything the image depends on: CSV bytes, spec, style and this renderer's code."""
+    spec = TABLE_IMAGES[name]
+    parts = {
+        "csv": _file_digest(os.path.join(FINAL_DIR, spec["source"])),
+        "spec": spec,
+        "style": STYLE,
+        "code": _file_digest(__file__),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+def load_manifest():
+    if os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as file:
+            return json.load(file)
+    return {}
+
+def save_manifest(manifest):
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+    temp_file = f"{MANIFEST_FILE}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(temp_file, MANIFEST_FILE)
+
+def format_table(df, number_format):
+    """Column-wise (vectorised) formatting of the cell texts."""
+    import numpy as np
+    import pandas as pd
+
+    if number_format == "text":
+        return df.fillna("").astype(str)
+
+    formatted = {}
+    for column in df.columns:
+        values = pd.to_numeric(df[column].astype(str).str.replace(",", ""), errors="coerce").round()
+        if values.isna().all():
+            formatted[column] = df[column].astype(str)  # ✅ Label columns stay as they are
+            continue
+        digits = values.abs().map("{:,.0f}".format)
+        text = np.where(values < 0, "(" + digits + ")", digits)
+        formatted[column] = np.where(values.isna(), "n/m", text)
+    return pd.DataFrame(formatted, index=df.index)
+
+def _setup_worker():
+    """Pool initializer: headless backend, fonts and style are configured once per process."""
+    global _figure
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update({"font.family": STYLE["font_family"], "font.size": STYLE["font_size"]})
+    _figure = plt.figure()
+
+def render_table(name, path=None):
+    """Draws one table into `path` (defaults to data/images/<name>.png). Runs in a pool worker."""
+    import pandas as pd
+
+    if _figure is None:
+        _setup_worker()
+    spec = TABLE_IMAGES[name]
+    df = pd.read_csv(os.path.join(FINAL_DIR, spec["source"]), index_col=spec["index_col"], dtype=str, keep_default_na=False)
+    if df.empty:
+        raise ValueError(f"❌ {spec['source']} is empty!")
+    df = format_table(df, spec["format"])
+
+    _figure.clf()
+    _figure.set_size_inches(STYLE["width_in"], max(1, len(df)) * STYLE["row_height_in"])
+    ax = _figure.add_subplot(111)
+    ax.axis("off")
+
+    table = ax.table(
+        cellText=df.values,
+        colLabels=list(df.columns),
+        rowLabels=list(df.index) if spec["index_col"] is not None else None,
+        cellLoc="center",
+        loc="center",
+        colColours=[STYLE["header_color"]] * len(df.columns),
+    )
+    for j in range(len(df.columns)):
+        table[(0, j)].get_text().set_color(STYLE["header_text_color"])
+    for i in range(len(df)):
+        color = STYLE["row_colors"][i % len(STYLE["row_colors"])]
+        for j in range(len(df.columns)):
+            table[(i + 1, j)].set_facecolor(color)
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(STYLE["font_size"])
+    table.scale(*STYLE["scale"])
+
+    path = path or image_path(name)
+    temp_file = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp.png")
+    _figure.savefig(temp_file, bbox_inches="tight", dpi=STYLE["dpi"])
+    os.replace(temp_file, path)
+    return path
+
+def render_tables(names=None, max_workers=None, force=False):
+    """
+    Renders the given tables (all by default), skipping those whose content
+    hash matches the manifest. Returns {name: "rendered" | "cached" | "missing" | "failed"}.
+    """
+    names = list(TABLE_IMAGES) if names is None else list(names)
+    unknown = [n for n in names if n not in TABLE_IMAGES]
+    if unknown:
+        raise ValueError(f"❌ Unknown tables: {unknown}. Available: {sorted(TABLE_IMAGES)}")
+
+    started = time.perf_counter()
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+    manifest = load_manifest()
+    results, stale = {}, {}
+
+    # 1️⃣ **Hash the inputs; only changed tables are rendered**
+    for name in names:
+        if not os.path.exists(os.path.join(FINAL_DIR, TABLE_IMAGES[name]["source"])):
+            print(f"⚠️ Skipping {name}: {TABLE_IMAGES[name]['source']} not found")
+            results[name] = "missing"
+            continue
+        digest = content_hash(name)
+        if not force and manifest.get(name) == digest and os.path.exists(image_path(name)):
+            results[name] = "cached"
+        else:
+            stale[name] = digest
+
+    # 2️⃣ **Render stale tables (in-process for one, on a pool for several)**
+    def finished(name, error=None):
+        if error is None:
+            manifest[name] = stale[name]
+            results[name] = "rendered"
+        else:
+            print(f"❌ **Error rendering {name}: {error}**")
+            manifest.pop(name, None)
+            results[name] = "failed"
+
+    if len(stale) == 1:
+        name = next(iter(stale))
+        try:
+            render_table(name)
+            finished(name)
+        except Exception as e:
+            finished(name, e)
+    elif stale:
+        workers = min(max_workers or os.cpu_count() or 2, len(stale))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_setup_worker) as pool:
+            futures = {pool.submit(render_table, name): name for name in stale}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    finished(futures[future])
+                except Exception as e:
+                    finished(futures[future], e)
+
+    save_manifest(manifest)
+    rendered = sum(1 for status in results.values() if status == "rendered")
+    cached = sum(1 for status in results.values() if status == "cached")
+    print(f"🖼️ **{rendered} table images rendered, {cached} up to date ({time.perf_counter() - started:.1f}s) → {os.path.relpath(IMAGES_DIR, BASE_DIR)}**")
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render the slide tables in data/final to PNG images.")
+    parser.add_argument("names", nargs="*", help=f"Tables to render (default: all of {', '.join(TABLE_IMAGES)})")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes")
+    parser.add_argument("--force", action="store_true", help="Re-render even if the content hash is unchanged")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    render_tables(args.names or None, args.workers, args.force)
@@ -0,0 +1,5 @@
+import sys
+import os
+
+# ✅ Tests import the pipeline modules the way the scripts do (relative to scripts/)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts")))
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from format import format_spend_data
+
+HEADER = "Market,Date,Total Spend,Ad Spend,FB Spend\n"
+
+@pytest.fixture
+def spend_dirs(tmp_path, monkeypatch):
+    unformatted = tmp_path / "unformatted"
+    unformatted.mkdir()
+    monkeypatch.setattr(format_spend_data, "UNFORMATTED_DIR", str(unformatted))
+    monkeypatch.setattr(format_spend_data, "FORMATTED_CSV_FILE", str(tmp_path / "marketing_spend_formatted.csv"))
+    monkeypatch.setattr(format_spend_data, "MANIFEST_FILE", str(tmp_path / "marketing_spend_manifest.json"))
+    monkeypatch.setattr(format_spend_data, "record_control_totals", lambda df, kind: None)
+    return unformatted
+
+def _export(directory, name, rows, mtime=None):
+    path = directory / name
+    path.write_text(HEADER + "".join(f"{market},{day},{spend},0,0\n" for market, day, spend in rows), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def _store():
+    store = format_spend_data.load_spend_store()
+    return {
+        (market, day.isoformat()): (spend, source)
+        for market, day, spend, source in zip(store["Market"], store["Date"], store["Total Spend"], store["Source"])
+    }
+
+def test_latest_export_wins_regardless_of_file_name(spend_dirs):
+    # ✅ By name W10 > 250316 and Dec-21 > 211215, but the latter exports are the more recent ones
+    _export(spend_dirs, "W10.csv", [("SE", "2025-03-03", 100), ("SE", "2025-03-09", 100)])
+    _export(spend_dirs, "250316.csv", [("SE", "2025-03-09", 150), ("SE", "2025-03-16", 150)])
+    _export(spend_dirs, "Dec-21.csv", [("US", '"Dec 11, 2021"', 50)])
+    _export(spend_dirs, "211215.csv", [("US", "2021-12-11", 60), ("US", "2021-12-15", 60)])
+    # ✅ Same last day: the file written last wins
+    _export(spend_dirs, "250309_rerun.csv", [("NO", "2025-03-09", 10)], mtime=1_700_000_000)
+    _export(spend_dirs, "250309.csv", [("NO", "2025-03-09", 20)], mtime=1_700_000_100)
+
+    format_spend_data.load_and_clean_spend_data()
+
+    store = _store()
+    assert store[("SE", "2025-03-03")] == (100, "W10.csv")
+    assert store[("SE", "2025-03-09")] == (150, "250316.csv")
+    assert store[("US", "2021-12-11")] == (60, "211215.csv")
+    assert store[("NO", "2025-03-09")] == (20, "250309.csv")
+    assert len(store) == 6
+
+def test_failed_and_empty_exports_are_skipped_until_changed(spend_dirs, monkeypatch, capsys):
+    _export(spend_dirs, "250309.csv", [("SE", "2025-03-09", 20)])
+    _export(spend_dirs, "250316.csv", [])  # ✅ Header only: no rows
+    (spend_dirs / "250323.csv").write_bytes(HEADER.encode() + b"SE,\xff\xfe,1,0,0\n")  # ✅ Not UTF-8: fails to parse
+
+    format_spend_data.load_and_clean_spend_data()
+    sources = format_spend_data.load_spend_manifest()["sources"]
+    assert sources["250316.csv"]["rows"] == 0 and sources["250316.csv"]["error"] is None
+    assert sources["250323.csv"]["rows"] == 0 and sources["250323.csv"]["error"]
+
+    # ✅ Nothing changed: the up-to-date path is taken without parsing anything
+    parse_spend_files = format_spend_data.parse_spend_files
+    def no_parsing(filenames, max_workers=None):
+        raise AssertionError(f"parsed {filenames}")
+    monkeypatch.setattr(format_spend_data, "parse_spend_files", no_parsing)
+    capsys.readouterr()
+    format_spend_data.load_and_clean_spend_data()
+    assert "up to date" in capsys.readouterr().out
+
+    # ✅ Once the empty export gets rows, it is merged like a new one
+    monkeypatch.setattr(format_spend_data, "parse_spend_files", parse_spend_files)
+    _export(spend_dirs, "250316.csv", [("SE", "2025-03-16", 30)])
+    format_spend_data.load_and_clean_spend_data()
+    assert _store()[("SE", "2025-03-16")] == (30, "250316.csv")
+
+def test_export_in_another_layout_has_no_rows(spend_dirs):
+    dema = spend_dirs / "210101-250930_dema_data.csv"
+    dema.write_text('"Days";"Channel";"Marketing spend"\n"2022-01-01";"Google";"5143.61"\n', encoding="utf-8")
+
+    df = format_spend_data.parse_spend_file(str(dema))
+
+    assert df.empty and list(df.columns) == format_spend_data.KEEP_COLUMNS
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+
+from visualization import pptx_renderer
+
+GENDER_REVENUE = """Metric,Year Type,38,39
+Gross Revenue - MEN,Current Year,"749,982","1,099,804"
+Gross Revenue - MEN,Last Year,"795,630","835,351"
+Gross Revenue - WOMEN,Current Year,"48,191","70,328"
+Gross Revenue - WOMEN,Last Year,"39,267","53,632"
+"""
+PRODUCTS = """Rank,Gender,Category,Product,Color,Gross Revenue,Sales Qty,SOB%
+1,MEN,UNDERWEAR,3 X BOXER BRIEFS,BLACK,"19,353",21,6.41%
+2,MEN,TOPS,MIDWEIGHT T-SHIRT,BLACK,"12,296",16,4.07%
+"""
+
+@pytest.fixture
+def deck(tmp_path, monkeypatch):
+    final = tmp_path / "final"
+    final.mkdir()
+    (final / "gender_revenue_final.csv").write_text(GENDER_REVENUE, encoding="utf-8")
+    (final / "products_new_final.csv").write_text(PRODUCTS, encoding="utf-8")
+    monkeypatch.setattr(pptx_renderer, "FINAL_DIR", str(final))
+    monkeypatch.setattr(pptx_renderer, "DECK_FILE", str(tmp_path / "weekly_report.pptx"))
+    return tmp_path / "weekly_report.pptx"
+
+def test_render_shipped_template(deck, capsys):
+    # ✅ No deck yet: the render starts from the shipped template
+    pptx_renderer.render_slides([6, 10, 12])
+
+    out = capsys.readouterr().out
+    assert "Failed to render" not in out
+    assert "Missing data for: products_returning" in out
+    slides = Presentation(str(deck)).slides
+    charts = {shape.name: shape.chart for shape in slides[5].shapes if shape.has_chart}
+    men = charts["gender_men"]
+    assert list(men.plots[0].categories) == ["38", "39"]
+    assert [series.values for series in men.plots[0].series] == [(749982.0, 1099804.0), (795630.0, 835351.0)]
+    assert not pptx_renderer._links_external_workbook(men)
+    table = next(shape.table for shape in slides[9].shapes if shape.name == "products_new")
+    assert table.cell(1, 3).text == "3 X BOXER BRIEFS"
+
+def test_failing_shape_does_not_lose_the_deck(deck, monkeypatch, capsys):
+    def broken(slide, name, frame):
+        raise ValueError("broken chart")
+    monkeypatch.setattr(pptx_renderer, "fill_chart", broken)
+
+    pptx_renderer.render_slides([6, 10])
+
+    assert "Failed to render: gender_men, gender_women" in capsys.readouterr().out
+    table = next(shape.table for shape in Presentation(str(deck)).slides[9].shapes if shape.name == "products_new")
+    assert table.cell(2, 3).text == "MIDWEIGHT T-SHIRT"
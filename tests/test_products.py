@@ -0,0 +1,38 @@
+from datetime import date
+
+import pandas as pd
+
+from calculator.products import FINAL_COLUMNS, PRODUCT_SEGMENTS, rank_top_products
+
+WEEK = (date(2025, 3, 3), date(2025, 3, 9))
+
+def _order_lines():
+    rows = [
+        # Sales Channel, Channel Group, New/Returning, Gender, Category, Product, Color, Revenue, Qty
+        ("Online", "Online", "New", "MEN", "UNDERWEAR", "Boxer Brief", "BLACK", 300.0, 3),
+        ("Online", "Online", "New", "WOMEN", "SWIMWEAR", "Bikini", "NAVY", 200.0, 2),
+        ("Online", "Online", "Returning", "MEN", "UNDERWEAR", "Boxer Brief", "BLACK", 100.0, 1),
+        ("Online", "Online", "Returning", "WOMEN", "TOPS", "Tee", "WHITE", 50.0, 1),
+        ("Retail", "Retail", "New", "MEN", "TOPS", "Tee", "WHITE", 999.0, 9),
+        ("Online", "Online", "New", "MEN", "-", "Gift Card", "-", 500.0, 1),
+    ]
+    columns = ["Sales Channel", "Channel Group", "New/Returning Customer", "Gender",
+               "Category", "Product", "Color", "Gross Revenue", "Sales Qty"]
+    df = pd.DataFrame(rows, columns=columns)
+    df["Date"] = date(2025, 3, 5)
+    return df
+
+def test_rank_top_products_covers_all_segments():
+    results = rank_top_products(_order_lines(), *WEEK)
+
+    assert set(results) == set(PRODUCT_SEGMENTS)
+    for table in results.values():
+        assert list(table.columns) == FINAL_COLUMNS
+        assert list(table["Rank"].iloc[-2:]) == ["Top 20 Total", "Grand Total"]
+
+    assert results["new"]["Gross Revenue"].iloc[-1] == 500.0  # Retail and "-" rows excluded
+    assert results["returning"]["Gross Revenue"].iloc[-1] == 150.0
+    assert results["men"]["Gross Revenue"].iloc[-1] == 400.0
+    assert results["women"]["Gross Revenue"].iloc[-1] == 250.0
+    assert results["men"]["Product"].iloc[0] == "Boxer Brief"
+    assert results["men"]["Sales Qty"].iloc[0] == 4
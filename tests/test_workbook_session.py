@@ -0,0 +1,54 @@
+import os
+import time
+
+import pytest
+
+from excel import workbook_session
+from excel.workbook_session import promote_staged, save_target, staged_path
+
+def _stage(path, owner):
+    """Stages a save of `path` while `owner` marks it open, then closes it."""
+    with open(owner, "w"):
+        pass
+    target = save_target(path)
+    assert target == staged_path(path)
+    with open(target, "wb") as f:
+        f.write(b"staged")
+    os.remove(owner)
+
+def test_promote_staged_swaps_in_when_original_unchanged(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsm")
+    with open(path, "wb") as f:
+        f.write(b"original")
+    _stage(path, str(tmp_path / "~$weekly_report.xlsm"))
+
+    assert promote_staged(path)
+    assert open(path, "rb").read() == b"staged"
+    assert os.listdir(tmp_path) == ["weekly_report.xlsm"]
+
+def test_promote_staged_keeps_both_when_original_edited(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsm")
+    with open(path, "wb") as f:
+        f.write(b"original")
+    _stage(path, str(tmp_path / "~$weekly_report.xlsm"))
+    with open(path, "wb") as f:
+        f.write(b"edited in Excel")
+
+    assert not promote_staged(path)
+    assert open(path, "rb").read() == b"edited in Excel"
+    kept = [name for name in os.listdir(tmp_path) if "(staged " in name]
+    assert len(kept) == 1 and open(tmp_path / kept[0], "rb").read() == b"staged"
+    assert not os.path.exists(staged_path(path))
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows checks the enforced lock instead of the owner file's age")
+def test_old_owner_file_is_stale(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsm")
+    owner = str(tmp_path / "~$weekly_report.xlsm")
+    for name in (path, owner):
+        with open(name, "wb"):
+            pass
+    assert workbook_session.is_locked(path)
+
+    old = time.time() - (workbook_session.STALE_LOCK_HOURS + 1) * 3600
+    os.utime(owner, (old, old))
+    assert not workbook_session.is_locked(path)
@@ -0,0 +1,69 @@
+import os
+
+import openpyxl
+from openpyxl.styles import Font
+import pandas as pd
+
+from excel.sheet_writer import write_sheet_block
+from excel.xlsm_patcher import dump_styles, load_styles, patch_workbook, style_with_format
+
+def _workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "products_new"
+    sheet["A1"] = "keep"
+    sheet["E6"] = 1.0
+    sheet["E6"].font = Font(bold=True)
+    workbook.create_sheet("other")["B2"] = "untouched"
+    workbook.save(path)
+
+def test_patch_workbook_round_trip(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsx")
+    _workbook(path)
+
+    counts = patch_workbook(path, {"products_new": {"E5": "Rank", "E6": 1234.5, "F7": None}}, {"products_new": {"E6": "#,##0"}})
+
+    assert counts == (2, 1)  # ✅ F7 is empty already
+    workbook = openpyxl.load_workbook(path)
+    sheet = workbook["products_new"]
+    assert sheet["A1"].value == "keep"
+    assert sheet["E5"].value == "Rank"
+    assert sheet["E6"].value == 1234.5
+    assert sheet["E6"].number_format == "#,##0"
+    assert sheet["E6"].font.bold  # ✅ The cell keeps the rest of its style
+    assert sheet["F7"].value is None
+    assert workbook["other"]["B2"].value == "untouched"
+
+def test_write_sheet_block_applies_formats_when_patching(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsx")
+    _workbook(path)
+    df = pd.DataFrame({"Product": ["Boxer Brief", "Tee"], "Sales Qty": [1200, 35], "Share": [0.5, 0.25]})
+
+    write_sheet_block(path, "products_new", df, top=5, left=5, formats={"Sales Qty": "#,##0", "Share": "0.0%"})
+
+    sheet = openpyxl.load_workbook(path)["products_new"]
+    assert [sheet.cell(row=5, column=c).value for c in (5, 6, 7)] == ["Product", "Sales Qty", "Share"]
+    assert sheet["F6"].value == 1200 and sheet["F6"].number_format == "#,##0"
+    assert sheet["G7"].value == 0.25 and sheet["G7"].number_format == "0.0%"
+    assert sheet["F5"].number_format == "General"  # ✅ Header cells are not formatted
+
+def test_patch_workbook_skips_cells_that_hold_the_value(tmp_path):
+    path = str(tmp_path / "weekly_report.xlsx")
+    _workbook(path)  # ✅ openpyxl stores "keep" as a shared string
+    updates = {"products_new": {"A1": "keep", "E6": 1, "E7": "Tee"}}
+
+    assert patch_workbook(path, updates, {"products_new": {"E6": "#,##0"}}) == (2, 1)
+    modified = os.path.getmtime(path)
+    assert patch_workbook(path, updates, {"products_new": {"E6": "#,##0"}}) == (0, 3)
+    assert os.path.getmtime(path) == modified  # ✅ Nothing changed: the workbook is not rewritten
+
+    assert patch_workbook(path, {"products_new": {"E6": "1", "E7": True}}) == (2, 0)  # ✅ Same text, other type
+
+def test_new_number_format_lands_in_an_empty_numfmts_element():
+    styles = load_styles('<styleSheet><numFmts count="0"/><cellXfs count="1"><xf numFmtId="0" fontId="0"/></cellXfs></styleSheet>')
+
+    assert style_with_format(styles, "0", "0.0%") == "1"
+
+    xml = dump_styles(styles)
+    assert '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.0%"/></numFmts>' in xml
+    assert '<xf numFmtId="164" fontId="0" applyNumberFormat="1"/>' in xml